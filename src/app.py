@@ -1,20 +1,131 @@
-from flask import Flask
+import math
+from collections.abc import Callable, Coroutine
+from functools import wraps
+from typing import Any
 
+from flask import Flask, g, request
+from werkzeug.middleware.proxy_fix import ProxyFix
+from werkzeug.wrappers import Response
+
+from src.config import settings
+from src.database.async_connection import open_async_pool, run_coroutine
+from src.database.cli import db_cli
+from src.database.db_connection import WRITE_MARKER_COOKIE, note_write, open_pool
 from src.exceptions import register_error_handlers
+from src.routes.async_auth_routes import async_auth_bp
+from src.routes.async_transactions_routes import async_tx_bp
+from src.routes.async_users_routes import async_user_bp
 from src.routes.auth_routes import auth_bp
+from src.routes.internal_routes import internal_bp
 from src.routes.transactions_routes import tx_bp
 from src.routes.users_routes import user_bp
+from src.schemas.base import build_schemas
+from src.utils.json_provider import JSON_PROVIDERS
+from src.utils.rate_limit import register_rate_limits
+
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+def warm_up(async_views: bool = False) -> None:
+    """
+    Prepare the current process to serve requests without first-request delays.
+
+    Opens the connection pool and waits for its minimum connections, then
+    builds all schema validators. With a pre-forking server that loads the
+    app before forking (gunicorn --preload), the validators are shared by
+    the workers, but each worker gets its own pool: call `open_pool()` from
+    the server's post-fork hook to warm it as well.
+
+    Args:
+        async_views (bool): Also open the async pool used by the async views.
+
+    Raises:
+        psycopg_pool.PoolTimeout: If the pool cannot connect in time.
+    """
+    open_pool()
+    if async_views:
+        open_async_pool()
+    build_schemas()
+
 
+def _run_on_event_loop(func: Callable[..., Coroutine]) -> Callable:
+    # Replaces Flask's default async_to_sync, which needs asgiref and runs
+    # every call on a new event loop.
+    @wraps(func)
+    def run(*args: Any, **kwargs: Any) -> Any:
+        return run_coroutine(func(*args, **kwargs))
 
-def create_app():
+    return run
+
+
+def create_app(async_views: bool | None = None) -> Flask:
+    """
+    Create the Flask application.
+
+    With async views, the auth, user and transaction endpoints are served by
+    coroutines that query the database through an AsyncConnectionPool. The
+    coroutines run on one shared event loop (see `run_coroutine`) rather
+    than a new loop per request, so the async pool and its connections are
+    reused across requests and threads.
+
+    Args:
+        async_views (bool | None): Serve the async views. Defaults to
+            settings.ASYNC_VIEWS.
+
+    Returns:
+        Flask: The application.
+    """
+    if async_views is None:
+        async_views = settings.ASYNC_VIEWS
     app = Flask(__name__)
+    app.json = JSON_PROVIDERS[settings.JSON_PROVIDER](app)
+    if settings.TRUSTED_PROXY_HOPS:
+        app.wsgi_app = ProxyFix(  # type: ignore[method-assign]
+            app.wsgi_app,
+            x_for=settings.TRUSTED_PROXY_HOPS,
+            x_proto=settings.TRUSTED_PROXY_HOPS,
+        )
+    app.config["ASYNC_VIEWS"] = async_views
 
-    app.register_blueprint(auth_bp)
-    app.register_blueprint(user_bp)
-    app.register_blueprint(tx_bp)
+    if async_views:
+        app.async_to_sync = _run_on_event_loop  # type: ignore[method-assign]
+        app.register_blueprint(async_auth_bp)
+        app.register_blueprint(async_user_bp)
+        app.register_blueprint(async_tx_bp)
+    else:
+        app.register_blueprint(auth_bp)
+        app.register_blueprint(user_bp)
+        app.register_blueprint(tx_bp)
+    app.register_blueprint(internal_bp)
 
+    register_rate_limits(app)
     register_error_handlers(app)
 
+    # Read-your-writes: after an authenticated write, serve that user's
+    # reads from the primary until the replicas have caught up. The cookie
+    # lets the other workers know; clients that drop cookies only get it
+    # from the worker that served the write.
+    @app.after_request
+    def pin_writer_to_primary(response: Response) -> Response:
+        user_id = g.get("user_id")
+        if user_id is not None and request.method not in SAFE_METHODS:
+            marker = note_write(user_id)
+            if settings.DB_REPLICA_URLS:
+                response.set_cookie(
+                    WRITE_MARKER_COOKIE,
+                    marker,
+                    max_age=math.ceil(settings.DB_READ_YOUR_WRITES_WINDOW),
+                    secure=request.is_secure,
+                    httponly=True,
+                    samesite="Strict",
+                )
+        return response
+
+    app.cli.add_command(db_cli)
+
+    if settings.WARM_UP:
+        warm_up(async_views)
+
     return app
 
 
@@ -1,4 +1,5 @@
 from pathlib import Path
+from typing import Literal
 
 from pydantic_settings import BaseSettings
 
@@ -17,9 +18,96 @@ class Settings(BaseSettings):
     DATABASE_URL: str | None = None
     DEFAULT_DATABASE_URL: str | None = None
 
+    # Connection pool (per worker process). DB_POOL_MAX_SIZE defaults to
+    # DB_POOL_MIN_SIZE; timeouts and ages are in seconds.
+    DB_POOL_MIN_SIZE: int = 4
+    DB_POOL_MAX_SIZE: int | None = None
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_MAX_IDLE: float = 600.0
+    DB_POOL_MAX_LIFETIME: float = 3600.0
+    DB_POOL_CHECK: bool = True
+
+    # Streaming replicas for read-only queries, as a JSON list of URLs. A
+    # user's reads go to the primary for DB_READ_YOUR_WRITES_WINDOW seconds
+    # after they write; set it above the expected replication lag. Workers
+    # other than the one that served the write only know of it from the
+    # signed "last_write" cookie set on the write's response: a client that
+    # does not send cookies back may read its own writes stale from them.
+    DB_REPLICA_URLS: list[str] = []
+    DB_READ_YOUR_WRITES_WINDOW: float = 5.0
+
+    # Open the pool and build the schema validators in create_app() instead
+    # of on the first requests that need them.
+    WARM_UP: bool = False
+
+    # Serve the auth, user and transaction endpoints with async views on an
+    # AsyncConnectionPool instead of the sync views and pool.
+    ASYNC_VIEWS: bool = False
+
+    # Validate every response built from database rows against its schema
+    # (slower; for debugging). By default trusted rows are serialized directly.
+    STRICT_OUTPUT_VALIDATION: bool = False
+
+    # Encoder of JSON requests and responses; "stdlib" is Flask's json module.
+    JSON_PROVIDER: Literal["orjson", "stdlib"] = "orjson"
+
+    # Per-worker LRU cache of user and transaction lookups, bounded by entries
+    # and total bytes; entries expire after CACHE_TTL seconds. Writes through
+    # this worker invalidate it at once, other workers' copies within the TTL.
+    # Set CACHE_MAX_ENTRIES to 0 to disable it.
+    CACHE_MAX_ENTRIES: int = 10_000
+    CACHE_MAX_BYTES: int = 16 * 1024 * 1024
+    CACHE_TTL: float = 30.0
+
+    # Shared secret for the /internal endpoints; they are disabled when unset.
+    INTERNAL_API_TOKEN: str | None = None
+
     JWT_SECRET_KEY: str
     JWT_ALGORITHM: str
     JWT_EXPIRE_IN: int
+    # Verified tokens remembered per worker, so reused tokens skip signature
+    # verification until they expire; 0 disables the cache.
+    JWT_CACHE_SIZE: int = 10_000
+    # Revoked tokens are checked against a per-worker Bloom filter, rebuilt
+    # from the database every REVOCATION_REFRESH_INTERVAL seconds; other
+    # workers' revocations take effect within that interval. Only filter
+    # positives are checked against the database.
+    REVOCATION_REFRESH_INTERVAL: float = 10.0
+    REVOCATION_FILTER_CAPACITY: int = 100_000
+    REVOCATION_FILTER_ERROR_RATE: float = 0.001
+
+    # bcrypt cost of new password hashes; hashes with another cost are
+    # replaced on the next successful login. Hashing runs on a pool of
+    # PASSWORD_HASH_WORKERS threads per worker process; requests beyond
+    # PASSWORD_HASH_QUEUE_SIZE pending operations get 503 Service Unavailable.
+    BCRYPT_ROUNDS: int = 12
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_QUEUE_SIZE: int = 32
+
+    # Token-bucket limits per blueprint, as '<requests>/<second|minute|hour>'.
+    # Each client IP and each authenticated user gets a bucket per blueprint
+    # holding that many requests, refilled evenly over the period; blueprints
+    # without a limit are not throttled. Buckets are per worker, at most
+    # RATE_LIMIT_MAX_KEYS of them.
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMITS: dict[str, str] = {
+        "auth": "20/minute",
+        "user": "120/minute",
+        "tx": "600/minute",
+    }
+    RATE_LIMIT_MAX_KEYS: int = 100_000
+
+    # Number of reverse proxies in front of the app that append to
+    # X-Forwarded-For and set X-Forwarded-Proto. The client IP (and so its
+    # rate limit bucket) is then taken from those headers instead of the
+    # connection's peer, which behind a proxy is the proxy for every client.
+    # Leave at 0 when clients connect directly, or they can spoof their IP.
+    TRUSTED_PROXY_HOPS: int = 0
+
+    EXPORT_ITERSIZE: int = 2000
+    IMPORT_BATCH_SIZE: int = 1000
+    IMPORT_MAX_ERRORS: int = 100
+    SEARCH_SIMILARITY_THRESHOLD: float = 0.5
 
     class Config:
         env_file = BASE_DIR / ".env"
@@ -0,0 +1,211 @@
+import asyncio
+import atexit
+import contextvars
+import os
+import threading
+from collections.abc import AsyncIterator, Coroutine
+from concurrent.futures import Future
+from contextlib import asynccontextmanager
+from typing import Any
+
+from psycopg import AsyncConnection
+from psycopg_pool import AsyncConnectionPool
+
+from src.config import settings
+from src.database.db_connection import pool_options, read_replica_index
+
+
+class _AsyncRuntime:
+    """
+    The event loop thread of the current process and the pools bound to it.
+
+    Async pools can only be used from the loop they were opened on, while
+    Flask calls views from many threads. All coroutines therefore run on one
+    long-lived loop in a daemon thread; request threads submit coroutines to
+    it and wait for their results.
+    """
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget the loop and pools, e.g. those of the parent after a fork."""
+        self.loop: asyncio.AbstractEventLoop | None = None
+        self.pool: AsyncConnectionPool | None = None
+        self.replicas: list[AsyncConnectionPool] | None = None
+        # Guards starting the loop (any thread) / opening the pools (loop only).
+        self.lock = threading.Lock()
+        self.open_lock = asyncio.Lock()
+
+
+_runtime = _AsyncRuntime()
+
+# Loop and pools inherited across a fork, kept referenced so they are never
+# garbage collected (and their connections terminated) in the child.
+_inherited: list[tuple] = []
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    if _runtime.loop is None:
+        with _runtime.lock:
+            if _runtime.loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever, name="db-event-loop", daemon=True
+                ).start()
+                _runtime.loop = loop
+    return _runtime.loop
+
+
+def run_coroutine[T](coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine on the database event loop and wait for its result.
+
+    The coroutine runs in a copy of the caller's context, so Flask's request
+    context (request, g) is available to it.
+
+    Args:
+        coro (Coroutine): Coroutine to run.
+
+    Returns:
+        The coroutine's result.
+
+    Raises:
+        Exception: Whatever the coroutine raises.
+    """
+    loop = _get_loop()
+    context = contextvars.copy_context()
+    result: Future[T] = Future()
+
+    def copy_outcome(task: asyncio.Task[T]) -> None:
+        if task.cancelled():
+            result.cancel()
+        elif task.exception() is not None:
+            result.set_exception(task.exception())
+        else:
+            result.set_result(task.result())
+
+    def start() -> None:
+        task = loop.create_task(coro, context=context)
+        task.add_done_callback(copy_outcome)
+
+    loop.call_soon_threadsafe(start)
+    return result.result()
+
+
+async def _open_pool(conninfo: str, name: str) -> AsyncConnectionPool:
+    pool = AsyncConnectionPool(
+        conninfo,
+        check=AsyncConnectionPool.check_connection if settings.DB_POOL_CHECK else None,
+        name=name,
+        open=False,
+        **pool_options(),
+    )
+    await pool.open(wait=False)
+    return pool
+
+
+async def get_async_pool() -> AsyncConnectionPool:
+    """
+    Return this process's async primary pool, opening it on first use.
+
+    Must be awaited on the database event loop (see `run_coroutine`).
+
+    Returns:
+        AsyncConnectionPool: The open pool.
+    """
+    if _runtime.pool is None:
+        async with _runtime.open_lock:
+            if _runtime.pool is None:
+                _runtime.pool = await _open_pool(
+                    settings.db_url, "expense-tracker-async"
+                )
+    return _runtime.pool
+
+
+async def get_async_replica_pools() -> list[AsyncConnectionPool]:
+    """
+    Return this process's async replica pools (one per DB_REPLICA_URLS entry).
+
+    Returns:
+        list[AsyncConnectionPool]: Open pools; [] if no replicas are configured.
+    """
+    if _runtime.replicas is None:
+        async with _runtime.open_lock:
+            if _runtime.replicas is None:
+                _runtime.replicas = [
+                    await _open_pool(url, f"expense-tracker-async-replica-{i}")
+                    for i, url in enumerate(settings.DB_REPLICA_URLS)
+                ]
+    return _runtime.replicas
+
+
+@asynccontextmanager
+async def get_async_conn() -> AsyncIterator[AsyncConnection]:
+    """Helper function for creating an async database connection."""
+    pool = await get_async_pool()
+    async with pool.connection() as conn:
+        yield conn
+
+
+@asynccontextmanager
+async def get_async_read_conn(
+    user_id: int | None = None,
+) -> AsyncIterator[AsyncConnection]:
+    """
+    Helper function for creating an async connection for read-only queries.
+
+    Same routing as `get_read_conn` (see `read_replica_index`).
+
+    Args:
+        user_id (int | None): User the data is read for.
+    """
+    replicas = await get_async_replica_pools()
+    index = read_replica_index(len(replicas), user_id)
+    pool = await get_async_pool() if index is None else replicas[index]
+    async with pool.connection() as conn:
+        yield conn
+
+
+async def _open_pools(timeout: float) -> None:
+    for pool in (await get_async_pool(), *await get_async_replica_pools()):
+        await pool.wait(timeout=timeout)
+
+
+def open_async_pool(timeout: float | None = None) -> None:
+    """
+    Open the async pools and wait until their minimum connections are ready.
+
+    Args:
+        timeout (float | None): Seconds to wait per pool. Defaults to
+            DB_POOL_TIMEOUT.
+
+    Raises:
+        psycopg_pool.PoolTimeout: If the connections are not ready in time.
+    """
+    run_coroutine(_open_pools(timeout or settings.DB_POOL_TIMEOUT))
+
+
+async def _close_pools() -> None:
+    pools = [_runtime.pool, *(_runtime.replicas or [])]
+    _runtime.pool, _runtime.replicas = None, None
+    for pool in pools:
+        if pool is not None:
+            await pool.close()
+
+
+def close_async_pool() -> None:
+    """Close this process's async pools, if opened. A later use reopens them."""
+    if _runtime.loop is not None and (_runtime.pool or _runtime.replicas):
+        run_coroutine(_close_pools())
+
+
+def _reset_after_fork() -> None:
+    # The loop thread does not exist in the child; the parent's loop and
+    # pools are abandoned (not closed: their sockets belong to the parent).
+    _inherited.append((_runtime.loop, _runtime.pool, _runtime.replicas))
+    _runtime.reset()
+
+
+os.register_at_fork(after_in_child=_reset_after_fork)
+atexit.register(close_async_pool)
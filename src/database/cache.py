@@ -0,0 +1,274 @@
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from datetime import date
+from decimal import Decimal
+from typing import Any, Protocol
+
+import msgpack
+
+from src.config import settings
+
+# MessagePack extension codes of the non-native values found in rows.
+_EXT_DECIMAL = 1
+_EXT_DATE = 2
+
+
+def _encode_ext(obj: Any) -> msgpack.ExtType:
+    if isinstance(obj, Decimal):
+        return msgpack.ExtType(_EXT_DECIMAL, str(obj).encode())
+    if isinstance(obj, date):
+        return msgpack.ExtType(_EXT_DATE, obj.isoformat().encode())
+    raise TypeError(f"Cannot cache {type(obj).__name__}")
+
+
+def _decode_ext(code: int, data: bytes) -> Any:
+    if code == _EXT_DECIMAL:
+        return Decimal(data.decode())
+    if code == _EXT_DATE:
+        return date.fromisoformat(data.decode())
+    return msgpack.ExtType(code, data)
+
+
+class CacheBackend(Protocol):
+    """Storage of encoded cache entries, shared by all the caches of a worker."""
+
+    def get(self, key: str) -> bytes | None: ...
+
+    def set(self, key: str, value: bytes) -> None: ...
+
+    def delete(self, keys: Iterable[str]) -> None: ...
+
+    def clear(self, prefix: str) -> None: ...
+
+    def stats(self) -> dict[str, int]: ...
+
+
+class LRUBackend:
+    """
+    In-process backend bounded by entry count and total bytes.
+
+    Entries expire `ttl` seconds after they are stored. When a bound is
+    exceeded, the least recently used entries are evicted first.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int, ttl: float) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._bytes = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                self._discard(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: str, value: bytes) -> None:
+        if len(value) > self.max_bytes:
+            return
+        with self._lock:
+            self._discard(key)
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._bytes += len(value)
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._discard(next(iter(self._entries)))
+                self._evictions += 1
+
+    def delete(self, keys: Iterable[str]) -> None:
+        with self._lock:
+            for key in keys:
+                self._discard(key)
+
+    def clear(self, prefix: str) -> None:
+        with self._lock:
+            for key in [k for k in self._entries if k.startswith(prefix)]:
+                self._discard(key)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "evictions": self._evictions,
+            }
+
+    def _discard(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= len(entry[1])
+
+
+class RedisBackend:
+    """
+    Backend on a Redis-protocol server, shared by every worker using it.
+
+    Works with any client exposing redis-py's `get`, `set(..., px=...)`,
+    `delete` and `scan_iter`. Entries expire on the server after `ttl`
+    seconds; evictions happen there too and are not counted here.
+    """
+
+    def __init__(self, client: Any, ttl: float, namespace: str = "cache:") -> None:
+        self.client = client
+        self.ttl = ttl
+        self.namespace = namespace
+
+    def get(self, key: str) -> bytes | None:
+        value: bytes | None = self.client.get(self.namespace + key)
+        return value
+
+    def set(self, key: str, value: bytes) -> None:
+        self.client.set(self.namespace + key, value, px=int(self.ttl * 1000))
+
+    def delete(self, keys: Iterable[str]) -> None:
+        names = [self.namespace + key for key in keys]
+        if names:
+            self.client.delete(*names)
+
+    def clear(self, prefix: str) -> None:
+        names = self.client.scan_iter(match=f"{self.namespace}{prefix}*")
+        self.delete(
+            (name.decode() if isinstance(name, bytes) else name)[len(self.namespace) :]
+            for name in names
+        )
+
+    def stats(self) -> dict[str, int]:
+        return {"evictions": 0}
+
+
+def _default_backend() -> CacheBackend | None:
+    """Build the backend configured in settings; None disables caching."""
+    if not settings.CACHE_MAX_ENTRIES:
+        return None
+    return LRUBackend(
+        settings.CACHE_MAX_ENTRIES, settings.CACHE_MAX_BYTES, settings.CACHE_TTL
+    )
+
+
+class _Backend:
+    """The backend shared by all caches, built on first use."""
+
+    def __init__(self, factory: Callable[[], CacheBackend | None]) -> None:
+        self.factory = factory
+        self._backend: CacheBackend | None = None
+        self._built = False
+        self._lock = threading.Lock()
+
+    def get(self) -> CacheBackend | None:
+        if not self._built:
+            with self._lock:
+                if not self._built:
+                    self._backend = self.factory()
+                    self._built = True
+        return self._backend
+
+    def replace(self, factory: Callable[[], CacheBackend | None]) -> None:
+        with self._lock:
+            self.factory = factory
+            self._backend = None
+            self._built = False
+
+
+_backend = _Backend(_default_backend)
+
+
+def use_backend(factory: Callable[[], CacheBackend | None]) -> None:
+    """
+    Replace the backend of every cache, e.g. with a `RedisBackend`.
+
+    Args:
+        factory (Callable[[], CacheBackend | None]): Builds the new backend on
+            first use. Returning None disables caching.
+    """
+    _backend.replace(factory)
+
+
+class RecordCache:
+    """
+    Cache of database rows under one key prefix.
+
+    Each row is stored with the data version of its user (see
+    `get_data_version`) read before the row, and only served to a reader
+    expecting that same version. Writes bump the version, so a row changed
+    through another worker, whose cache is not told, is never served stale:
+    it is a miss. Writers still `invalidate` the rows they change once their
+    transaction has committed, to free the space at once.
+
+    Rows are stored MessagePack-encoded, so every hit returns a fresh copy
+    and any backend can hold them.
+    """
+
+    def __init__(self, prefix: str) -> None:
+        self.prefix = prefix
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    def _key(self, parts: tuple) -> str:
+        return self.prefix + ":".join(map(str, parts))
+
+    def get(self, key: tuple, version: int) -> dict | None:
+        """Return the row cached under `key` at `version`, or None on a miss."""
+        backend = _backend.get()
+        if backend is None:
+            return None
+        value = backend.get(self._key(key))
+        row = None
+        if value is not None:
+            cached_version, row = msgpack.unpackb(value, ext_hook=_decode_ext)
+            if cached_version != version:
+                row = None
+        with self._lock:
+            if row is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+        return row
+
+    def set(self, key: tuple, row: dict | None, version: int) -> dict | None:
+        """Cache `row`, read at `version`, under `key` unless it is None; return it."""
+        backend = _backend.get()
+        if backend is not None and row is not None:
+            backend.set(
+                self._key(key), msgpack.packb([version, row], default=_encode_ext)
+            )
+        return row
+
+    def invalidate(self, *keys: tuple) -> None:
+        """Drop the rows stored under each of `keys`."""
+        backend = _backend.get()
+        if backend is not None:
+            backend.delete(self._key(key) for key in keys)
+
+    def clear(self, *key_prefix: Any) -> None:
+        """Drop every row of this cache, or those whose key starts with `key_prefix`."""
+        backend = _backend.get()
+        if backend is not None:
+            backend.clear(self._key(key_prefix) + ":" if key_prefix else self.prefix)
+
+    def stats(self, reset: bool = False) -> dict[str, int]:
+        """Return this cache's hit and miss counters, optionally resetting them."""
+        with self._lock:
+            stats = {"hits": self._hits, "misses": self._misses}
+            if reset:
+                self._hits = self._misses = 0
+        return stats
+
+
+user_cache = RecordCache("user:")
+transaction_cache = RecordCache("transaction:")
+
+
+def backend_stats() -> dict[str, int]:
+    """Return the shared backend's counters, empty when caching is disabled."""
+    backend = _backend.get()
+    return backend.stats() if backend is not None else {}
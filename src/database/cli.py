@@ -0,0 +1,134 @@
+from datetime import datetime
+
+import click
+from flask.cli import AppGroup
+
+from src.config import settings
+from src.database.migrate import current_version, downgrade, upgrade
+from src.repositories.revocations_repo import purge_revocations
+from src.repositories.rollups_repo import find_rollup_drift, rebuild_rollups
+from src.services.partitions_service import (
+    create_future_partitions,
+    detach_partitions_before,
+)
+
+db_cli = AppGroup("db", help="Manage the database schema.")
+
+
+@db_cli.command("upgrade")
+@click.option(
+    "--to", "target", type=int, help="Version to upgrade to (default: latest)."
+)
+def upgrade_command(target: int | None) -> None:
+    """Apply pending migrations."""
+    applied = upgrade(target)
+    for migration in applied:
+        click.echo(f"Applied {migration.version:04d}_{migration.name}")
+    if not applied:
+        click.echo("Already up to date.")
+
+
+@db_cli.command("downgrade")
+@click.option(
+    "--to", "target", type=int, help="Version to downgrade to (default: previous)."
+)
+def downgrade_command(target: int | None) -> None:
+    """Revert applied migrations."""
+    if target is None:
+        target = max(current_version() - 1, 0)
+    reverted = downgrade(target)
+    for migration in reverted:
+        click.echo(f"Reverted {migration.version:04d}_{migration.name}")
+    if not reverted:
+        click.echo("Nothing to downgrade.")
+
+
+@db_cli.command("current")
+def current_command() -> None:
+    """Show the current schema version."""
+    click.echo(current_version())
+
+
+@db_cli.group("rollups")
+def rollups_cli() -> None:
+    """Check and repair the monthly transaction rollups."""
+
+
+@rollups_cli.command("verify")
+def verify_rollups_command() -> None:
+    """Compare rollups against transactions; exit code 1 on drift."""
+    drift = find_rollup_drift()
+    for row in drift:
+        click.echo(
+            f"user={row['user_id']} month={row['month']} kind={row['kind']}: "
+            f"stored {row['stored_total']}/{row['stored_count']}, "
+            f"actual {row['actual_total']}/{row['actual_count']}"
+        )
+    if drift:
+        raise click.ClickException(f"{len(drift)} rollup rows drifted.")
+    click.echo("Rollups are consistent.")
+
+
+@rollups_cli.command("rebuild")
+def rebuild_rollups_command() -> None:
+    """Recompute all rollups from transactions."""
+    click.echo(f"Rebuilt {rebuild_rollups()} rollup rows.")
+
+
+@db_cli.group("partitions")
+def partitions_cli() -> None:
+    """Manage the date partitions of the transactions table."""
+
+
+@partitions_cli.command("create")
+@click.option(
+    "--interval",
+    type=click.Choice(["year", "month"]),
+    default="year",
+    show_default=True,
+    help="Size of each partition.",
+)
+@click.option(
+    "--ahead",
+    type=click.IntRange(min=0),
+    default=1,
+    show_default=True,
+    help="Number of future periods to create besides the current one.",
+)
+def create_partitions_command(interval: str, ahead: int) -> None:
+    """Create partitions ahead of time for upcoming transaction dates."""
+    created = create_future_partitions(interval, ahead)
+    for partition in created:
+        click.echo(
+            f"Created {partition['name']} [{partition['lower']}, {partition['upper']})"
+            f", moved {partition['moved']} rows from the default partition"
+        )
+    if not created:
+        click.echo("All partitions already exist.")
+
+
+@partitions_cli.command("detach")
+@click.option(
+    "--before",
+    type=click.DateTime(formats=["%Y-%m-%d"]),
+    required=True,
+    help="Detach partitions ending on or before this date (YYYY-MM-DD).",
+)
+@click.option("--drop", is_flag=True, help="Drop the detached tables.")
+def detach_partitions_command(before: datetime, drop: bool) -> None:
+    """Detach old partitions and delete their rollups."""
+    detached = detach_partitions_before(before.date(), drop)
+    for partition in detached:
+        action = "Dropped" if drop else "Detached"
+        click.echo(
+            f"{action} {partition['name']}, "
+            f"deleted {partition['rollups_deleted']} rollup rows"
+        )
+    if not detached:
+        click.echo("No partitions to detach.")
+
+
+@db_cli.command("purge-revocations")
+def purge_revocations_command() -> None:
+    """Delete token revocations whose tokens have all expired."""
+    click.echo(f"Purged {purge_revocations(settings.JWT_EXPIRE_IN)} revocations.")
@@ -1,22 +1,8 @@
-from pathlib import Path
-
-import psycopg
-
-from src.config import settings
-
-# Read the SQL file
-sql_path = Path(__file__).parent / "schema.sql"
-schema_sql = sql_path.read_text()
-
-# Connect to Postgres
-conn = psycopg.connect(settings.db_url)
-
-# Enable autocommit so CREATE TABLE etc. run outside a transaction block
-conn.autocommit = True
-
-try:
-    with conn.cursor() as cur:
-        cur.execute(schema_sql)
-    print("Schema applied successfully.")
-finally:
-    conn.close()
+from src.database.migrate import upgrade
+
+# Apply all pending migrations (equivalent to `flask db upgrade`).
+if __name__ == "__main__":
+    applied = upgrade()
+    for migration in applied:
+        print(f"Applied {migration.version:04d}_{migration.name}")
+    print("Schema is up to date.")
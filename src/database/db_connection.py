@@ -1,11 +1,276 @@
+import atexit
+import hmac
+import os
+import random
+import threading
+import time
+from contextlib import AbstractContextManager
+
+from flask import g, has_request_context, request
+from psycopg import Connection
 from psycopg_pool import ConnectionPool
 
 from src.config import settings
 
-# Global connection pool
-pool = ConnectionPool(settings.db_url)
+
+class _ProcessPool:
+    """The connection pools of the current process, created on first use."""
+
+    def __init__(self) -> None:
+        self.pool: ConnectionPool | None = None
+        self.replicas: list[ConnectionPool] | None = None
+        self.lock = threading.Lock()
+
+
+class _RecentWriters:
+    """
+    Users who wrote through this process within the read-your-writes window.
+
+    Their reads go to the primary until the window has passed, so they are
+    not served from a replica that has not caught up yet.
+    """
+
+    # Expired entries are pruned when the map grows beyond this size.
+    PRUNE_SIZE = 10_000
+
+    def __init__(self) -> None:
+        self.until: dict[int, float] = {}
+        self.lock = threading.Lock()
+
+    def mark(self, user_id: int) -> None:
+        now = time.monotonic()
+        with self.lock:
+            self.until[user_id] = now + settings.DB_READ_YOUR_WRITES_WINDOW
+            if len(self.until) > self.PRUNE_SIZE:
+                self.until = {u: t for u, t in self.until.items() if t > now}
+
+    def is_recent(self, user_id: int) -> bool:
+        return self.until.get(user_id, 0.0) > time.monotonic()
+
+
+_current = _ProcessPool()
+_recent_writers = _RecentWriters()
+
+# Pools inherited from the parent process across a fork. Their connections
+# share sockets with the parent's, so they are never used or closed here;
+# keeping a reference stops garbage collection from sending a Terminate
+# message on the parent's behalf.
+_inherited_pools: list[ConnectionPool] = []
+
+
+def pool_options() -> dict:
+    """Return the sizing and timeout options shared by all pools, from settings."""
+    return {
+        "min_size": settings.DB_POOL_MIN_SIZE,
+        "max_size": settings.DB_POOL_MAX_SIZE,
+        "timeout": settings.DB_POOL_TIMEOUT,
+        "max_idle": settings.DB_POOL_MAX_IDLE,
+        "max_lifetime": settings.DB_POOL_MAX_LIFETIME,
+    }
+
+
+def _create_pool(conninfo: str, name: str) -> ConnectionPool:
+    # With DB_POOL_CHECK, every checkout first runs a cheap liveness check,
+    # so connections dropped by the server (restart, idle timeout) are
+    # replaced instead of failing a request.
+    return ConnectionPool(
+        conninfo,
+        check=ConnectionPool.check_connection if settings.DB_POOL_CHECK else None,
+        name=name,
+        open=False,
+        **pool_options(),
+    )
+
+
+def get_pool() -> ConnectionPool:
+    """
+    Return this process's primary pool, creating and opening it on first use.
+
+    Nothing connects to the database at import time, and a process forked
+    from one that already had a pool (e.g. gunicorn --preload) gets a pool
+    of its own.
+
+    Returns:
+        ConnectionPool: The open pool.
+    """
+    if _current.pool is None:
+        with _current.lock:
+            if _current.pool is None:
+                pool = _create_pool(settings.db_url, "expense-tracker")
+                pool.open(wait=False)
+                _current.pool = pool
+    return _current.pool
+
+
+def get_replica_pools() -> list[ConnectionPool]:
+    """
+    Return this process's replica pools (one per DB_REPLICA_URLS entry).
+
+    Returns:
+        list[ConnectionPool]: Open pools; [] if no replicas are configured.
+    """
+    if _current.replicas is None:
+        with _current.lock:
+            if _current.replicas is None:
+                replicas = [
+                    _create_pool(url, f"expense-tracker-replica-{i}")
+                    for i, url in enumerate(settings.DB_REPLICA_URLS)
+                ]
+                for replica in replicas:
+                    replica.open(wait=False)
+                _current.replicas = replicas
+    return _current.replicas
+
+
+def open_pool(timeout: float | None = None) -> ConnectionPool:
+    """
+    Open the pools and wait until their minimum number of connections is ready.
+
+    Args:
+        timeout (float | None): Seconds to wait per pool. Defaults to
+            DB_POOL_TIMEOUT.
+
+    Returns:
+        ConnectionPool: The open primary pool.
+
+    Raises:
+        psycopg_pool.PoolTimeout: If the connections are not ready in time.
+    """
+    pool = get_pool()
+    for p in (pool, *get_replica_pools()):
+        p.wait(timeout=timeout or settings.DB_POOL_TIMEOUT)
+    return pool
 
 
-def get_conn():
+def close_pool() -> None:
+    """Close this process's pools, if they were opened. A later use reopens them."""
+    with _current.lock:
+        pool, _current.pool = _current.pool, None
+        replicas, _current.replicas = _current.replicas or [], None
+    for p in (pool, *replicas):
+        if p is not None:
+            p.close()
+
+
+def _reset_after_fork() -> None:
+    # The locks may have been held by another thread at fork time.
+    _current.lock = threading.Lock()
+    _recent_writers.lock = threading.Lock()
+    if _current.pool is not None:
+        _inherited_pools.append(_current.pool)
+        _current.pool = None
+    if _current.replicas is not None:
+        _inherited_pools.extend(_current.replicas)
+        _current.replicas = None
+
+
+os.register_at_fork(after_in_child=_reset_after_fork)
+atexit.register(close_pool)
+
+
+# Cookie carrying a signed write marker (see `note_write`) back from the
+# client, so that every worker honours the read-your-writes window.
+WRITE_MARKER_COOKIE = "last_write"
+
+
+def _sign(message: str) -> str:
+    key = settings.JWT_SECRET_KEY.encode()
+    return hmac.new(key, message.encode(), "sha256").hexdigest()
+
+
+def note_write(user_id: int) -> str:
+    """
+    Record that a user just wrote, pinning their reads to the primary.
+
+    Reads stay on the primary for DB_READ_YOUR_WRITES_WINDOW seconds. This
+    process remembers the write itself; other processes only learn of it
+    from the returned marker, which the client sends back in the
+    WRITE_MARKER_COOKIE cookie.
+
+    Args:
+        user_id (int): ID of the user who wrote.
+
+    Returns:
+        str: Signed marker of the user ID and the end of the window.
+    """
+    _recent_writers.mark(user_id)
+    message = f"{user_id}:{time.time() + settings.DB_READ_YOUR_WRITES_WINDOW:.3f}"
+    return f"{message}:{_sign(message)}"
+
+
+def _marker_is_recent(user_id: int) -> bool:
+    """Whether the current request carries a valid write marker of `user_id`."""
+    marker = request.cookies.get(WRITE_MARKER_COOKIE)
+    if marker is None:
+        return False
+    message, _, signature = marker.rpartition(":")
+    if not hmac.compare_digest(signature.encode(), _sign(message).encode()):
+        return False
+    marker_user, _, until = message.partition(":")
+    try:
+        return int(marker_user) == user_id and float(until) > time.time()
+    except ValueError:
+        return False
+
+
+def wrote_recently(user_id: int | None) -> bool:
+    """
+    Whether `user_id` wrote within the read-your-writes window (see `note_write`).
+
+    The write is known from this process's own record, or from the write
+    marker sent with the current request.
+    """
+    if user_id is None:
+        return False
+    return _recent_writers.is_recent(user_id) or (
+        has_request_context() and _marker_is_recent(user_id)
+    )
+
+
+def read_replica_index(replica_count: int, user_id: int | None) -> int | None:
+    """
+    Pick the replica a read goes to, or None for the primary.
+
+    A random replica is picked, unless none is configured or `user_id`
+    wrote recently (see `note_write`). Within a request the first pick is
+    kept on `flask.g` and reused, so all of the request's reads see one
+    replica: a replica only moves forward, so each read is at least as
+    recent as the ones before it (e.g. a response body and the data
+    version its ETag was derived from).
+
+    Args:
+        replica_count (int): Number of configured replicas.
+        user_id (int | None): User the data is read for.
+    """
+    if has_request_context() and "read_replica" in g:
+        pinned: int | None = g.read_replica
+        return pinned
+    index = (
+        None
+        if not replica_count or wrote_recently(user_id)
+        else random.randrange(replica_count)
+    )
+    if has_request_context():
+        g.read_replica = index
+    return index
+
+
+def get_conn() -> AbstractContextManager[Connection]:
     """Helper function for creating a database connection."""
-    return pool.connection()
+    return get_pool().connection()
+
+
+def get_read_conn(user_id: int | None = None) -> AbstractContextManager[Connection]:
+    """
+    Helper function for creating a connection for read-only queries.
+
+    Uses the replica picked by `read_replica_index`, or the primary.
+
+    Args:
+        user_id (int | None): User the data is read for.
+    """
+    replicas = get_replica_pools()
+    index = read_replica_index(len(replicas), user_id)
+    if index is None:
+        return get_conn()
+    return replicas[index].connection()
@@ -0,0 +1,242 @@
+import re
+from pathlib import Path
+from typing import NamedTuple
+
+import psycopg
+from psycopg import sql
+
+from src.config import settings
+
+MIGRATIONS_DIR = Path(__file__).parent / "migrations"
+
+# First line of a migration file that must run outside a transaction block,
+# e.g. CREATE INDEX CONCURRENTLY. Such files are executed statement by
+# statement; a statement ends with a semicolon at the end of a line outside
+# $$-quoted bodies (e.g. of DO blocks).
+NO_TRANSACTION_MARKER = "-- migrate:no-transaction"
+
+# Arbitrary key serializing concurrent migration runs (e.g. parallel deploys).
+MIGRATION_LOCK_ID = 7_318_204
+
+_CONCURRENT_INDEX_RE = re.compile(
+    r"CREATE\s+(?:UNIQUE\s+)?INDEX\s+CONCURRENTLY\s+(?:IF\s+NOT\s+EXISTS\s+)?(\w+)",
+    re.IGNORECASE,
+)
+
+_FILENAME_RE = re.compile(
+    r"^(?P<version>\d{4})_(?P<name>\w+)\.(?P<direction>up|down)\.sql$"
+)
+
+
+class Migration(NamedTuple):
+    version: int
+    name: str
+    up_sql: str
+    down_sql: str
+
+
+def discover_migrations(directory: Path = MIGRATIONS_DIR) -> list[Migration]:
+    """
+    Load all migrations from the migrations directory.
+
+    Files are named `NNNN_name.up.sql` / `NNNN_name.down.sql`; every version
+    needs both.
+
+    Args:
+        directory (Path): Directory containing the migration files.
+
+    Returns:
+        list[Migration]: Migrations sorted by version.
+
+    Raises:
+        ValueError: If a file name is invalid, a version is duplicated or a
+            migration lacks its up or down file.
+    """
+    found: dict[int, dict[str, str]] = {}
+    names: dict[int, str] = {}
+    for path in sorted(directory.glob("*.sql")):
+        match = _FILENAME_RE.match(path.name)
+        if not match:
+            raise ValueError(f"Invalid migration file name: {path.name}")
+        version = int(match["version"])
+        if names.setdefault(version, match["name"]) != match["name"]:
+            raise ValueError(f"Duplicate migration version: {version}")
+        found.setdefault(version, {})[match["direction"]] = path.read_text()
+
+    migrations = []
+    for version in sorted(found):
+        files = found[version]
+        if set(files) != {"up", "down"}:
+            raise ValueError(f"Migration {version} needs both up and down files")
+        migrations.append(
+            Migration(version, names[version], files["up"], files["down"])
+        )
+    return migrations
+
+
+def _ensure_tracking_table(conn: psycopg.Connection) -> None:
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS schema_migrations (
+          version     INTEGER PRIMARY KEY,
+          name        TEXT NOT NULL,
+          applied_at  TIMESTAMPTZ NOT NULL DEFAULT now()
+        )""")
+
+
+def applied_versions(conn: psycopg.Connection) -> list[int]:
+    """
+    Return the versions recorded in the schema_migrations tracking table.
+
+    Args:
+        conn (psycopg.Connection): Open database connection.
+
+    Returns:
+        list[int]: Applied versions in ascending order.
+    """
+    _ensure_tracking_table(conn)
+    rows = conn.execute("SELECT version FROM schema_migrations ORDER BY version")
+    return [version for (version,) in rows]
+
+
+def _drop_invalid_indexes(conn: psycopg.Connection, script: str) -> None:
+    """
+    Drop the INVALID leftovers of indexes the script builds concurrently.
+
+    A failed or cancelled CREATE INDEX CONCURRENTLY leaves an INVALID index
+    behind, which the retry's IF NOT EXISTS would then accept as built.
+    """
+    for name in _CONCURRENT_INDEX_RE.findall(_strip_comments(script)):
+        row = conn.execute(
+            "SELECT NOT indisvalid FROM pg_index WHERE indexrelid = to_regclass(%s)",
+            (name,),
+        ).fetchone()
+        if row and row[0]:
+            conn.execute(
+                sql.SQL("DROP INDEX CONCURRENTLY IF EXISTS {}").format(
+                    sql.Identifier(name)
+                )
+            )
+
+
+def _run_sql(conn: psycopg.Connection, script: str, record: str, params: tuple) -> None:
+    """Execute a migration script and its tracking-table statement."""
+    if script.lstrip().startswith(NO_TRANSACTION_MARKER):
+        # Each statement commits on its own, so a failed run leaves the ones
+        # before it applied: the script must be idempotent (IF [NOT] EXISTS)
+        # to be retried. Indexes a failed run left INVALID are rebuilt.
+        _drop_invalid_indexes(conn, script)
+        for statement in _split_statements(script):
+            if _strip_comments(statement):
+                conn.execute(statement)
+        conn.execute(record, params)
+    else:
+        with conn.transaction():
+            conn.execute(script)
+            conn.execute(record, params)
+
+
+def _split_statements(script: str) -> list[str]:
+    """Split a no-transaction script into its statements."""
+    statements: list[str] = []
+    lines: list[str] = []
+    quoted = False
+    for line in script.splitlines(keepends=True):
+        lines.append(line)
+        if _strip_comments(line).count("$$") % 2:
+            quoted = not quoted
+        if not quoted and line.rstrip().endswith(";"):
+            statements.append("".join(lines))
+            lines = []
+    statements.append("".join(lines))
+    return statements
+
+
+def _strip_comments(statement: str) -> str:
+    lines = (line.split("--", 1)[0] for line in statement.splitlines())
+    return "\n".join(lines).strip()
+
+
+def _connect(db_url: str | None) -> psycopg.Connection:
+    conn = psycopg.connect(db_url or settings.db_url, autocommit=True)
+    conn.execute("SELECT pg_advisory_lock(%s)", (MIGRATION_LOCK_ID,))
+    return conn
+
+
+def upgrade(target: int | None = None, db_url: str | None = None) -> list[Migration]:
+    """
+    Apply all pending migrations up to and including `target`.
+
+    Args:
+        target (int | None): Highest version to apply. None applies all.
+        db_url (str | None): Database URL. Defaults to the configured database.
+
+    Returns:
+        list[Migration]: Migrations applied by this call, in order.
+
+    Raises:
+        psycopg.errors.Error: If a migration fails. Transactional migrations
+            are rolled back entirely.
+    """
+    migrations = discover_migrations()
+    with _connect(db_url) as conn:
+        done = set(applied_versions(conn))
+        pending = [
+            m
+            for m in migrations
+            if m.version not in done and (target is None or m.version <= target)
+        ]
+        for migration in pending:
+            _run_sql(
+                conn,
+                migration.up_sql,
+                "INSERT INTO schema_migrations (version, name) VALUES (%s, %s)",
+                (migration.version, migration.name),
+            )
+    return pending
+
+
+def downgrade(target: int, db_url: str | None = None) -> list[Migration]:
+    """
+    Revert applied migrations newer than `target`, newest first.
+
+    Args:
+        target (int): Version to end up at. 0 reverts every migration.
+        db_url (str | None): Database URL. Defaults to the configured database.
+
+    Returns:
+        list[Migration]: Migrations reverted by this call, in order.
+
+    Raises:
+        ValueError: If an applied version has no migration file.
+        psycopg.errors.Error: If a down migration fails.
+    """
+    by_version = {m.version: m for m in discover_migrations()}
+    with _connect(db_url) as conn:
+        versions = [v for v in applied_versions(conn) if v > target]
+        missing = [v for v in versions if v not in by_version]
+        if missing:
+            raise ValueError(f"No migration files for applied versions: {missing}")
+        reverted = [by_version[v] for v in reversed(versions)]
+        for migration in reverted:
+            _run_sql(
+                conn,
+                migration.down_sql,
+                "DELETE FROM schema_migrations WHERE version = %s",
+                (migration.version,),
+            )
+    return reverted
+
+
+def current_version(db_url: str | None = None) -> int:
+    """
+    Return the newest applied migration version (0 if none).
+
+    Args:
+        db_url (str | None): Database URL. Defaults to the configured database.
+
+    Returns:
+        int: Current schema version.
+    """
+    with psycopg.connect(db_url or settings.db_url, autocommit=True) as conn:
+        versions = applied_versions(conn)
+    return versions[-1] if versions else 0
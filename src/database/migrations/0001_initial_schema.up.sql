@@ -1,11 +1,13 @@
-CREATE TABLE users (
+-- Baseline schema. IF NOT EXISTS lets databases created from the old
+-- schema.sql adopt the migration history without changes.
+CREATE TABLE IF NOT EXISTS users (
   id            SERIAL PRIMARY KEY,
   username      TEXT NOT NULL,
   email         TEXT UNIQUE NOT NULL,
   password_hash TEXT NOT NULL
 );
 
-CREATE TABLE transactions (
+CREATE TABLE IF NOT EXISTS transactions (
   id                 SERIAL PRIMARY KEY,
   user_id            INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
   kind TEXT          NOT NULL CHECK(kind IN ('expense', 'income')),
@@ -0,0 +1,3 @@
+-- migrate:no-transaction
+DROP INDEX CONCURRENTLY IF EXISTS transactions_date_brin_idx;
+DROP INDEX CONCURRENTLY IF EXISTS transactions_user_date_id_idx;
@@ -0,0 +1,11 @@
+-- migrate:no-transaction
+-- Built concurrently so rolling this out does not block writes.
+
+-- Per-user keyset pagination and date-range queries.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS transactions_user_date_id_idx
+  ON transactions (user_id, transaction_date, id);
+
+-- Compact index for date-range scans and aggregates across all users;
+-- transaction_date correlates with insertion order.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS transactions_date_brin_idx
+  ON transactions USING brin (transaction_date);
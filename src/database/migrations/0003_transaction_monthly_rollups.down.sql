@@ -0,0 +1,5 @@
+DROP TRIGGER IF EXISTS transactions_rollup_delete ON transactions;
+DROP TRIGGER IF EXISTS transactions_rollup_update ON transactions;
+DROP TRIGGER IF EXISTS transactions_rollup_insert ON transactions;
+DROP FUNCTION IF EXISTS apply_transaction_rollup_deltas();
+DROP TABLE IF EXISTS transaction_monthly_rollups;
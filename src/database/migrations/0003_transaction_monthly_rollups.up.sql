@@ -0,0 +1,88 @@
+-- Per-user monthly totals, maintained by statement-level triggers in the
+-- same transaction as every write to transactions (including COPY).
+CREATE TABLE transaction_monthly_rollups (
+  user_id   INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+  month     DATE NOT NULL,
+  kind      TEXT NOT NULL CHECK(kind IN ('expense', 'income')),
+  total     NUMERIC NOT NULL,
+  tx_count  INTEGER NOT NULL,
+  PRIMARY KEY (user_id, month, kind)
+);
+
+CREATE FUNCTION apply_transaction_rollup_deltas() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+  IF TG_OP = 'INSERT' THEN
+    INSERT INTO transaction_monthly_rollups AS r (user_id, month, kind, total, tx_count)
+    SELECT user_id, date_trunc('month', transaction_date::timestamp)::date,
+           kind, SUM(amount), COUNT(*)
+    FROM new_rows
+    GROUP BY 1, 2, 3
+    ON CONFLICT (user_id, month, kind) DO UPDATE
+      SET total = r.total + EXCLUDED.total,
+          tx_count = r.tx_count + EXCLUDED.tx_count;
+
+  ELSIF TG_OP = 'UPDATE' THEN
+    -- Net out old and new rows, so edits moving a row to another month or
+    -- kind are accounted for in both buckets.
+    INSERT INTO transaction_monthly_rollups AS r (user_id, month, kind, total, tx_count)
+    SELECT user_id, month, kind, SUM(total), SUM(tx_count)
+    FROM (
+      SELECT user_id, date_trunc('month', transaction_date::timestamp)::date AS month,
+             kind, amount AS total, 1 AS tx_count
+      FROM new_rows
+      UNION ALL
+      SELECT user_id, date_trunc('month', transaction_date::timestamp)::date,
+             kind, -amount, -1
+      FROM old_rows
+    ) AS deltas
+    GROUP BY 1, 2, 3
+    ON CONFLICT (user_id, month, kind) DO UPDATE
+      SET total = r.total + EXCLUDED.total,
+          tx_count = r.tx_count + EXCLUDED.tx_count;
+
+    DELETE FROM transaction_monthly_rollups
+    WHERE tx_count = 0 AND user_id IN (SELECT user_id FROM old_rows);
+
+  ELSE
+    -- Update only: when a user is deleted, their rollups are already gone
+    -- through ON DELETE CASCADE and must not be re-inserted.
+    UPDATE transaction_monthly_rollups AS r
+    SET total = r.total - d.total,
+        tx_count = r.tx_count - d.tx_count
+    FROM (
+      SELECT user_id, date_trunc('month', transaction_date::timestamp)::date AS month,
+             kind, SUM(amount) AS total, COUNT(*) AS tx_count
+      FROM old_rows
+      GROUP BY 1, 2, 3
+    ) AS d
+    WHERE r.user_id = d.user_id AND r.month = d.month AND r.kind = d.kind;
+
+    DELETE FROM transaction_monthly_rollups
+    WHERE tx_count = 0 AND user_id IN (SELECT user_id FROM old_rows);
+  END IF;
+  RETURN NULL;
+END;
+$$;
+
+CREATE TRIGGER transactions_rollup_insert
+  AFTER INSERT ON transactions
+  REFERENCING NEW TABLE AS new_rows
+  FOR EACH STATEMENT EXECUTE FUNCTION apply_transaction_rollup_deltas();
+
+CREATE TRIGGER transactions_rollup_update
+  AFTER UPDATE ON transactions
+  REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+  FOR EACH STATEMENT EXECUTE FUNCTION apply_transaction_rollup_deltas();
+
+CREATE TRIGGER transactions_rollup_delete
+  AFTER DELETE ON transactions
+  REFERENCING OLD TABLE AS old_rows
+  FOR EACH STATEMENT EXECUTE FUNCTION apply_transaction_rollup_deltas();
+
+-- Backfill from existing data.
+INSERT INTO transaction_monthly_rollups (user_id, month, kind, total, tx_count)
+SELECT user_id, date_trunc('month', transaction_date::timestamp)::date,
+       kind, SUM(amount), COUNT(*)
+FROM transactions
+GROUP BY 1, 2, 3;
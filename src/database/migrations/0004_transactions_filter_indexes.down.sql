@@ -0,0 +1,3 @@
+-- migrate:no-transaction
+DROP INDEX CONCURRENTLY IF EXISTS transactions_user_amount_id_idx;
+DROP INDEX CONCURRENTLY IF EXISTS transactions_user_kind_date_id_idx;
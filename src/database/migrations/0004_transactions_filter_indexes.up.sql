@@ -0,0 +1,11 @@
+-- migrate:no-transaction
+-- Indexes for the filtered / sorted transaction list.
+
+-- kind filter combined with date range and date sort
+-- (e.g. "this month's expenses").
+CREATE INDEX CONCURRENTLY IF NOT EXISTS transactions_user_kind_date_id_idx
+  ON transactions (user_id, kind, transaction_date, id);
+
+-- amount sort and amount range filters.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS transactions_user_amount_id_idx
+  ON transactions (user_id, amount, id);
@@ -0,0 +1,5 @@
+-- migrate:no-transaction
+-- The extensions are left installed; other objects may depend on them.
+DROP INDEX CONCURRENTLY IF EXISTS transactions_user_description_trgm_idx;
+DROP INDEX CONCURRENTLY IF EXISTS transactions_user_description_tsv_idx;
+ALTER TABLE transactions DROP COLUMN IF EXISTS description_tsv;
@@ -0,0 +1,16 @@
+-- migrate:no-transaction
+-- Ranked full-text search over descriptions, with trigram matching as a
+-- typo-tolerant fallback. btree_gin lets both GIN indexes lead with
+-- user_id so a search only touches the searching user's entries.
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+CREATE EXTENSION IF NOT EXISTS btree_gin;
+
+ALTER TABLE transactions
+  ADD COLUMN IF NOT EXISTS description_tsv tsvector
+  GENERATED ALWAYS AS (to_tsvector('english', description)) STORED;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS transactions_user_description_tsv_idx
+  ON transactions USING gin (user_id, description_tsv);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS transactions_user_description_trgm_idx
+  ON transactions USING gin (user_id, description gin_trgm_ops);
@@ -0,0 +1,59 @@
+-- Merge all attached partitions back into a single table. Partitions
+-- detached with `flask db partitions detach` are left untouched.
+ALTER TABLE transactions RENAME TO transactions_partitioned;
+ALTER SEQUENCE transactions_id_seq OWNED BY NONE;
+
+ALTER TABLE transactions_partitioned DROP CONSTRAINT transactions_pkey;
+DROP INDEX transactions_user_date_id_idx;
+DROP INDEX transactions_date_brin_idx;
+DROP INDEX transactions_user_kind_date_id_idx;
+DROP INDEX transactions_user_amount_id_idx;
+DROP INDEX transactions_user_description_tsv_idx;
+DROP INDEX transactions_user_description_trgm_idx;
+
+CREATE TABLE transactions (
+  id                 INTEGER PRIMARY KEY DEFAULT nextval('transactions_id_seq'),
+  user_id            INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+  kind               TEXT NOT NULL CHECK(kind IN ('expense', 'income')),
+  transaction_date   DATE NOT NULL DEFAULT CURRENT_DATE,
+  amount             NUMERIC NOT NULL,
+  description        TEXT NOT NULL,
+  description_tsv    tsvector
+    GENERATED ALWAYS AS (to_tsvector('english', description)) STORED
+);
+
+ALTER SEQUENCE transactions_id_seq OWNED BY transactions.id;
+
+INSERT INTO transactions (id, user_id, kind, transaction_date, amount, description)
+SELECT id, user_id, kind, transaction_date, amount, description
+FROM transactions_partitioned;
+
+DROP TABLE transactions_partitioned;
+
+CREATE INDEX transactions_user_date_id_idx
+  ON transactions (user_id, transaction_date, id);
+CREATE INDEX transactions_date_brin_idx
+  ON transactions USING brin (transaction_date);
+CREATE INDEX transactions_user_kind_date_id_idx
+  ON transactions (user_id, kind, transaction_date, id);
+CREATE INDEX transactions_user_amount_id_idx
+  ON transactions (user_id, amount, id);
+CREATE INDEX transactions_user_description_tsv_idx
+  ON transactions USING gin (user_id, description_tsv);
+CREATE INDEX transactions_user_description_trgm_idx
+  ON transactions USING gin (user_id, description gin_trgm_ops);
+
+CREATE TRIGGER transactions_rollup_insert
+  AFTER INSERT ON transactions
+  REFERENCING NEW TABLE AS new_rows
+  FOR EACH STATEMENT EXECUTE FUNCTION apply_transaction_rollup_deltas();
+
+CREATE TRIGGER transactions_rollup_update
+  AFTER UPDATE ON transactions
+  REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+  FOR EACH STATEMENT EXECUTE FUNCTION apply_transaction_rollup_deltas();
+
+CREATE TRIGGER transactions_rollup_delete
+  AFTER DELETE ON transactions
+  REFERENCING OLD TABLE AS old_rows
+  FOR EACH STATEMENT EXECUTE FUNCTION apply_transaction_rollup_deltas();
@@ -0,0 +1,92 @@
+-- Range-partition transactions by transaction_date: yearly partitions plus
+-- a default partition for dates outside them. Further partitions are
+-- managed with `flask db partitions`.
+--
+-- The table is rebuilt and its rows copied, so this migration holds an
+-- exclusive lock on transactions for the duration of the copy.
+ALTER TABLE transactions RENAME TO transactions_unpartitioned;
+ALTER SEQUENCE transactions_id_seq OWNED BY NONE;
+
+-- Free the index names for the new table.
+ALTER TABLE transactions_unpartitioned DROP CONSTRAINT transactions_pkey;
+DROP INDEX transactions_user_date_id_idx;
+DROP INDEX transactions_date_brin_idx;
+DROP INDEX transactions_user_kind_date_id_idx;
+DROP INDEX transactions_user_amount_id_idx;
+DROP INDEX transactions_user_description_tsv_idx;
+DROP INDEX transactions_user_description_trgm_idx;
+
+-- The partition key must be part of the primary key. ids still come from
+-- a single sequence, so they stay unique across partitions.
+CREATE TABLE transactions (
+  id                 INTEGER NOT NULL DEFAULT nextval('transactions_id_seq'),
+  user_id            INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+  kind               TEXT NOT NULL CHECK(kind IN ('expense', 'income')),
+  transaction_date   DATE NOT NULL DEFAULT CURRENT_DATE,
+  amount             NUMERIC NOT NULL,
+  description        TEXT NOT NULL,
+  description_tsv    tsvector
+    GENERATED ALWAYS AS (to_tsvector('english', description)) STORED,
+  PRIMARY KEY (id, transaction_date)
+) PARTITION BY RANGE (transaction_date);
+
+ALTER SEQUENCE transactions_id_seq OWNED BY transactions.id;
+
+CREATE TABLE transactions_default PARTITION OF transactions DEFAULT;
+
+-- One partition per year from the oldest transaction through next year.
+DO $$
+DECLARE
+  first_year INTEGER;
+  last_year INTEGER := extract(year FROM CURRENT_DATE)::integer + 1;
+BEGIN
+  SELECT LEAST(COALESCE(extract(year FROM MIN(transaction_date))::integer, last_year),
+               last_year - 1)
+  INTO first_year
+  FROM transactions_unpartitioned;
+
+  FOR y IN first_year..last_year LOOP
+    EXECUTE format(
+      'CREATE TABLE %I PARTITION OF transactions FOR VALUES FROM (%L) TO (%L)',
+      'transactions_y' || y, make_date(y, 1, 1), make_date(y + 1, 1, 1)
+    );
+  END LOOP;
+END;
+$$;
+
+-- Copy before creating the rollup triggers: the rollups already count
+-- these rows.
+INSERT INTO transactions (id, user_id, kind, transaction_date, amount, description)
+SELECT id, user_id, kind, transaction_date, amount, description
+FROM transactions_unpartitioned;
+
+DROP TABLE transactions_unpartitioned;
+
+-- Indexes on the parent are created on every partition, present and future.
+CREATE INDEX transactions_user_date_id_idx
+  ON transactions (user_id, transaction_date, id);
+CREATE INDEX transactions_date_brin_idx
+  ON transactions USING brin (transaction_date);
+CREATE INDEX transactions_user_kind_date_id_idx
+  ON transactions (user_id, kind, transaction_date, id);
+CREATE INDEX transactions_user_amount_id_idx
+  ON transactions (user_id, amount, id);
+CREATE INDEX transactions_user_description_tsv_idx
+  ON transactions USING gin (user_id, description_tsv);
+CREATE INDEX transactions_user_description_trgm_idx
+  ON transactions USING gin (user_id, description gin_trgm_ops);
+
+CREATE TRIGGER transactions_rollup_insert
+  AFTER INSERT ON transactions
+  REFERENCING NEW TABLE AS new_rows
+  FOR EACH STATEMENT EXECUTE FUNCTION apply_transaction_rollup_deltas();
+
+CREATE TRIGGER transactions_rollup_update
+  AFTER UPDATE ON transactions
+  REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+  FOR EACH STATEMENT EXECUTE FUNCTION apply_transaction_rollup_deltas();
+
+CREATE TRIGGER transactions_rollup_delete
+  AFTER DELETE ON transactions
+  REFERENCING OLD TABLE AS old_rows
+  FOR EACH STATEMENT EXECUTE FUNCTION apply_transaction_rollup_deltas();
@@ -0,0 +1,7 @@
+DROP TRIGGER IF EXISTS transactions_version_delete ON transactions;
+DROP TRIGGER IF EXISTS transactions_version_update ON transactions;
+DROP TRIGGER IF EXISTS transactions_version_insert ON transactions;
+DROP FUNCTION IF EXISTS bump_transaction_owner_versions();
+DROP TRIGGER IF EXISTS users_data_version ON users;
+DROP FUNCTION IF EXISTS bump_user_data_version();
+ALTER TABLE users DROP COLUMN IF EXISTS data_version;
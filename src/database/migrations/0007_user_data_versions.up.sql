@@ -0,0 +1,50 @@
+-- Per-user data version, bumped in the same transaction as every change to a
+-- user's account or transactions (including COPY and batches). Read endpoints
+-- derive their ETags from it, so an unchanged version means unchanged data.
+ALTER TABLE users ADD COLUMN data_version BIGINT NOT NULL DEFAULT 0;
+
+CREATE FUNCTION bump_user_data_version() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+  NEW.data_version := OLD.data_version + 1;
+  RETURN NEW;
+END;
+$$;
+
+CREATE TRIGGER users_data_version
+  BEFORE UPDATE OF username, email, password_hash ON users
+  FOR EACH ROW EXECUTE FUNCTION bump_user_data_version();
+
+CREATE FUNCTION bump_transaction_owner_versions() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+  -- Once per statement and user, however many of their rows changed. Rows
+  -- of a user being deleted match nobody here.
+  IF TG_OP = 'INSERT' THEN
+    UPDATE users SET data_version = data_version + 1
+    WHERE id IN (SELECT user_id FROM new_rows);
+  ELSIF TG_OP = 'UPDATE' THEN
+    UPDATE users SET data_version = data_version + 1
+    WHERE id IN (SELECT user_id FROM new_rows UNION SELECT user_id FROM old_rows);
+  ELSE
+    UPDATE users SET data_version = data_version + 1
+    WHERE id IN (SELECT user_id FROM old_rows);
+  END IF;
+  RETURN NULL;
+END;
+$$;
+
+CREATE TRIGGER transactions_version_insert
+  AFTER INSERT ON transactions
+  REFERENCING NEW TABLE AS new_rows
+  FOR EACH STATEMENT EXECUTE FUNCTION bump_transaction_owner_versions();
+
+CREATE TRIGGER transactions_version_update
+  AFTER UPDATE ON transactions
+  REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+  FOR EACH STATEMENT EXECUTE FUNCTION bump_transaction_owner_versions();
+
+CREATE TRIGGER transactions_version_delete
+  AFTER DELETE ON transactions
+  REFERENCING OLD TABLE AS old_rows
+  FOR EACH STATEMENT EXECUTE FUNCTION bump_transaction_owner_versions();
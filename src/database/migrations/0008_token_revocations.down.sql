@@ -0,0 +1,4 @@
+DROP TRIGGER IF EXISTS users_revoke_tokens ON users;
+DROP FUNCTION IF EXISTS revoke_deleted_user_tokens();
+DROP TABLE IF EXISTS revoked_subjects;
+DROP TABLE IF EXISTS revoked_tokens;
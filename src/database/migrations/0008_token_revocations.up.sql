@@ -0,0 +1,32 @@
+-- Revoked access tokens. Logging out revokes one token by its jti claim;
+-- deleting a user revokes every token issued to them until then. Rows are
+-- only needed until the tokens they revoke expire.
+CREATE TABLE revoked_tokens (
+  jti        UUID PRIMARY KEY,
+  expires_at TIMESTAMPTZ NOT NULL
+);
+
+CREATE INDEX revoked_tokens_expires_at_idx ON revoked_tokens (expires_at);
+
+-- Tokens whose sub is user_id and whose iat is not after revoked_at.
+-- No foreign key: the rows outlive the users they revoke.
+CREATE TABLE revoked_subjects (
+  user_id    INTEGER PRIMARY KEY,
+  revoked_at TIMESTAMPTZ NOT NULL
+);
+
+CREATE INDEX revoked_subjects_revoked_at_idx ON revoked_subjects (revoked_at);
+
+CREATE FUNCTION revoke_deleted_user_tokens() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+  INSERT INTO revoked_subjects (user_id, revoked_at)
+  VALUES (OLD.id, now())
+  ON CONFLICT (user_id) DO UPDATE SET revoked_at = EXCLUDED.revoked_at;
+  RETURN NULL;
+END;
+$$;
+
+CREATE TRIGGER users_revoke_tokens
+  AFTER DELETE ON users
+  FOR EACH ROW EXECUTE FUNCTION revoke_deleted_user_tokens();
@@ -0,0 +1,15 @@
+-- migrate:no-transaction
+CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS users_email_key ON users (email);
+
+DO $$
+BEGIN
+  IF NOT EXISTS (
+    SELECT FROM pg_constraint
+    WHERE conrelid = 'users'::regclass AND conname = 'users_email_key'
+  ) THEN
+    ALTER TABLE users ADD CONSTRAINT users_email_key UNIQUE USING INDEX users_email_key;
+  END IF;
+END
+$$;
+
+DROP INDEX CONCURRENTLY IF EXISTS users_email_lower_key;
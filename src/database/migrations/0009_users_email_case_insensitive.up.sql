@@ -0,0 +1,37 @@
+-- migrate:no-transaction
+-- Emails are unique regardless of case, and logins look them up by
+-- lower(email) through users_email_lower_key.
+
+-- Accounts whose emails differ only in case must be merged first.
+DO $$
+BEGIN
+  IF EXISTS (SELECT FROM users GROUP BY lower(email) HAVING count(*) > 1) THEN
+    RAISE EXCEPTION 'Emails differing only in case: %', (
+      SELECT string_agg(email, ', ' ORDER BY email) FROM users
+      WHERE lower(email) IN (
+        SELECT lower(email) FROM users GROUP BY 1 HAVING count(*) > 1
+      )
+    )
+    USING HINT = 'Merge these accounts, then migrate again.';
+  END IF;
+END
+$$;
+
+-- Rebuilt from scratch: a failed earlier run may have left it INVALID,
+-- which IF NOT EXISTS would accept.
+DROP INDEX CONCURRENTLY IF EXISTS users_email_lower_key;
+
+CREATE UNIQUE INDEX CONCURRENTLY users_email_lower_key ON users (lower(email));
+
+-- Implied by users_email_lower_key, and only dropped once that is valid.
+DO $$
+BEGIN
+  IF NOT EXISTS (
+    SELECT FROM pg_index
+    WHERE indexrelid = to_regclass('users_email_lower_key') AND indisvalid
+  ) THEN
+    RAISE EXCEPTION 'users_email_lower_key is missing or invalid';
+  END IF;
+  ALTER TABLE users DROP CONSTRAINT IF EXISTS users_email_key;
+END
+$$;
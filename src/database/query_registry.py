@@ -0,0 +1,122 @@
+import threading
+from collections import Counter
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from psycopg import AsyncCursor, Cursor, sql
+
+Query = str | sql.SQL | sql.Composed
+
+
+class QueryRegistry:
+    """
+    Named SQL statements, executed as server-side prepared statements.
+
+    Statements are registered once under a name and executed by name, so the
+    exact same query text reaches the server on every call and psycopg can
+    reuse the statement each connection has already prepared. Statements
+    built from a variable shape (e.g. the columns of an UPDATE) are cached
+    per shape with `variant`. Every execution is counted per name.
+    """
+
+    def __init__(self) -> None:
+        self._queries: dict[str, Query] = {}
+        self._prepare: dict[str, bool | None] = {}
+        self._calls: Counter[str] = Counter()
+        self._lock = threading.Lock()
+
+    def register(self, name: str, query: Query, prepare: bool | None = True) -> str:
+        """
+        Register a statement under a unique name.
+
+        Args:
+            name (str): Statement name.
+            query (Query): SQL text or composed statement.
+            prepare (bool | None): Passed to `cursor.execute`. True prepares on
+                first use; None leaves it to the connection's prepare_threshold.
+
+        Returns:
+            str: The name, for use with `execute`.
+
+        Raises:
+            ValueError: If the name is already registered.
+        """
+        with self._lock:
+            if name in self._queries:
+                raise ValueError(f"Query already registered: {name}")
+            self._queries[name] = query
+            self._prepare[name] = prepare
+        return name
+
+    def variant(
+        self,
+        name: str,
+        key: Iterable[str],
+        build: Callable[[], Query],
+        prepare: bool | None = True,
+    ) -> str:
+        """
+        Return the name of the `key` variant of a statement, building it once.
+
+        Args:
+            name (str): Base statement name.
+            key (Iterable[str]): Values identifying the variant; order matters,
+                so pass them sorted when it should not.
+            build (Callable[[], Query]): Builds the statement for this variant.
+            prepare (bool | None): See `register`.
+
+        Returns:
+            str: The variant name, e.g. 'update_user(email,username)'.
+        """
+        full_name = f"{name}({','.join(key)})"
+        with self._lock:
+            if full_name not in self._queries:
+                self._queries[full_name] = build()
+                self._prepare[full_name] = prepare
+        return full_name
+
+    def execute[C: Cursor[Any]](
+        self, cur: C, name: str, params: dict | tuple | None = None
+    ) -> C:
+        """
+        Execute a registered statement and count the call.
+
+        Args:
+            cur (Cursor): Cursor to execute on.
+            name (str): Registered statement name.
+            params (dict | tuple | None): Query parameters.
+
+        Returns:
+            Cursor: The cursor, ready for fetching.
+
+        Raises:
+            KeyError: If no statement is registered under `name`.
+            psycopg.errors.Error: If any database-related error occurs during the query execution.
+        """
+        query = self._queries[name]
+        with self._lock:
+            self._calls[name] += 1
+        return cur.execute(query, params, prepare=self._prepare[name])
+
+    async def aexecute[C: AsyncCursor[Any]](
+        self, cur: C, name: str, params: dict | tuple | None = None
+    ) -> C:
+        """Async counterpart of `execute`, for cursors of async connections."""
+        query = self._queries[name]
+        with self._lock:
+            self._calls[name] += 1
+        return await cur.execute(query, params, prepare=self._prepare[name])
+
+    def stats(self) -> dict[str, int]:
+        """Return the number of executions per statement name, most used first."""
+        with self._lock:
+            return dict(self._calls.most_common())
+
+    def reset_stats(self) -> None:
+        """Reset all call counts to zero."""
+        with self._lock:
+            self._calls.clear()
+
+
+# Shared by all repositories.
+queries = QueryRegistry()
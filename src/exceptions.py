@@ -1,3 +1,5 @@
+import math
+
 from flask import Flask, jsonify, request
 from psycopg import errors
 from pydantic import ValidationError
@@ -33,6 +35,16 @@ class UnsupportedMediaTypeError(AppError):
     pass
 
 
+class ServiceUnavailableError(AppError):
+    pass
+
+
+class TooManyRequestsError(AppError):
+    def __init__(self, message: str, retry_after: float) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
 # Global Error Handlers
 def register_error_handlers(app: Flask) -> None:  # noqa: C901
     # Domain errors
@@ -60,6 +72,19 @@ def register_error_handlers(app: Flask) -> None:  # noqa: C901
     def handle_unsupported_media(e: UnsupportedMediaTypeError) -> tuple[Response, int]:
         return jsonify({"error": str(e)}), 415
 
+    @app.errorhandler(TooManyRequestsError)
+    def handle_too_many_requests(
+        e: TooManyRequestsError,
+    ) -> tuple[Response, int, dict[str, str]]:
+        retry_after = str(math.ceil(e.retry_after))
+        return jsonify({"error": str(e)}), 429, {"Retry-After": retry_after}
+
+    @app.errorhandler(ServiceUnavailableError)
+    def handle_service_unavailable(
+        e: ServiceUnavailableError,
+    ) -> tuple[Response, int, dict[str, str]]:
+        return jsonify({"error": str(e)}), 503, {"Retry-After": "1"}
+
     # Generic fallback
     @app.errorhandler(Exception)
     def handle_generic(e: Exception) -> tuple[Response, int]:
@@ -77,11 +102,22 @@ def register_error_handlers(app: Flask) -> None:  # noqa: C901
         app_error = translate_db_errors(e)
         return jsonify({"error": str(app_error)}), status_code_from_error(app_error)
 
-    # Pre-request hook: enforce JSON payloads
+    # Pre-request hook: enforce JSON payloads (unless the view declares others)
     @app.before_request
     def ensure_json_payload() -> None:
         if request.method in ("POST", "PUT", "PATCH"):
-            if not request.is_json:
+            view = app.view_functions.get(request.endpoint or "")
+            accepted = getattr(view, "accepted_mimetypes", None)
+            if accepted == ():
+                return
+            if accepted:
+                if request.mimetype not in accepted:
+                    raise UnsupportedMediaTypeError(
+                        f"Content-Type must be one of: {', '.join(accepted)}"
+                    )
+                if not request.is_json:
+                    return
+            elif not request.is_json:
                 raise UnsupportedMediaTypeError("Content-Type must be application/json")
             if request.get_json(silent=True) is None:
                 raise UnsupportedMediaTypeError("Request body must contain valid JSON")
@@ -116,7 +152,7 @@ def translate_db_errors(e: Exception) -> AppError:  # noqa PLR0911
 
 
 # Helper: Status codes from AppError
-def status_code_from_error(e: AppError) -> int:
+def status_code_from_error(e: AppError) -> int:  # noqa: PLR0911
     """Return the HTTP status code from an AppError."""
     if isinstance(e, BadRequestError):
         return 400
@@ -128,6 +164,10 @@ def status_code_from_error(e: AppError) -> int:
         return 409
     if isinstance(e, BusinessRuleError):
         return 422
+    if isinstance(e, TooManyRequestsError):
+        return 429
+    if isinstance(e, ServiceUnavailableError):
+        return 503
     return 500
 
 
@@ -0,0 +1,140 @@
+import re
+from datetime import date
+
+from psycopg import sql
+from psycopg.rows import dict_row
+
+from src.database.cache import transaction_cache
+from src.database.db_connection import get_conn
+
+_BOUND_RE = re.compile(r"FROM \('(?P<lower>[\d-]+)'\) TO \('(?P<upper>[\d-]+)'\)")
+
+_COLUMNS = "id, user_id, kind, transaction_date, amount, description"
+
+
+def list_partitions() -> list[dict]:
+    """
+    List the partitions currently attached to the transactions table.
+
+    Returns:
+        list[dict]: Range partitions ordered by lower bound, followed by the
+        default partition.
+
+        [{name, lower, upper},...]
+
+        lower and upper are None for the default partition; upper is exclusive.
+
+    Raises:
+        psycopg.errors.Error: If any database-related error occurs during the query execution.
+    """
+    with get_conn() as conn, conn.cursor(row_factory=dict_row) as cur:
+        cur.execute("""
+            SELECT c.relname AS name, pg_get_expr(c.relpartbound, c.oid) AS bound
+            FROM pg_inherits AS i
+            JOIN pg_class AS c ON c.oid = i.inhrelid
+            WHERE i.inhparent = 'transactions'::regclass""")
+        rows = cur.fetchall()
+    partitions = []
+    for row in rows:
+        match = _BOUND_RE.search(row["bound"])
+        lower = date.fromisoformat(match["lower"]) if match else None
+        upper = date.fromisoformat(match["upper"]) if match else None
+        partitions.append({"name": row["name"], "lower": lower, "upper": upper})
+    return sorted(partitions, key=lambda p: (p["lower"] is None, p["lower"]))
+
+
+def create_partition(name: str, lower: date, upper: date) -> int:
+    """
+    Attach a new range partition covering [lower, upper).
+
+    Rows in that range that had landed in the default partition are moved
+    into the new partition. Rows only change partition, so the rollups stay
+    as they are.
+
+    Args:
+        name (str): Name of the new partition table.
+        lower (date): Inclusive lower bound.
+        upper (date): Exclusive upper bound.
+
+    Returns:
+        int: Number of rows moved out of the default partition.
+
+    Raises:
+        psycopg.errors.Error: If the range overlaps an existing partition or any
+            other database-related error occurs.
+    """
+    params = {"lower": lower, "upper": upper}
+    with get_conn() as conn, conn.cursor() as cur:
+        cur.execute(
+            sql.SQL("""
+                CREATE TEMPORARY TABLE moved_transactions ON COMMIT DROP AS
+                WITH moved AS (
+                  DELETE FROM transactions_default
+                  WHERE transaction_date >= %(lower)s AND transaction_date < %(upper)s
+                  RETURNING {columns}
+                )
+                SELECT * FROM moved""").format(columns=sql.SQL(_COLUMNS)),
+            params,
+        )
+        moved = cur.rowcount
+        cur.execute(
+            sql.SQL(
+                "CREATE TABLE {name} PARTITION OF transactions "
+                "FOR VALUES FROM ({lower}) TO ({upper})"
+            ).format(
+                name=sql.Identifier(name),
+                lower=sql.Literal(lower),
+                upper=sql.Literal(upper),
+            )
+        )
+        cur.execute(
+            sql.SQL(
+                "INSERT INTO {name} ({columns}) SELECT {columns} FROM moved_transactions"
+            ).format(name=sql.Identifier(name), columns=sql.SQL(_COLUMNS))
+        )
+        return moved
+
+
+def detach_partition(name: str, lower: date, upper: date, drop: bool = False) -> int:
+    """
+    Detach a range partition from transactions, keeping or dropping its table.
+
+    The rollups of the months the partition covered are deleted and the data
+    version of every user with rows in it is bumped in the same transaction,
+    so both keep matching the remaining transactions. The transaction cache
+    is cleared once it has committed.
+
+    Args:
+        name (str): Name of the partition table.
+        lower (date): Inclusive lower bound of the partition.
+        upper (date): Exclusive upper bound of the partition.
+        drop (bool): Drop the detached table instead of keeping it as an archive.
+
+    Returns:
+        int: Number of rollup rows deleted.
+
+    Raises:
+        psycopg.errors.Error: If any database-related error occurs during the query execution.
+    """
+    with get_conn() as conn, conn.cursor() as cur:
+        cur.execute(
+            sql.SQL(
+                "UPDATE users SET data_version = data_version + 1 "
+                "WHERE id IN (SELECT user_id FROM {})"
+            ).format(sql.Identifier(name))
+        )
+        cur.execute(
+            sql.SQL("ALTER TABLE transactions DETACH PARTITION {}").format(
+                sql.Identifier(name)
+            )
+        )
+        cur.execute(
+            "DELETE FROM transaction_monthly_rollups "
+            "WHERE month >= %(lower)s AND month < %(upper)s",
+            {"lower": lower, "upper": upper},
+        )
+        deleted = cur.rowcount
+        if drop:
+            cur.execute(sql.SQL("DROP TABLE {}").format(sql.Identifier(name)))
+    transaction_cache.clear()
+    return deleted
@@ -0,0 +1,186 @@
+from uuid import UUID
+
+from src.database.async_connection import get_async_conn
+from src.database.db_connection import get_conn
+from src.database.query_registry import queries
+
+# Revocations are always read from the primary: a replica lagging behind a
+# logout would let the revoked token through.
+
+REVOKE_TOKEN = queries.register(
+    "revoke_token",
+    """
+    INSERT INTO revoked_tokens (jti, expires_at)
+    VALUES (%s, to_timestamp(%s))
+    ON CONFLICT (jti) DO NOTHING;
+    """,
+)
+
+REVOKE_SUBJECT = queries.register(
+    "revoke_subject",
+    """
+    INSERT INTO revoked_subjects (user_id, revoked_at)
+    VALUES (%s, now())
+    ON CONFLICT (user_id) DO UPDATE SET revoked_at = EXCLUDED.revoked_at;
+    """,
+)
+
+# A NULL jti matches no row. A token without iat predates every revocation
+# of its user, so any of them revokes it.
+IS_TOKEN_REVOKED = queries.register(
+    "is_token_revoked",
+    """
+    SELECT EXISTS (SELECT 1 FROM revoked_tokens WHERE jti = %(jti)s)
+        OR EXISTS (
+          SELECT 1 FROM revoked_subjects
+          WHERE user_id = %(sub)s
+            AND (%(iat)s::bigint IS NULL OR revoked_at >= to_timestamp(%(iat)s))
+        );
+    """,
+)
+
+LIST_REVOKED_TOKENS = queries.register(
+    "list_revoked_tokens",
+    "SELECT jti::text FROM revoked_tokens WHERE expires_at > now()",
+)
+
+LIST_REVOKED_SUBJECTS = queries.register(
+    "list_revoked_subjects",
+    """
+    SELECT user_id FROM revoked_subjects
+    WHERE revoked_at > now() - make_interval(secs => %s)
+    """,
+)
+
+
+def revoke_token(jti: UUID | str, exp: int) -> None:
+    """
+    Revoke one access token until it expires.
+
+    Args:
+        jti (UUID | str): The token's jti claim.
+        exp (int): The token's exp claim (Unix time).
+
+    Raises:
+        psycopg.errors.Error: If any database-related error occurs during the query execution.
+    """
+    with get_conn() as conn, conn.cursor() as cur:
+        queries.execute(cur, REVOKE_TOKEN, (jti, exp))
+
+
+def revoke_subject(user_id: int) -> None:
+    """
+    Revoke every access token issued to a user until now.
+
+    Args:
+        user_id (int): The tokens' sub claim.
+
+    Raises:
+        psycopg.errors.Error: If any database-related error occurs during the query execution.
+    """
+    with get_conn() as conn, conn.cursor() as cur:
+        queries.execute(cur, REVOKE_SUBJECT, (user_id,))
+
+
+def is_token_revoked(jti: UUID | str | None, sub: int, iat: int | None) -> bool:
+    """
+    Check whether a token was revoked, by itself or with all of its user's tokens.
+
+    Args:
+        jti (UUID | str | None): The token's jti claim, if it has one.
+        sub (int): The token's sub claim (user ID).
+        iat (int | None): The token's iat claim (Unix time), if it has one.
+
+    Returns:
+        bool: True if the token is revoked.
+
+    Raises:
+        psycopg.errors.Error: If any database-related error occurs during the query execution.
+    """
+    with get_conn() as conn, conn.cursor() as cur:
+        queries.execute(cur, IS_TOKEN_REVOKED, {"jti": jti, "sub": sub, "iat": iat})
+        row = cur.fetchone()
+    return row is not None and bool(row[0])
+
+
+def list_revocations(max_token_age: int) -> tuple[list[str], list[int]]:
+    """
+    List the revocations that can still affect unexpired tokens.
+
+    Args:
+        max_token_age (int): Lifetime of access tokens in seconds; users
+            revoked longer ago than that have no unexpired tokens left.
+
+    Returns:
+        tuple[list[str], list[int]]: Revoked token jtis and revoked user IDs.
+
+    Raises:
+        psycopg.errors.Error: If any database-related error occurs during the query execution.
+    """
+    with get_conn() as conn, conn.cursor() as cur:
+        queries.execute(cur, LIST_REVOKED_TOKENS)
+        jtis = [row[0] for row in cur.fetchall()]
+        queries.execute(cur, LIST_REVOKED_SUBJECTS, (max_token_age,))
+        user_ids = [row[0] for row in cur.fetchall()]
+    return jtis, user_ids
+
+
+def purge_revocations(max_token_age: int) -> int:
+    """
+    Delete the revocations of tokens that have expired since.
+
+    Args:
+        max_token_age (int): Lifetime of access tokens in seconds.
+
+    Returns:
+        int: Number of rows deleted.
+
+    Raises:
+        psycopg.errors.Error: If any database-related error occurs during the query execution.
+    """
+    with get_conn() as conn, conn.cursor() as cur:
+        cur.execute("DELETE FROM revoked_tokens WHERE expires_at <= now()")
+        deleted = cur.rowcount
+        cur.execute(
+            "DELETE FROM revoked_subjects "
+            "WHERE revoked_at <= now() - make_interval(secs => %s)",
+            (max_token_age,),
+        )
+        return deleted + cur.rowcount
+
+
+# Async counterparts, used by the async views (see `create_app`).
+
+
+async def revoke_token_async(jti: UUID | str, exp: int) -> None:
+    """Async counterpart of `revoke_token`."""
+    async with get_async_conn() as conn, conn.cursor() as cur:
+        await queries.aexecute(cur, REVOKE_TOKEN, (jti, exp))
+
+
+async def revoke_subject_async(user_id: int) -> None:
+    """Async counterpart of `revoke_subject`."""
+    async with get_async_conn() as conn, conn.cursor() as cur:
+        await queries.aexecute(cur, REVOKE_SUBJECT, (user_id,))
+
+
+async def is_token_revoked_async(
+    jti: UUID | str | None, sub: int, iat: int | None
+) -> bool:
+    """Async counterpart of `is_token_revoked`."""
+    async with get_async_conn() as conn, conn.cursor() as cur:
+        await queries.aexecute(
+            cur, IS_TOKEN_REVOKED, {"jti": jti, "sub": sub, "iat": iat}
+        )
+        row = await cur.fetchone()
+    return row is not None and bool(row[0])
+
+
+async def list_revocations_async(max_token_age: int) -> tuple[list[str], list[int]]:
+    """Async counterpart of `list_revocations`."""
+    async with get_async_conn() as conn, conn.cursor() as cur:
+        await queries.aexecute(cur, LIST_REVOKED_TOKENS)
+        jtis = [row[0] for row in await cur.fetchall()]
+        await queries.aexecute(cur, LIST_REVOKED_SUBJECTS, (max_token_age,))
+        user_ids = [row[0] for row in await cur.fetchall()]
+    return jtis, user_ids
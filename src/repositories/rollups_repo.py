@@ -0,0 +1,147 @@
+from datetime import date
+
+from psycopg import sql
+from psycopg.rows import dict_row
+
+from src.database.async_connection import get_async_read_conn
+from src.database.db_connection import get_conn, get_read_conn
+
+# Recomputes the rollups from the transactions table.
+_RECOMPUTE_QUERY = """
+    SELECT user_id, date_trunc('month', transaction_date::timestamp)::date AS month,
+           kind, SUM(amount) AS total, COUNT(*)::integer AS tx_count
+    FROM transactions
+    GROUP BY 1, 2, 3
+    """
+
+
+def _rollup_summary_query(date_from: date | None, date_to: date | None) -> sql.Composed:
+    """Build the rollup summary query for the given date bounds."""
+    conditions = [sql.SQL("user_id = %(user_id)s")]
+    if date_from is not None:
+        conditions.append(sql.SQL("month >= %(date_from)s"))
+    if date_to is not None:
+        conditions.append(sql.SQL("month <= %(date_to)s"))
+    return sql.SQL("""
+        SELECT date_trunc(%(group_by)s, month::timestamp)::date AS period,
+               COALESCE(SUM(total) FILTER (WHERE kind = 'income'), 0) AS income,
+               COALESCE(SUM(total) FILTER (WHERE kind = 'expense'), 0) AS expense,
+               COALESCE(SUM(CASE WHEN kind = 'income' THEN total ELSE -total END), 0)
+                 AS net,
+               SUM(tx_count) AS count,
+               COALESCE(SUM(tx_count) FILTER (WHERE kind = 'income'), 0) AS income_count,
+               COALESCE(SUM(tx_count) FILTER (WHERE kind = 'expense'), 0)
+                 AS expense_count,
+               NULL::numeric AS expense_p50,
+               NULL::numeric AS expense_p90
+        FROM transaction_monthly_rollups
+        WHERE {conditions}
+        GROUP BY period
+        ORDER BY period""").format(conditions=sql.SQL(" AND ").join(conditions))
+
+
+def get_rollup_summary(
+    user_id: int, group_by: str, date_from: date | None, date_to: date | None
+) -> list[dict]:
+    """
+    Aggregate a user's monthly rollups into income/expense totals per period.
+
+    Reads O(months) rollup rows instead of scanning transactions. Percentiles
+    cannot be derived from rollups and are returned as None.
+
+    Args:
+        user_id (int): User ID.
+        group_by (str): Period to bucket by ('month' or 'year').
+        date_from (date | None): First day of the first month to include.
+        date_to (date | None): Any day of the last month to include.
+
+    Returns:
+        list[dict]: One row per non-empty period, ordered by period, with the
+        same keys as `get_transaction_summary`.
+
+    Raises:
+        psycopg.errors.Error: If any database-related error occurs during the query execution.
+    """
+    query = _rollup_summary_query(date_from, date_to)
+    params = {
+        "user_id": user_id,
+        "group_by": group_by,
+        "date_from": date_from,
+        "date_to": date_to,
+    }
+    with get_read_conn(user_id) as conn, conn.cursor(row_factory=dict_row) as cur:
+        cur.execute(query, params)
+        return cur.fetchall()
+
+
+async def get_rollup_summary_async(
+    user_id: int, group_by: str, date_from: date | None, date_to: date | None
+) -> list[dict]:
+    """Async counterpart of `get_rollup_summary`."""
+    params = {
+        "user_id": user_id,
+        "group_by": group_by,
+        "date_from": date_from,
+        "date_to": date_to,
+    }
+    async with (
+        get_async_read_conn(user_id) as conn,
+        conn.cursor(row_factory=dict_row) as cur,
+    ):
+        await cur.execute(_rollup_summary_query(date_from, date_to), params)
+        return await cur.fetchall()
+
+
+def find_rollup_drift() -> list[dict]:
+    """
+    Compare stored rollups against a full recomputation from transactions.
+
+    Returns:
+        list[dict]: Keys whose stored and recomputed values differ.
+
+        [{user_id, month, kind, stored_total, stored_count, actual_total,
+        actual_count},...]
+
+        []: If the rollups are consistent.
+
+    Raises:
+        psycopg.errors.Error: If any database-related error occurs during the query execution.
+    """
+    query = f"""
+        SELECT COALESCE(r.user_id, a.user_id) AS user_id,
+               COALESCE(r.month, a.month) AS month,
+               COALESCE(r.kind, a.kind) AS kind,
+               r.total AS stored_total, r.tx_count AS stored_count,
+               a.total AS actual_total, a.tx_count AS actual_count
+        FROM transaction_monthly_rollups AS r
+        FULL JOIN ({_RECOMPUTE_QUERY}) AS a
+          ON a.user_id = r.user_id AND a.month = r.month AND a.kind = r.kind
+        WHERE r.total IS DISTINCT FROM a.total
+           OR r.tx_count IS DISTINCT FROM a.tx_count
+        ORDER BY 1, 2, 3"""  # noqa: S608
+    with get_conn() as conn, conn.cursor(row_factory=dict_row) as cur:
+        cur.execute(query)
+        return cur.fetchall()
+
+
+def rebuild_rollups() -> int:
+    """
+    Recompute all rollups from scratch.
+
+    Writes to transactions are blocked while the rebuild runs, so no
+    concurrent change can be lost.
+
+    Returns:
+        int: Number of rollup rows written.
+
+    Raises:
+        psycopg.errors.Error: If any database-related error occurs during the query execution.
+    """
+    with get_conn() as conn, conn.cursor() as cur:
+        cur.execute("LOCK TABLE transactions IN SHARE MODE")
+        cur.execute("DELETE FROM transaction_monthly_rollups")
+        cur.execute(
+            "INSERT INTO transaction_monthly_rollups "
+            f"(user_id, month, kind, total, tx_count) {_RECOMPUTE_QUERY}"
+        )
+        return cur.rowcount
@@ -1,11 +1,217 @@
+from collections.abc import Iterable, Iterator
+from datetime import date
+from decimal import Decimal
+from typing import cast
+
 from psycopg import sql
 from psycopg.rows import dict_row
 
-from src.database.db_connection import get_conn
+from src.config import settings
+from src.database.async_connection import get_async_conn, get_async_read_conn
+from src.database.cache import transaction_cache
+from src.database.db_connection import get_conn, get_read_conn
+from src.database.query_registry import queries
+
+INSERT_TRANSACTION = queries.register(
+    "insert_transaction",
+    """
+    INSERT INTO transactions (user_id, kind, transaction_date, amount, description)
+    VALUES (%(user_id)s, %(kind)s, %(transaction_date)s, %(amount)s, %(description)s)
+    RETURNING id, kind, transaction_date, amount, description;
+    """,
+)
+
+# The owner's data version is read with the row, so that the row is cached
+# under the version it was read at (see `RecordCache`). A missing transaction
+# comes back as NULL columns, an unknown user as no row.
+GET_TRANSACTION = queries.register(
+    "get_transaction",
+    """
+    SELECT u.data_version, t.id, t.kind, t.transaction_date, t.amount,
+           t.description
+    FROM users u
+    LEFT JOIN transactions t
+      ON t.id = %(transaction_id)s AND t.user_id = u.id
+    WHERE u.id = %(user_id)s;
+    """,
+)
+
+DELETE_TRANSACTION = queries.register(
+    "delete_transaction",
+    """
+    DELETE FROM transactions
+    WHERE id = %(transaction_id)s AND user_id = %(user_id)s
+    RETURNING id;
+    """,
+)
+
+SET_SIMILARITY_THRESHOLD = queries.register(
+    "set_similarity_threshold",
+    "SELECT set_config('pg_trgm.word_similarity_threshold', %s, true)",
+)
+
+
+# Filter name -> predicate; values are always passed as query parameters.
+TRANSACTION_FILTERS = {
+    "date_from": sql.SQL("transaction_date >= %(date_from)s"),
+    "date_to": sql.SQL("transaction_date <= %(date_to)s"),
+    "kind": sql.SQL("kind = %(kind)s"),
+    "min_amount": sql.SQL("amount >= %(min_amount)s"),
+    "max_amount": sql.SQL("amount <= %(max_amount)s"),
+}
+
+# Sort name -> column; a leading '-' means descending. Ties are broken by id.
+TRANSACTION_SORTS = {"date": "transaction_date", "amount": "amount"}
+
+# Rank expression and match predicate of each search strategy. Both
+# predicates are served by GIN indexes on (user_id, ...).
+TRANSACTION_SEARCHES = {
+    "fulltext": (
+        sql.SQL("ts_rank_cd(description_tsv, websearch_to_tsquery('english', %(q)s))"),
+        sql.SQL("description_tsv @@ websearch_to_tsquery('english', %(q)s)"),
+    ),
+    "fuzzy": (
+        sql.SQL("word_similarity(%(q)s, description)"),
+        sql.SQL("%(q)s <%% description"),
+    ),
+}
+
+# Per-period totals; {where} is filled in by _where_clause.
+TRANSACTION_SUMMARY_QUERY = sql.SQL("""
+        SELECT date_trunc(%(group_by)s, transaction_date::timestamp)::date AS period,
+               COALESCE(SUM(amount) FILTER (WHERE kind = 'income'), 0) AS income,
+               COALESCE(SUM(amount) FILTER (WHERE kind = 'expense'), 0) AS expense,
+               COALESCE(SUM(CASE WHEN kind = 'income' THEN amount ELSE -amount END), 0)
+                 AS net,
+               COUNT(*) AS count,
+               COUNT(*) FILTER (WHERE kind = 'income') AS income_count,
+               COUNT(*) FILTER (WHERE kind = 'expense') AS expense_count,
+               round(percentile_cont(0.5) WITHIN GROUP (ORDER BY amount)
+                     FILTER (WHERE kind = 'expense')::numeric, 2) AS expense_p50,
+               round(percentile_cont(0.9) WITHIN GROUP (ORDER BY amount)
+                     FILTER (WHERE kind = 'expense')::numeric, 2) AS expense_p90
+        FROM transactions
+        WHERE {where}
+        GROUP BY period
+        ORDER BY period""")
+
+
+def _where_clause(filters: dict) -> sql.Composed:
+    """Build a user-scoped WHERE condition from the non-None filters."""
+    conditions = [sql.SQL("user_id = %(user_id)s")]
+    conditions += [
+        TRANSACTION_FILTERS[name]
+        for name, value in filters.items()
+        if value is not None
+    ]
+    return sql.SQL(" AND ").join(conditions)
+
+
+def _filter_key(filters: dict) -> list[str]:
+    """Names of the non-None filters, identifying the shape of the WHERE clause."""
+    return sorted(name for name, value in filters.items() if value is not None)
+
+
+def _update_transaction_query(columns: Iterable[str]) -> str:
+    """Return the registered UPDATE statement setting the given columns."""
+    columns = sorted(columns)
+
+    def build() -> sql.Composed:
+        set_parts = [
+            sql.SQL("{} = %({})s").format(sql.Identifier(col), sql.SQL(col))
+            for col in columns
+        ]
+        return sql.SQL("""UPDATE transactions
+                          SET {set_clause}
+                          WHERE id = %(transaction_id)s AND user_id = %(user_id)s
+                          RETURNING id, kind, transaction_date, amount, description;
+                       """).format(set_clause=sql.SQL(", ").join(set_parts))
+
+    return queries.variant("update_transaction", columns, build)
+
+
+def _list_query(sort: str, has_after: bool, filters: dict) -> str:
+    """Return the registered page query for a sort, keyset position and filter set."""
+    column = sql.Identifier(TRANSACTION_SORTS[sort.lstrip("-")])
+    descending = sort.startswith("-")
+
+    def build() -> sql.Composed:
+        where = _where_clause(filters)
+        if has_after:
+            operator = sql.SQL("<" if descending else ">")
+            keyset = sql.SQL("({}, id) {} (%(after_value)s, %(after_id)s)").format(
+                column, operator
+            )
+            where = sql.SQL(" AND ").join([where, keyset])
+        direction = sql.SQL("DESC" if descending else "ASC")
+        return sql.SQL("""SELECT id, kind, transaction_date, amount, description
+                          FROM transactions
+                          WHERE {where}
+                          ORDER BY {column} {direction}, id {direction}
+                          LIMIT %(limit)s""").format(
+            where=where, column=column, direction=direction
+        )
+
+    key = [sort, "after" if has_after else "first", *_filter_key(filters)]
+    return queries.variant("list_transactions", key, build, prepare=None)
+
+
+def _summary_query(filters: dict) -> str:
+    """Return the registered summary query for a date filter set."""
+    return queries.variant(
+        "transaction_summary",
+        _filter_key(filters),
+        lambda: TRANSACTION_SUMMARY_QUERY.format(where=_where_clause(filters)),
+        prepare=None,
+    )
+
+
+def _search_query(match: str, has_after: bool) -> str:
+    """Return the registered search query for a strategy and keyset position."""
+    rank, predicate = TRANSACTION_SEARCHES[match]
+
+    def build() -> sql.Composed:
+        keyset = sql.SQL("TRUE")
+        if has_after:
+            keyset = sql.SQL("(rank, id) < (%(after_rank)s::real, %(after_id)s)")
+        return sql.SQL("""
+            SELECT id, kind, transaction_date, amount, description, rank
+            FROM (SELECT id, kind, transaction_date, amount, description,
+                         {rank} AS rank
+                  FROM transactions
+                  WHERE user_id = %(user_id)s AND {predicate}) AS hits
+            WHERE {keyset}
+            ORDER BY rank DESC, id DESC
+            LIMIT %(limit)s""").format(rank=rank, predicate=predicate, keyset=keyset)
+
+    key = [match, "after" if has_after else "first"]
+    return queries.variant("search_transactions", key, build)
+
+
+def _batch_query(op: str, data: dict) -> str:
+    """Return the registered statement applying one batch operation."""
+    if op == "create":
+        return INSERT_TRANSACTION
+    if op == "patch":
+        return _update_transaction_query(data)
+    return DELETE_TRANSACTION
+
+
+def _invalidate_batch(
+    user_id: int, operations: list[tuple[str, int | None, dict]]
+) -> None:
+    """Drop the cached copies of the transactions a batch patched or deleted."""
+    transaction_cache.invalidate(
+        *((user_id, tid) for op, tid, _data in operations if op != "create")
+    )
 
 
 def insert_transaction(
-    user_id: int, kind: str, transaction_date: str, amount: float, description: str
+    user_id: int,
+    kind: str,
+    transaction_date: date,
+    amount: Decimal,
+    description: str,
 ) -> dict:
     """
     Insert a transaction into the database.
@@ -13,8 +219,8 @@ def insert_transaction(
     Args:
         user_id (int): User ID.
         kind (str): Transaction kind (expense, income).
-        transaction_date (str): Transaction date.
-        amount (float): Transaction amount.
+        transaction_date (date): Transaction date.
+        amount (Decimal): Transaction amount.
         description (str): Transaction description.
 
     Returns:
@@ -25,23 +231,70 @@ def insert_transaction(
     Raises:
         psycopg.errors.Error: If any database-related error occurs during the query execution.
     """
-    query = """
-            INSERT INTO transactions (user_id, kind, transaction_date, amount, description)
-            VALUES (%s, %s, %s, %s, %s)
-            RETURNING id, kind, transaction_date, amount, description;
-            """
+    params = {
+        "user_id": user_id,
+        "kind": kind,
+        "transaction_date": transaction_date,
+        "amount": amount,
+        "description": description,
+    }
     with get_conn() as conn, conn.cursor(row_factory=dict_row) as cur:
-        cur.execute(query, (user_id, kind, transaction_date, amount, description))
-        return cur.fetchone()
+        queries.execute(cur, INSERT_TRANSACTION, params)
+        return cast(dict, cur.fetchone())
+
+
+def copy_transactions(user_id: int, rows: Iterable[tuple]) -> int:
+    """
+    Bulk insert transactions with COPY FROM STDIN in a single transaction.
+
+    `rows` is consumed lazily while the COPY is in progress. If iterating it
+    raises, the COPY is aborted and nothing is inserted.
+
+    Args:
+        user_id (int): User ID.
+        rows (Iterable[tuple]): (kind, transaction_date, amount, description) tuples.
 
+    Returns:
+        int: Number of inserted transactions.
 
-def get_transaction_by_id(user_id: int, transaction_id: int) -> dict | None:
+    Raises:
+        psycopg.errors.Error: If any database-related error occurs during the query execution.
+    """
+    query = """COPY transactions (user_id, kind, transaction_date, amount, description)
+               FROM STDIN"""
+    count = 0
+    with get_conn() as conn, conn.cursor() as cur, cur.copy(query) as copy:
+        for row in rows:
+            copy.write_row((user_id, *row))
+            count += 1
+    return count
+
+
+def _cache_transaction(
+    key: tuple[int, int], row: dict | None, data_version: int | None
+) -> dict | None:
+    """Cache a GET_TRANSACTION row under its own version; return the transaction."""
+    if row is None:
+        return None
+    row_version = row.pop("data_version")
+    transaction = row if row["id"] is not None else None
+    if data_version is not None:
+        transaction_cache.set(key, transaction, row_version)
+    return transaction
+
+
+def get_transaction_by_id(
+    user_id: int, transaction_id: int, data_version: int | None = None
+) -> dict | None:
     """
-    Get transaction data by from the database.
+    Get transaction data from the cache or the database.
 
     Args:
         user_id (int): User ID.
         transaction_id (int): Transaction ID.
+        data_version (int | None): The user's data version, read before
+            this call. Without it the cache is not used. A row read from
+            the database is cached under the version read along with it.
 
     Returns:
           dict: Transaction data.
@@ -53,20 +306,40 @@ def get_transaction_by_id(user_id: int, transaction_id: int) -> dict | None:
     Raises:
         psycopg.errors.Error: If any database-related error occurs during the query execution.
     """
-    query = """SELECT id, kind, transaction_date, amount, description
-               FROM transactions
-               WHERE id = (%s) AND user_id = (%s);"""
-    with get_conn() as conn, conn.cursor(row_factory=dict_row) as cur:
-        cur.execute(query, (transaction_id, user_id))
-        return cur.fetchone()
-
-
-def get_all_transactions(user_id: int) -> list[dict]:
+    key = (user_id, transaction_id)
+    if data_version is not None:
+        cached = transaction_cache.get(key, data_version)
+        if cached is not None:
+            return cached
+    params = {"transaction_id": transaction_id, "user_id": user_id}
+    with get_read_conn(user_id) as conn, conn.cursor(row_factory=dict_row) as cur:
+        queries.execute(cur, GET_TRANSACTION, params)
+        row = cur.fetchone()
+    return _cache_transaction(key, row, data_version)
+
+
+def get_all_transactions(
+    user_id: int,
+    limit: int,
+    after: tuple[date | Decimal, int] | None = None,
+    sort: str = "date",
+    filters: dict | None = None,
+) -> list[dict]:
     """
-    Get all transactions data from the database.
+    Get one filtered, sorted page of transactions data from the database.
+
+    Pages are fetched by keyset on (sort column, id), and the filters and
+    sort orders are backed by (user_id, ...) indexes, so every page costs
+    about the same regardless of how deep into the ledger it is.
 
     Args:
         user_id (int): User ID.
+        limit (int): Maximum number of rows to return.
+        after (tuple[date | Decimal, int] | None): Sort key (sort column value, id)
+            of the last row of the previous page. None starts from the beginning.
+        sort (str): 'date', '-date', 'amount' or '-amount'.
+        filters (dict | None): Optional date_from, date_to, kind, min_amount and
+            max_amount values (see TRANSACTION_FILTERS). None values are ignored.
 
     Returns:
         list[dict]: List of dictionaries containing transaction information.
@@ -75,20 +348,134 @@ def get_all_transactions(user_id: int) -> list[dict]:
 
         []: If no transactions exist.
 
+    Raises:
+        psycopg.errors.Error: If any database-related error occurs during the query execution.
+    """
+    filters = filters or {}
+    query = _list_query(sort, after is not None, filters)
+    params = {**filters, "user_id": user_id, "limit": limit}
+    if after is not None:
+        params["after_value"], params["after_id"] = after
+    with get_read_conn(user_id) as conn, conn.cursor(row_factory=dict_row) as cur:
+        queries.execute(cur, query, params)
+        return cur.fetchall()
+
+
+def get_transaction_summary(
+    user_id: int, group_by: str, date_from: date | None, date_to: date | None
+) -> list[dict]:
+    """
+    Aggregate a user's transactions into income/expense totals per period.
+
+    Everything is computed in the database; only one row per period is
+    transferred.
+
+    Args:
+        user_id (int): User ID.
+        group_by (str): Period to bucket by ('day', 'week', 'month' or 'year').
+        date_from (date | None): Inclusive lower bound on transaction_date.
+        date_to (date | None): Inclusive upper bound on transaction_date.
+
+    Returns:
+        list[dict]: One row per non-empty period, ordered by period.
+
+        [{period, income, expense, net, count, income_count, expense_count,
+        expense_p50, expense_p90},...]
+
+        []: If no transactions match.
+
+    Raises:
+        psycopg.errors.Error: If any database-related error occurs during the query execution.
+    """
+    filters = {"date_from": date_from, "date_to": date_to}
+    query = _summary_query(filters)
+    params = {**filters, "user_id": user_id, "group_by": group_by}
+    with get_read_conn(user_id) as conn, conn.cursor(row_factory=dict_row) as cur:
+        queries.execute(cur, query, params)
+        return cur.fetchall()
+
+
+def search_transactions(
+    user_id: int,
+    q: str,
+    match: str,
+    limit: int,
+    after: tuple[float, int] | None = None,
+) -> list[dict]:
+    """
+    Get one page of a user's transactions whose description matches `q`.
+
+    Matches are found through GIN indexes, so the cost depends on the number
+    of matches rather than on the size of the ledger. Pages are fetched by
+    keyset on (rank, id), best match first. Fuzzy matches need a word
+    similarity of at least `settings.SEARCH_SIMILARITY_THRESHOLD`.
+
+    Args:
+        user_id (int): User ID.
+        q (str): Search text.
+        match (str): 'fulltext' (stemmed words, web search syntax) or 'fuzzy'
+            (trigram word similarity, tolerates typos).
+        limit (int): Maximum number of rows to return.
+        after (tuple[float, int] | None): Sort key (rank, id) of the last row of
+            the previous page. None starts from the best match.
+
+    Returns:
+        list[dict]: List of dictionaries containing transaction information.
+
+        [{id, kind, transaction_date, amount, description, rank},...]
+
+        []: If nothing matches.
+
+    Raises:
+        psycopg.errors.Error: If any database-related error occurs during the query execution.
+    """
+    query = _search_query(match, after is not None)
+    params = {"user_id": user_id, "q": q, "limit": limit}
+    if after is not None:
+        params["after_rank"], params["after_id"] = after
+    with get_read_conn(user_id) as conn, conn.cursor(row_factory=dict_row) as cur:
+        if match == "fuzzy":
+            queries.execute(
+                cur,
+                SET_SIMILARITY_THRESHOLD,
+                (str(settings.SEARCH_SIMILARITY_THRESHOLD),),
+            )
+        queries.execute(cur, query, params)
+        return cur.fetchall()
+
+
+def iter_transactions(user_id: int, itersize: int) -> Iterator[tuple]:
+    """
+    Stream all transactions of a user from a server-side cursor.
+
+    Rows are fetched from the database `itersize` at a time, so memory use
+    does not depend on the size of the ledger. The pooled connection is held
+    until the iterator is exhausted or closed.
+
+    Args:
+        user_id (int): User ID.
+        itersize (int): Number of rows fetched per network round trip.
+
+    Yields:
+        tuple: (id, kind, transaction_date, amount, description) ordered by
+        transaction date.
+
     Raises:
         psycopg.errors.Error: If any database-related error occurs during the query execution.
     """
     query = """SELECT id, kind, transaction_date, amount, description
                FROM transactions
-               WHERE user_id = (%s)"""
-    with get_conn() as conn, conn.cursor(row_factory=dict_row) as cur:
+               WHERE user_id = %s
+               ORDER BY transaction_date, id"""
+    with get_read_conn(user_id) as conn, conn.cursor(name="transactions_export") as cur:
+        cur.itersize = itersize
         cur.execute(query, (user_id,))
-        return cur.fetchall()
+        yield from cur
 
 
 def update_transaction(user_id: int, transaction_id: int, data: dict) -> dict | None:
     """
-    Updates transaction fields in the database.
+    Updates transaction fields in the database and drops the cached copy.
 
     Args:
         user_id (int): User ID.
@@ -105,24 +492,17 @@ def update_transaction(user_id: int, transaction_id: int, data: dict) -> dict |
     Raises:
         psycopg.errors.Error: If any database-related error occurs during the query execution.
     """
-    set_parts = [
-        sql.SQL("{} = %({})s").format(sql.Identifier(col), sql.SQL(col)) for col in data
-    ]
-    set_clause = sql.SQL(", ").join(set_parts)
     params = {**data, "transaction_id": transaction_id, "user_id": user_id}
-    query = sql.SQL("""UPDATE transactions
-                       SET {set_clause}
-                       WHERE id = %(transaction_id)s AND user_id = %(user_id)s
-                       RETURNING id, kind, transaction_date, amount, description;
-                    """).format(set_clause=set_clause)
     with get_conn() as conn, conn.cursor(row_factory=dict_row) as cur:
-        cur.execute(query, params)
-        return cur.fetchone()
+        queries.execute(cur, _update_transaction_query(data), params)
+        updated = cur.fetchone()
+    transaction_cache.invalidate((user_id, transaction_id))
+    return updated
 
 
 def erase_transaction(user_id: int, transaction_id: int) -> dict | None:
     """
-    Deletes a transaction from the database.
+    Deletes a transaction from the database and drops the cached copy.
 
     Args:
         user_id (int): User ID.
@@ -136,9 +516,195 @@ def erase_transaction(user_id: int, transaction_id: int) -> dict | None:
     Raises:
         psycopg.errors.Error: If any database-related error occurs during the query execution.
     """
-    query = (
-        """DELETE FROM transactions WHERE id = (%s) AND user_id = (%s) RETURNING id"""
-    )
+    params = {"transaction_id": transaction_id, "user_id": user_id}
     with get_conn() as conn, conn.cursor(row_factory=dict_row) as cur:
-        cur.execute(query, (transaction_id, user_id))
-        return cur.fetchone()
+        queries.execute(cur, DELETE_TRANSACTION, params)
+        deleted = cur.fetchone()
+    transaction_cache.invalidate((user_id, transaction_id))
+    return deleted
+
+
+def apply_transaction_batch(
+    user_id: int, operations: list[tuple[str, int | None, dict]]
+) -> list[dict | None]:
+    """
+    Apply create, patch and delete operations in one round trip and one transaction.
+
+    All statements are sent through a single pooled connection in pipeline
+    mode, so the batch costs one network round trip instead of one per
+    operation. If any patch or delete targets a missing transaction, the
+    whole batch is rolled back. Patched and deleted transactions are dropped
+    from the cache.
+
+    Args:
+        user_id (int): User ID.
+        operations (list[tuple[str, int | None, dict]]): (op, transaction_id, data)
+            tuples, where op is 'create', 'patch' or 'delete'. transaction_id is
+            None for creates; data is empty for deletes.
+
+    Returns:
+        list[dict | None]: One result per operation, in order. Created or patched
+        transaction data, or {id} for deletes.
+
+        None: For operations whose transaction does not exist (batch rolled back).
+
+    Raises:
+        psycopg.errors.Error: If any database-related error occurs during the query execution.
+    """
+    with get_conn() as conn:
+        cursors = []
+        with conn.pipeline():
+            for op, transaction_id, data in operations:
+                params = {**data, "user_id": user_id, "transaction_id": transaction_id}
+                cur = conn.cursor(row_factory=dict_row)
+                queries.execute(cur, _batch_query(op, data), params)
+                cursors.append(cur)
+        results = [cur.fetchone() for cur in cursors]
+        if any(result is None for result in results):
+            conn.rollback()
+    _invalidate_batch(user_id, operations)
+    return results
+
+
+# Async counterparts of the request-path functions above, used by the async
+# views (see `create_app`). They run the same registered statements.
+
+
+async def insert_transaction_async(
+    user_id: int,
+    kind: str,
+    transaction_date: date,
+    amount: Decimal,
+    description: str,
+) -> dict:
+    """Async counterpart of `insert_transaction`."""
+    params = {
+        "user_id": user_id,
+        "kind": kind,
+        "transaction_date": transaction_date,
+        "amount": amount,
+        "description": description,
+    }
+    async with get_async_conn() as conn, conn.cursor(row_factory=dict_row) as cur:
+        await queries.aexecute(cur, INSERT_TRANSACTION, params)
+        return cast(dict, await cur.fetchone())
+
+
+async def get_transaction_by_id_async(
+    user_id: int, transaction_id: int, data_version: int | None = None
+) -> dict | None:
+    """Async counterpart of `get_transaction_by_id`."""
+    key = (user_id, transaction_id)
+    if data_version is not None:
+        cached = transaction_cache.get(key, data_version)
+        if cached is not None:
+            return cached
+    params = {"transaction_id": transaction_id, "user_id": user_id}
+    async with (
+        get_async_read_conn(user_id) as conn,
+        conn.cursor(row_factory=dict_row) as cur,
+    ):
+        await queries.aexecute(cur, GET_TRANSACTION, params)
+        row = await cur.fetchone()
+    return _cache_transaction(key, row, data_version)
+
+
+async def get_all_transactions_async(
+    user_id: int,
+    limit: int,
+    after: tuple[date | Decimal, int] | None = None,
+    sort: str = "date",
+    filters: dict | None = None,
+) -> list[dict]:
+    """Async counterpart of `get_all_transactions`."""
+    filters = filters or {}
+    query = _list_query(sort, after is not None, filters)
+    params = {**filters, "user_id": user_id, "limit": limit}
+    if after is not None:
+        params["after_value"], params["after_id"] = after
+    async with (
+        get_async_read_conn(user_id) as conn,
+        conn.cursor(row_factory=dict_row) as cur,
+    ):
+        await queries.aexecute(cur, query, params)
+        return await cur.fetchall()
+
+
+async def get_transaction_summary_async(
+    user_id: int, group_by: str, date_from: date | None, date_to: date | None
+) -> list[dict]:
+    """Async counterpart of `get_transaction_summary`."""
+    filters = {"date_from": date_from, "date_to": date_to}
+    params = {**filters, "user_id": user_id, "group_by": group_by}
+    async with (
+        get_async_read_conn(user_id) as conn,
+        conn.cursor(row_factory=dict_row) as cur,
+    ):
+        await queries.aexecute(cur, _summary_query(filters), params)
+        return await cur.fetchall()
+
+
+async def search_transactions_async(
+    user_id: int,
+    q: str,
+    match: str,
+    limit: int,
+    after: tuple[float, int] | None = None,
+) -> list[dict]:
+    """Async counterpart of `search_transactions`."""
+    params = {"user_id": user_id, "q": q, "limit": limit}
+    if after is not None:
+        params["after_rank"], params["after_id"] = after
+    async with (
+        get_async_read_conn(user_id) as conn,
+        conn.cursor(row_factory=dict_row) as cur,
+    ):
+        if match == "fuzzy":
+            await queries.aexecute(
+                cur,
+                SET_SIMILARITY_THRESHOLD,
+                (str(settings.SEARCH_SIMILARITY_THRESHOLD),),
+            )
+        await queries.aexecute(cur, _search_query(match, after is not None), params)
+        return await cur.fetchall()
+
+
+async def update_transaction_async(
+    user_id: int, transaction_id: int, data: dict
+) -> dict | None:
+    """Async counterpart of `update_transaction`."""
+    params = {**data, "transaction_id": transaction_id, "user_id": user_id}
+    async with get_async_conn() as conn, conn.cursor(row_factory=dict_row) as cur:
+        await queries.aexecute(cur, _update_transaction_query(data), params)
+        updated = await cur.fetchone()
+    transaction_cache.invalidate((user_id, transaction_id))
+    return updated
+
+
+async def erase_transaction_async(user_id: int, transaction_id: int) -> dict | None:
+    """Async counterpart of `erase_transaction`."""
+    params = {"transaction_id": transaction_id, "user_id": user_id}
+    async with get_async_conn() as conn, conn.cursor(row_factory=dict_row) as cur:
+        await queries.aexecute(cur, DELETE_TRANSACTION, params)
+        deleted = await cur.fetchone()
+    transaction_cache.invalidate((user_id, transaction_id))
+    return deleted
+
+
+async def apply_transaction_batch_async(
+    user_id: int, operations: list[tuple[str, int | None, dict]]
+) -> list[dict | None]:
+    """Async counterpart of `apply_transaction_batch`."""
+    async with get_async_conn() as conn:
+        cursors = []
+        async with conn.pipeline():
+            for op, transaction_id, data in operations:
+                params = {**data, "user_id": user_id, "transaction_id": transaction_id}
+                cur = conn.cursor(row_factory=dict_row)
+                await queries.aexecute(cur, _batch_query(op, data), params)
+                cursors.append(cur)
+        results = [await cur.fetchone() for cur in cursors]
+        if any(result is None for result in results):
+            await conn.rollback()
+    _invalidate_batch(user_id, operations)
+    return results
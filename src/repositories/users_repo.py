@@ -1,7 +1,67 @@
+from collections.abc import Iterable
+from typing import cast
+
 from psycopg import sql
 from psycopg.rows import dict_row
 
-from src.database.db_connection import get_conn
+from src.database.async_connection import get_async_conn, get_async_read_conn
+from src.database.cache import transaction_cache, user_cache
+from src.database.db_connection import get_conn, get_read_conn
+from src.database.query_registry import queries
+
+INSERT_USER = queries.register(
+    "insert_user",
+    """
+    INSERT INTO users (username, email, password_hash)
+    VALUES (%s, %s, %s) returning username, email;
+    """,
+)
+
+# The data version is read with the row, so that the row is cached under
+# the version it was read at (see `RecordCache`).
+GET_USER = queries.register(
+    "get_user", "SELECT username, email, data_version FROM users WHERE id = %s"
+)
+
+# Emails match regardless of case, through the users_email_lower_key index.
+GET_USER_BY_EMAIL = queries.register(
+    "get_user_by_email",
+    """
+    SELECT id, username, email, password_hash FROM users
+    WHERE lower(email) = lower(%s)
+    """,
+)
+
+GET_USER_CREDENTIALS = queries.register(
+    "get_user_credentials",
+    "SELECT id, password_hash FROM users WHERE lower(email) = lower(%s)",
+)
+
+GET_DATA_VERSION = queries.register(
+    "get_data_version", "SELECT data_version FROM users WHERE id = %s"
+)
+
+DELETE_USER = queries.register(
+    "delete_user", "DELETE FROM users WHERE id = %s RETURNING username;"
+)
+
+
+def _update_user_query(columns: Iterable[str]) -> str:
+    """Return the registered UPDATE statement setting the given columns."""
+    columns = sorted(columns)
+
+    def build() -> sql.Composed:
+        set_parts = [
+            sql.SQL("{} = %({})s").format(sql.Identifier(col), sql.SQL(col))
+            for col in columns
+        ]
+        return sql.SQL("""UPDATE users
+                          SET {set_clause}
+                          WHERE id = %(user_id)s
+                          RETURNING username, email;
+                       """).format(set_clause=sql.SQL(", ").join(set_parts))
+
+    return queries.variant("update_user", columns, build)
 
 
 def insert_user(username: str, email: str, password_hash: str) -> dict:
@@ -21,22 +81,21 @@ def insert_user(username: str, email: str, password_hash: str) -> dict:
     Raises:
         psycopg.errors.Error: If any database-related error occurs during the query execution.
     """
-    query = """
-            INSERT INTO users (username, email, password_hash)
-            VALUES (%s, %s, %s) returning username, email;
-            """
     with get_conn() as conn, conn.cursor(row_factory=dict_row) as cur:
-        cur.execute(query, (username, email, password_hash))
+        queries.execute(cur, INSERT_USER, (username, email, password_hash))
         conn.commit()
-        return cur.fetchone()
+        return cast(dict, cur.fetchone())
 
 
-def get_user(user_id: int) -> dict | None:
+def get_user(user_id: int, data_version: int | None = None) -> dict | None:
     """
-    Retrieve user's data from the database.
+    Retrieve user's data from the cache or the database.
 
     Args:
         user_id (int): The ID of the user.
+        data_version (int | None): The user's data version, read before
+            this call. Without it the cache is not used. A row read from
+            the database is cached under the version read along with it.
 
     Returns:
         dict: User's username and email.
@@ -46,15 +105,23 @@ def get_user(user_id: int) -> dict | None:
     Raises:
         psycopg.errors.Error: If any database-related error occurs during the query execution.
     """
-    query = """SELECT username, email FROM users WHERE id = %s"""
-    with get_conn() as conn, conn.cursor(row_factory=dict_row) as cur:
-        cur.execute(query, (user_id,))
-        return cur.fetchone()
+    if data_version is not None:
+        cached = user_cache.get((user_id,), data_version)
+        if cached is not None:
+            return cached
+    with get_read_conn(user_id) as conn, conn.cursor(row_factory=dict_row) as cur:
+        queries.execute(cur, GET_USER, (user_id,))
+        row = cur.fetchone()
+    if row is not None:
+        row_version = row.pop("data_version")
+        if data_version is not None:
+            user_cache.set((user_id,), row, row_version)
+    return row
 
 
 def get_user_by_email(email: str) -> dict | None:
     """
-    Retrieve user's data by email from the database.
+    Retrieve user's data by email from the database, ignoring case.
 
     Args:
         email (str): The email of the user.
@@ -67,15 +134,61 @@ def get_user_by_email(email: str) -> dict | None:
     Raises:
         psycopg.errors.Error: If any database-related error occurs during the query execution.
     """
-    query = """SELECT * FROM users WHERE email = %s"""
     with get_conn() as conn, conn.cursor(row_factory=dict_row) as cur:
-        cur.execute(query, (email,))
+        queries.execute(cur, GET_USER_BY_EMAIL, (email,))
+        return cur.fetchone()
+
+
+def get_user_credentials(email: str) -> dict | None:
+    """
+    Retrieve what logging in needs of a user, by email ignoring case.
+
+    Args:
+        email (str): The email of the user.
+
+    Returns:
+        dict: User's id and hashed password.
+
+        {id, password_hash}
+
+        None: If no user is found.
+
+    Raises:
+        psycopg.errors.Error: If any database-related error occurs during the query execution.
+    """
+    with get_conn() as conn, conn.cursor(row_factory=dict_row) as cur:
+        queries.execute(cur, GET_USER_CREDENTIALS, (email,))
         return cur.fetchone()
 
 
+def get_data_version(user_id: int) -> int | None:
+    """
+    Retrieve the version of a user's data.
+
+    The version is bumped by triggers in the same transaction as every
+    change to the user or their transactions, so an unchanged version means
+    none of their data changed.
+
+    Args:
+        user_id (int): The ID of the user.
+
+    Returns:
+        int: The user's current data version.
+
+        None: If no user is found.
+
+    Raises:
+        psycopg.errors.Error: If any database-related error occurs during the query execution.
+    """
+    with get_read_conn(user_id) as conn, conn.cursor() as cur:
+        queries.execute(cur, GET_DATA_VERSION, (user_id,))
+        row = cur.fetchone()
+        return row[0] if row else None
+
+
 def update_user(user_id: int, data: dict) -> dict | None:
     """
-    Update user fields in the database.
+    Update user fields in the database and drop the user's cached data.
 
     Args:
         user_id (int): The ID of the user to update.
@@ -89,24 +202,19 @@ def update_user(user_id: int, data: dict) -> dict | None:
     Raises:
         psycopg.errors.Error: If any database-related error occurs during the query execution.
     """
-    set_parts = [
-        sql.SQL("{} = %({})s").format(sql.Identifier(col), sql.SQL(col)) for col in data
-    ]
-    set_clause = sql.SQL(", ").join(set_parts)
     params = {**data, "user_id": user_id}
-    query = sql.SQL("""UPDATE users
-                       SET {set_clause}
-                       WHERE id = %(user_id)s
-                       RETURNING username, email;
-                    """).format(set_clause=set_clause)
     with get_conn() as conn, conn.cursor(row_factory=dict_row) as cur:
-        cur.execute(query, params)
-        return cur.fetchone()
+        queries.execute(cur, _update_user_query(data), params)
+        updated = cur.fetchone()
+    user_cache.invalidate((user_id,))
+    return updated
 
 
 def delete_user(user_id: int) -> dict | None:
     """
-    Delete a user from the database.
+    Delete a user from the database and drop their cached data.
+
+    A trigger revokes the user's access tokens in the same transaction.
 
     Args:
         user_id (int): The ID of the user to delete.
@@ -119,9 +227,81 @@ def delete_user(user_id: int) -> dict | None:
     Raises:
         psycopg.errors.Error: If any database-related error occurs during the query execution.
     """
-    query = """
-            DELETE FROM users WHERE id = (%s) RETURNING username;
-            """
     with get_conn() as conn, conn.cursor(row_factory=dict_row) as cur:
-        cur.execute(query, (user_id,))
-        return cur.fetchone()
+        queries.execute(cur, DELETE_USER, (user_id,))
+        deleted = cur.fetchone()
+    user_cache.invalidate((user_id,))
+    transaction_cache.clear(user_id)
+    return deleted
+
+
+# Async counterparts, used by the async views (see `create_app`).
+
+
+async def insert_user_async(username: str, email: str, password_hash: str) -> dict:
+    """Async counterpart of `insert_user`."""
+    async with get_async_conn() as conn, conn.cursor(row_factory=dict_row) as cur:
+        await queries.aexecute(cur, INSERT_USER, (username, email, password_hash))
+        await conn.commit()
+        return cast(dict, await cur.fetchone())
+
+
+async def get_user_async(user_id: int, data_version: int | None = None) -> dict | None:
+    """Async counterpart of `get_user`."""
+    if data_version is not None:
+        cached = user_cache.get((user_id,), data_version)
+        if cached is not None:
+            return cached
+    async with (
+        get_async_read_conn(user_id) as conn,
+        conn.cursor(row_factory=dict_row) as cur,
+    ):
+        await queries.aexecute(cur, GET_USER, (user_id,))
+        row = await cur.fetchone()
+    if row is not None:
+        row_version = row.pop("data_version")
+        if data_version is not None:
+            user_cache.set((user_id,), row, row_version)
+    return row
+
+
+async def get_user_by_email_async(email: str) -> dict | None:
+    """Async counterpart of `get_user_by_email`."""
+    async with get_async_conn() as conn, conn.cursor(row_factory=dict_row) as cur:
+        await queries.aexecute(cur, GET_USER_BY_EMAIL, (email,))
+        return await cur.fetchone()
+
+
+async def get_user_credentials_async(email: str) -> dict | None:
+    """Async counterpart of `get_user_credentials`."""
+    async with get_async_conn() as conn, conn.cursor(row_factory=dict_row) as cur:
+        await queries.aexecute(cur, GET_USER_CREDENTIALS, (email,))
+        return await cur.fetchone()
+
+
+async def get_data_version_async(user_id: int) -> int | None:
+    """Async counterpart of `get_data_version`."""
+    async with get_async_read_conn(user_id) as conn, conn.cursor() as cur:
+        await queries.aexecute(cur, GET_DATA_VERSION, (user_id,))
+        row = await cur.fetchone()
+        return row[0] if row else None
+
+
+async def update_user_async(user_id: int, data: dict) -> dict | None:
+    """Async counterpart of `update_user`."""
+    params = {**data, "user_id": user_id}
+    async with get_async_conn() as conn, conn.cursor(row_factory=dict_row) as cur:
+        await queries.aexecute(cur, _update_user_query(data), params)
+        updated = await cur.fetchone()
+    user_cache.invalidate((user_id,))
+    return updated
+
+
+async def delete_user_async(user_id: int) -> dict | None:
+    """Async counterpart of `delete_user`."""
+    async with get_async_conn() as conn, conn.cursor(row_factory=dict_row) as cur:
+        await queries.aexecute(cur, DELETE_USER, (user_id,))
+        deleted = await cur.fetchone()
+    user_cache.invalidate((user_id,))
+    transaction_cache.clear(user_id)
+    return deleted
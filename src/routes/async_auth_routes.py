@@ -0,0 +1,42 @@
+from flask import Blueprint, g, jsonify, request
+from flask.typing import ResponseReturnValue
+
+from src.schemas.auth_user_schemas import LoginIn, RegisterIn
+from src.services.auth_service import (
+    authenticate_async,
+    create_user_async,
+    logout_async,
+)
+from src.utils.jwt_utils import jwt_required
+from src.utils.request_utils import accepts
+
+# Same name, URLs and responses as `auth_bp`; see `auth_routes`.
+async_auth_bp = Blueprint("auth", __name__, url_prefix="/auth")
+
+
+@async_auth_bp.post("/register")
+async def register() -> ResponseReturnValue:
+    """Async counterpart of `auth_routes.register`."""
+    request_data = RegisterIn.model_validate(request.json)
+    created_user = await create_user_async(
+        request_data.username, str(request_data.email), request_data.password
+    )
+    return jsonify(created_user), 201
+
+
+@async_auth_bp.post("/login")
+async def login() -> ResponseReturnValue:
+    """Async counterpart of `auth_routes.login`."""
+    request_data = LoginIn.model_validate(request.json)
+    token_data = await authenticate_async(
+        str(request_data.email), request_data.password
+    )
+    return jsonify(token_data), 200
+
+
+@async_auth_bp.post("/logout")
+@jwt_required
+@accepts()
+async def logout_current_token() -> ResponseReturnValue:
+    """Async counterpart of `auth_routes.logout_current_token`."""
+    return jsonify(await logout_async(g.jwt)), 200
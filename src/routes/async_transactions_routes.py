@@ -0,0 +1,134 @@
+from flask import Blueprint, g, jsonify, request
+from flask.typing import ResponseReturnValue
+
+from src.routes.transactions_routes import (
+    export_transaction_list,
+    import_transaction_list,
+)
+from src.schemas.transaction_schemas import (
+    TransactionBatchIn,
+    TransactionId,
+    TransactionIn,
+    TransactionListQuery,
+    TransactionSearchQuery,
+    TransactionSummaryQuery,
+    UpdateTransactionIn,
+)
+from src.services.transactions_service import (
+    apply_batch_async,
+    create_transaction_async,
+    delete_transaction_async,
+    get_spending_summary_async,
+    get_transaction_info_async,
+    get_transaction_list_async,
+    search_transaction_list_async,
+    update_transaction_info_async,
+)
+from src.utils.etag import data_version_etag
+from src.utils.jwt_utils import jwt_required
+from src.utils.request_utils import PAYLOAD_MIMETYPES, accepts, request_payload
+
+# Same name, URLs and responses as `tx_bp`; see `transactions_routes` for the
+# API documentation. Export and import stream the request or response body
+# and keep their sync views.
+async_tx_bp = Blueprint("tx", __name__, url_prefix="/transactions")
+
+
+@async_tx_bp.get("/")
+@jwt_required
+@data_version_etag
+async def list_transactions() -> ResponseReturnValue:
+    """Async counterpart of `transactions_routes.list_transactions`."""
+    query = TransactionListQuery.model_validate(request.args.to_dict())
+    filters = query.model_dump(exclude={"limit", "cursor", "sort"}, exclude_none=True)
+    page = await get_transaction_list_async(
+        g.user_id, query.limit, query.cursor, query.sort, filters
+    )
+    return jsonify(page), 200
+
+
+@async_tx_bp.get("/search")
+@jwt_required
+async def search_transactions() -> ResponseReturnValue:
+    """Async counterpart of `transactions_routes.search_transactions`."""
+    query = TransactionSearchQuery.model_validate(request.args.to_dict())
+    page = await search_transaction_list_async(
+        g.user_id, query.q, query.limit, query.cursor
+    )
+    return jsonify(page), 200
+
+
+@async_tx_bp.get("/summary")
+@jwt_required
+async def summarize_transactions() -> ResponseReturnValue:
+    """Async counterpart of `transactions_routes.summarize_transactions`."""
+    query = TransactionSummaryQuery.model_validate(request.args.to_dict())
+    summary = await get_spending_summary_async(
+        g.user_id, query.group_by, query.date_from, query.date_to, query.percentiles
+    )
+    return jsonify(summary), 200
+
+
+async_tx_bp.add_url_rule("/export", view_func=export_transaction_list, methods=["GET"])
+
+
+@async_tx_bp.get("/<transaction_id>")
+@jwt_required
+@data_version_etag
+async def get_transaction(transaction_id: int) -> ResponseReturnValue:
+    """Async counterpart of `transactions_routes.get_transaction`."""
+    tx = TransactionId.model_validate({"id": transaction_id})
+    transaction = await get_transaction_info_async(g.user_id, tx.id, g.data_version)
+    return jsonify(transaction), 200
+
+
+@async_tx_bp.post("/")
+@jwt_required
+@accepts(*PAYLOAD_MIMETYPES)
+async def add_transaction() -> ResponseReturnValue:
+    """Async counterpart of `transactions_routes.add_transaction`."""
+    request_data = TransactionIn.model_validate(request_payload())
+    new_tx = await create_transaction_async(
+        g.user_id,
+        request_data.kind,
+        request_data.transaction_date,
+        request_data.amount,
+        request_data.description,
+    )
+    return jsonify(new_tx), 201
+
+
+async_tx_bp.add_url_rule("/import", view_func=import_transaction_list, methods=["POST"])
+
+
+@async_tx_bp.post("/batch")
+@jwt_required
+@accepts(*PAYLOAD_MIMETYPES)
+async def batch_transactions() -> ResponseReturnValue:
+    """Async counterpart of `transactions_routes.batch_transactions`."""
+    request_data = TransactionBatchIn.model_validate(request_payload())
+    results = await apply_batch_async(g.user_id, request_data.operations)
+    return jsonify(results), 200
+
+
+@async_tx_bp.patch("/<transaction_id>")
+@jwt_required
+async def patch_transaction(transaction_id: int) -> ResponseReturnValue:
+    """Async counterpart of `transactions_routes.patch_transaction`."""
+    tx = TransactionId.model_validate({"id": transaction_id})
+    request_data = UpdateTransactionIn.model_validate(request.json).model_dump(
+        exclude_unset=True
+    )
+    updated_tx = await update_transaction_info_async(g.user_id, tx.id, request_data)
+    return jsonify(updated_tx), 200
+
+
+@async_tx_bp.delete("/<transaction_id>")
+@jwt_required
+async def remove_transaction(transaction_id: int) -> ResponseReturnValue:
+    """Async counterpart of `transactions_routes.remove_transaction`."""
+    tx = TransactionId.model_validate({"id": transaction_id})
+    deleted_tx = await delete_transaction_async(g.user_id, tx.id)
+    return {
+        "message": f"Transaction with id: {deleted_tx['id']}, deleted successfully!"
+    }, 200
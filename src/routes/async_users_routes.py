@@ -0,0 +1,44 @@
+from flask import Blueprint, g, jsonify, request
+from flask.typing import ResponseReturnValue
+
+from src.schemas.auth_user_schemas import UpdateUserIn
+from src.services.users_service import (
+    delete_user_account_async,
+    get_user_info_async,
+    update_user_info_async,
+)
+from src.utils.etag import data_version_etag
+from src.utils.jwt_utils import jwt_required
+
+# Same name, URLs and responses as `user_bp`; see `users_routes`.
+async_user_bp = Blueprint("user", __name__, url_prefix="/")
+
+
+@async_user_bp.get("/me")
+@jwt_required
+@data_version_etag
+async def get_current_user() -> ResponseReturnValue:
+    """Async counterpart of `users_routes.get_current_user`."""
+    current_user = await get_user_info_async(g.user_id, g.data_version)
+    return jsonify(current_user), 200
+
+
+@async_user_bp.patch("/me")
+@jwt_required
+async def patch_current_user() -> ResponseReturnValue:
+    """Async counterpart of `users_routes.patch_current_user`."""
+    request_data = UpdateUserIn.model_validate(request.json).model_dump(
+        by_alias=True, exclude_unset=True
+    )
+    updated_info = await update_user_info_async(g.user_id, request_data)
+    return jsonify(updated_info), 200
+
+
+@async_user_bp.delete("/me")
+@jwt_required
+async def remove_current_user() -> ResponseReturnValue:
+    """Async counterpart of `users_routes.remove_current_user`."""
+    deleted_user = await delete_user_account_async(g.user_id)
+    return {
+        "message": f"User {deleted_user['username']}, was deleted successfully!"
+    }, 200
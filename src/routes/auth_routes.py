@@ -1,13 +1,16 @@
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, g, jsonify, request
+from flask.typing import ResponseReturnValue
 
 from src.schemas.auth_user_schemas import LoginIn, RegisterIn
-from src.services.auth_service import authenticate, create_user
+from src.services.auth_service import authenticate, create_user, logout
+from src.utils.jwt_utils import jwt_required
+from src.utils.request_utils import accepts
 
 auth_bp = Blueprint("auth", __name__, url_prefix="/auth")
 
 
 @auth_bp.post("/register")
-def register():
+def register() -> ResponseReturnValue:
     """
     Create a new user account.
 
@@ -27,7 +30,7 @@ def register():
 
 
 @auth_bp.post("/login")
-def login():
+def login() -> ResponseReturnValue:
     """
     Authenticate a user and issue an access token.
 
@@ -41,3 +44,21 @@ def login():
     request_data = LoginIn.model_validate(request.json)
     token_data = authenticate(str(request_data.email), request_data.password)
     return jsonify(token_data), 200
+
+
+@auth_bp.post("/logout")
+@jwt_required
+@accepts()
+def logout_current_token() -> ResponseReturnValue:
+    """
+    Revoke the access token the request was made with.
+
+    Other tokens of the user stay valid, unless the token predates the jti
+    claim: logging out with such a token revokes all of the user's tokens
+    issued until then. Other workers reject the token within
+    REVOCATION_REFRESH_INTERVAL seconds.
+
+    Returns:
+          JSON response (200 OK) containing confirmation message.
+    """
+    return jsonify(logout(g.jwt)), 200
@@ -0,0 +1,87 @@
+from flask import Blueprint, current_app, jsonify, request
+from flask.typing import ResponseReturnValue
+
+from src.database.async_connection import run_coroutine
+from src.schemas.internal_schemas import (
+    CacheStatsQuery,
+    PasswordHashingStatsQuery,
+    PoolStatsQuery,
+)
+from src.services.internal_service import (
+    get_cache_stats,
+    get_password_hashing_stats,
+    get_pool_stats,
+    get_pool_stats_async,
+)
+from src.utils.request_utils import internal_token_required
+
+internal_bp = Blueprint("internal", __name__, url_prefix="/internal")
+
+
+@internal_bp.get("/pool")
+@internal_token_required
+def pool_stats() -> ResponseReturnValue:
+    """
+    Reports the connection pool statistics of the worker serving the request.
+
+    Those are the pools serving the views: the async pools when the app
+    serves async views.
+
+    Headers:
+        X-Internal-Token (str): Must match the INTERNAL_API_TOKEN setting.
+
+    Query Parameters:
+        reset (bool): Reset the counters after reading them (default false).
+
+    Returns:
+        JSON response (200 OK) containing connections in use, the average
+        time requests waited for a connection and the raw pool counters.
+    """
+    query = PoolStatsQuery.model_validate(request.args.to_dict())
+    if current_app.config["ASYNC_VIEWS"]:
+        stats = run_coroutine(get_pool_stats_async(query.reset))
+    else:
+        stats = get_pool_stats(query.reset)
+    return jsonify(stats), 200
+
+
+@internal_bp.get("/cache")
+@internal_token_required
+def cache_stats() -> ResponseReturnValue:
+    """
+    Reports the row cache counters of the worker serving the request.
+
+    Headers:
+        X-Internal-Token (str): Must match the INTERNAL_API_TOKEN setting.
+
+    Query Parameters:
+        reset (bool): Reset the hit and miss counters after reading them
+            (default false).
+
+    Returns:
+        JSON response (200 OK) containing hits and misses per cache and the
+        backend's entries, bytes and evictions.
+    """
+    query = CacheStatsQuery.model_validate(request.args.to_dict())
+    return jsonify(get_cache_stats(query.reset)), 200
+
+
+@internal_bp.get("/password-hashing")
+@internal_token_required
+def password_hashing_stats() -> ResponseReturnValue:
+    """
+    Reports the password hashing pool of the worker serving the request.
+
+    Headers:
+        X-Internal-Token (str): Must match the INTERNAL_API_TOKEN setting.
+
+    Query Parameters:
+        reset (bool): Reset the peak, completed and rejected counters after
+            reading them (default false).
+
+    Returns:
+        JSON response (200 OK) containing the pool size, the operations
+        pending now and at peak, and the completed and rejected counts.
+    """
+    query = PasswordHashingStatsQuery.model_validate(request.args.to_dict())
+    return jsonify(get_password_hashing_stats(query.reset)), 200
@@ -1,38 +1,143 @@
-from flask import Blueprint, g, jsonify, request
+from flask import Blueprint, Response, g, jsonify, request, stream_with_context
+from flask.typing import ResponseReturnValue
 
 from src.schemas.transaction_schemas import (
+    TransactionBatchIn,
+    TransactionExportQuery,
     TransactionId,
     TransactionIn,
+    TransactionListQuery,
+    TransactionSearchQuery,
+    TransactionSummaryQuery,
     UpdateTransactionIn,
 )
 from src.services.transactions_service import (
+    apply_batch,
     create_transaction,
     delete_transaction,
+    export_transactions,
+    get_spending_summary,
     get_transaction_info,
     get_transaction_list,
+    import_transactions,
+    search_transaction_list,
     update_transaction_info,
 )
+from src.utils.etag import data_version_etag
+from src.utils.json_provider import MSGPACK_MIMETYPE
 from src.utils.jwt_utils import jwt_required
+from src.utils.request_utils import PAYLOAD_MIMETYPES, accepts, request_payload
 
 tx_bp = Blueprint("tx", __name__, url_prefix="/transactions")
 
+LEDGER_MIMETYPES = {"csv": "text/csv", "ndjson": "application/x-ndjson"}
+
 
 @tx_bp.get("/")
 @jwt_required
-def list_transactions():
+@data_version_etag
+def list_transactions() -> ResponseReturnValue:
+    """
+    Retrieves a filtered, sorted page of transactions for logged-in user.
+
+    Query Parameters:
+        limit (int): Page size (1-500, default 50).
+        cursor (str): Opaque `next_cursor` value from the previous page.
+        sort (str): 'date' (default), '-date', 'amount' or '-amount'.
+        from (str): Optional start date 'YYYY-MM-DD' (inclusive).
+        to (str): Optional end date 'YYYY-MM-DD' (inclusive).
+        kind (str): Optional 'expense' or 'income'.
+        min_amount (str): Optional minimum amount (inclusive).
+        max_amount (str): Optional maximum amount (inclusive).
+
+    Returns:
+        JSON response (200 OK) containing validated list of transactions and
+        the cursor of the next page (null on the last page), or an empty
+        304 Not Modified when If-None-Match holds its current ETag.
+    """
+    query = TransactionListQuery.model_validate(request.args.to_dict())
+    filters = query.model_dump(exclude={"limit", "cursor", "sort"}, exclude_none=True)
+    page = get_transaction_list(
+        g.user_id, query.limit, query.cursor, query.sort, filters
+    )
+    return jsonify(page), 200
+
+
+@tx_bp.get("/search")
+@jwt_required
+def search_transactions() -> ResponseReturnValue:
+    """
+    Searches the logged-in user's transaction descriptions, best match first.
+
+    Query Parameters:
+        q (str): Search text. Supports web search syntax ("quoted phrases",
+            or, -excluded); falls back to typo-tolerant matching when no
+            description contains the words.
+        limit (int): Page size (1-100, default 20).
+        cursor (str): Opaque `next_cursor` value from the previous page.
+
+    Returns:
+        JSON response (200 OK) containing the ranked results, the strategy that
+        matched them ('fulltext' or 'fuzzy') and the cursor of the next page
+        (null on the last page).
+    """
+    query = TransactionSearchQuery.model_validate(request.args.to_dict())
+    page = search_transaction_list(g.user_id, query.q, query.limit, query.cursor)
+    return jsonify(page), 200
+
+
+@tx_bp.get("/summary")
+@jwt_required
+def summarize_transactions() -> ResponseReturnValue:
     """
-    Retrieves a list of all transactions for logged-in user.
+    Retrieves income, expense and net totals per period for logged-in user.
+
+    Query Parameters:
+        group_by (str): 'day', 'week', 'month' (default) or 'year'.
+        from (str): Optional start date 'YYYY-MM-DD' (inclusive).
+        to (str): Optional end date 'YYYY-MM-DD' (inclusive).
+        percentiles (bool): Include expense percentiles (default true). Monthly
+            and yearly summaries over whole months without percentiles are
+            served from precomputed rollups.
 
     Returns:
-        JSON response (200 OK) containing validated list of transactions.
+        JSON response (200 OK) containing one bucket per period with totals,
+        counts and expense percentiles.
+    """
+    query = TransactionSummaryQuery.model_validate(request.args.to_dict())
+    summary = get_spending_summary(
+        g.user_id, query.group_by, query.date_from, query.date_to, query.percentiles
+    )
+    return jsonify(summary), 200
+
+
+@tx_bp.get("/export")
+@jwt_required
+def export_transaction_list() -> ResponseReturnValue:
     """
-    all_transactions = get_transaction_list(g.user_id)
-    return jsonify(all_transactions), 200
+    Streams the whole ledger of the logged-in user as a file download.
+
+    Query Parameters:
+        format (str): 'csv' (default) or 'ndjson'.
+
+    Returns:
+        Streamed response (200 OK) with one transaction per line.
+    """
+    query = TransactionExportQuery.model_validate(request.args.to_dict())
+    chunks = export_transactions(g.user_id, query.format)
+    return Response(
+        stream_with_context(chunks),
+        mimetype=LEDGER_MIMETYPES[query.format],
+        headers={
+            "Content-Disposition": f'attachment; filename="transactions.{query.format}"'
+        },
+    )
 
 
 @tx_bp.get("/<transaction_id>")
 @jwt_required
-def get_transaction(transaction_id: int):
+@data_version_etag
+def get_transaction(transaction_id: int) -> ResponseReturnValue:
     """
     Retrieves a transaction by ID (path parameter) for logged-in user.
 
@@ -40,20 +145,22 @@ def get_transaction(transaction_id: int):
         transaction_id (int): Transaction ID from URL path.
 
     Returns:
-          JSON response (200 OK) containing validated transaction information.
+          JSON response (200 OK) containing validated transaction information,
+          or an empty 304 Not Modified when If-None-Match holds its current ETag.
     """
     tx = TransactionId.model_validate({"id": transaction_id})
-    transaction = get_transaction_info(g.user_id, tx.id)
+    transaction = get_transaction_info(g.user_id, tx.id, g.data_version)
     return jsonify(transaction), 200
 
 
 @tx_bp.post("/")
 @jwt_required
-def add_transaction():
+@accepts(*PAYLOAD_MIMETYPES)
+def add_transaction() -> ResponseReturnValue:
     """
     Creates a new transaction for the logged-in user.
 
-    Request Body:
+    Request Body (JSON or MessagePack):
         kind (str): 'expense' or 'income'.
         transaction_date (str): Date in 'YYYY-MM-DD' format.
         amount (str): Transaction amount.
@@ -62,7 +169,7 @@ def add_transaction():
     Returns:
           JSON response (201 Created) containing created transaction information.
     """
-    request_data = TransactionIn.model_validate(request.json)
+    request_data = TransactionIn.model_validate(request_payload())
     new_tx = create_transaction(
         g.user_id,
         request_data.kind,
@@ -73,9 +180,53 @@ def add_transaction():
     return jsonify(new_tx), 201
 
 
+@tx_bp.post("/import")
+@jwt_required
+@accepts(*LEDGER_MIMETYPES.values(), MSGPACK_MIMETYPE)
+def import_transaction_list() -> ResponseReturnValue:
+    """
+    Bulk imports transactions for the logged-in user from an uploaded file.
+
+    Request Body:
+        CSV ('text/csv') with a kind,transaction_date,amount,description header,
+        NDJSON ('application/x-ndjson') with one transaction object per line,
+        or MessagePack ('application/msgpack') with one transaction map per
+        top-level object (errors report the object's position as its line).
+
+    Returns:
+          JSON response (201 Created) containing the number of imported rows,
+          or (422 Unprocessable Entity) with per-line errors if any line is
+          invalid, in which case nothing is imported.
+    """
+    report = import_transactions(g.user_id, request.mimetype, request.stream)
+    return jsonify(report), 422 if report["errors"] else 201
+
+
+@tx_bp.post("/batch")
+@jwt_required
+@accepts(*PAYLOAD_MIMETYPES)
+def batch_transactions() -> ResponseReturnValue:
+    """
+    Applies several create, patch and delete operations for the logged-in user
+    atomically, in a single database round trip.
+
+    Request Body (JSON or MessagePack):
+        operations (list): Up to 500 operations, each one of
+            {"op": "create", "data": {kind, transaction_date, amount, description}},
+            {"op": "patch", "id": int, "data": {optional transaction fields}},
+            {"op": "delete", "id": int}.
+
+    Returns:
+          JSON response (200 OK) containing one result per operation, in order.
+    """
+    request_data = TransactionBatchIn.model_validate(request_payload())
+    results = apply_batch(g.user_id, request_data.operations)
+    return jsonify(results), 200
+
+
 @tx_bp.patch("/<transaction_id>")
 @jwt_required
-def patch_transaction(transaction_id: int):
+def patch_transaction(transaction_id: int) -> ResponseReturnValue:
     """
     Updates fields of an existing transaction for the logged-in user.
 
@@ -98,7 +249,7 @@ def patch_transaction(transaction_id: int):
 
 @tx_bp.delete("/<transaction_id>")
 @jwt_required
-def remove_transaction(transaction_id: int):
+def remove_transaction(transaction_id: int) -> ResponseReturnValue:
     """
     Deletes transaction for logged-in user.
 
@@ -1,4 +1,5 @@
 from flask import Blueprint, g, jsonify, request
+from flask.typing import ResponseReturnValue
 
 from src.schemas.auth_user_schemas import UpdateUserIn
 from src.services.users_service import (
@@ -6,6 +7,7 @@ from src.services.users_service import (
     get_user_info,
     update_user_info,
 )
+from src.utils.etag import data_version_etag
 from src.utils.jwt_utils import jwt_required
 
 user_bp = Blueprint("user", __name__, url_prefix="/")
@@ -13,20 +15,22 @@ user_bp = Blueprint("user", __name__, url_prefix="/")
 
 @user_bp.get("/me")
 @jwt_required
-def get_current_user():
+@data_version_etag
+def get_current_user() -> ResponseReturnValue:
     """
     Retrieve information about logged-in user.
 
     Returns:
-        JSON response (200 OK) containing user data (username, email).
+        JSON response (200 OK) containing user data (username, email), or an
+        empty 304 Not Modified when If-None-Match holds its current ETag.
     """
-    current_user = get_user_info(g.user_id)
+    current_user = get_user_info(g.user_id, g.data_version)
     return jsonify(current_user), 200
 
 
 @user_bp.patch("/me")
 @jwt_required
-def patch_current_user():
+def patch_current_user() -> ResponseReturnValue:
     """
     Update information for logged-in user.
 
@@ -45,7 +49,7 @@ def patch_current_user():
 
 @user_bp.delete("/me")
 @jwt_required
-def remove_current_user():
+def remove_current_user() -> ResponseReturnValue:
     """
     Delete the logged-in user.
 
@@ -1,35 +1,41 @@
 from typing import Annotated, Literal
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import EmailStr, Field
 
+from src.schemas.base import Schema
 
-class UserOut(BaseModel):
+
+class UserOut(Schema):
     username: Annotated[str, Field(min_length=3, max_length=50)]
     email: EmailStr
 
 
-class RegisterIn(BaseModel):
+class RegisterIn(Schema):
     username: Annotated[str, Field(min_length=3, max_length=50)]
     email: EmailStr
     password: Annotated[str, Field(min_length=8)]
 
 
-class RegisterOut(BaseModel):
+class RegisterOut(Schema):
     message: Literal["User registered successfully"] = "User registered successfully"
     user: UserOut
 
 
-class LoginIn(BaseModel):
+class LoginIn(Schema):
     email: EmailStr
     password: Annotated[str, Field(min_length=8)]
 
 
-class TokenOut(BaseModel):
+class TokenOut(Schema):
     access_token: str
     token_type: Literal["Bearer"] = "Bearer"  # noqa S105
 
 
-class UpdateUserIn(BaseModel):
+class LogoutOut(Schema):
+    message: Literal["Logged out successfully"] = "Logged out successfully"
+
+
+class UpdateUserIn(Schema):
     username: str | None = Field(None, min_length=3, max_length=50)
     email: EmailStr | None = None
     password: str | None = Field(
@@ -41,5 +47,5 @@ class UpdateUserOut(UserOut):
     password: Literal["********"] = "********"  # noqa S105
 
 
-class DeleteUserOut(BaseModel):
+class DeleteUserOut(Schema):
     username: Annotated[str, Field(min_length=3, max_length=50)]
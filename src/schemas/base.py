@@ -0,0 +1,31 @@
+from pydantic import BaseModel, ConfigDict
+
+
+class Schema(BaseModel):
+    """
+    Base class of the API schemas.
+
+    Validators and serializers are built on first use instead of at import
+    time, which keeps imports (app start, CLI, tests) fast. `build_schemas`
+    builds them all ahead of the first request.
+    """
+
+    model_config = ConfigDict(defer_build=True)
+
+
+def build_schemas() -> int:
+    """
+    Build the validators and serializers of every imported Schema subclass.
+
+    Returns:
+        int: Number of schemas built by this call.
+    """
+    built = 0
+    pending = list(Schema.__subclasses__())
+    while pending:
+        schema = pending.pop()
+        pending.extend(schema.__subclasses__())
+        if not schema.__pydantic_complete__:
+            schema.model_rebuild(force=True)
+            built += 1
+    return built
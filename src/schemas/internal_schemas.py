@@ -0,0 +1,13 @@
+from src.schemas.base import Schema
+
+
+class PoolStatsQuery(Schema):
+    reset: bool = False
+
+
+class CacheStatsQuery(Schema):
+    reset: bool = False
+
+
+class PasswordHashingStatsQuery(Schema):
+    reset: bool = False
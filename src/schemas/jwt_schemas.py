@@ -1,6 +1,9 @@
-from pydantic import BaseModel
+from src.schemas.base import Schema
 
 
-class JWTPayload(BaseModel):
+class JWTPayload(Schema):
     sub: int
     exp: int
+    # Tokens issued before revocation support carry neither claim.
+    iat: int | None = None
+    jti: str | None = None
@@ -2,35 +2,167 @@ from datetime import date
 from decimal import Decimal
 from typing import Annotated, Literal
 
-from pydantic import BaseModel, Field, field_serializer
+from pydantic import Field, StringConstraints, model_validator
 
+from src.schemas.base import Schema
 
-class TransactionIn(BaseModel):
+# Amount filters have the stored amounts' scale, and few enough digits for
+# PostgreSQL to compare (a NUMERIC of 1e99999999 is rejected there).
+AmountFilter = Annotated[Decimal, Field(ge=0, max_digits=20, decimal_places=2)]
+
+# PostgreSQL text cannot hold NUL characters.
+DESCRIPTION_PATTERN = r"^[^\x00]*$"
+
+
+class TransactionIn(Schema):
     kind: Literal["expense", "income"]
     transaction_date: date
     amount: Annotated[Decimal, Field(ge=0, decimal_places=2)]
-    description: Annotated[str, Field(min_length=1, max_length=255)]
-
-    # Add a field_serializer to the base model
-    @field_serializer("transaction_date")
-    def serialize_date_to_iso(self, d: date) -> str:
-        return d.isoformat()
+    description: Annotated[
+        str, Field(min_length=1, max_length=255, pattern=DESCRIPTION_PATTERN)
+    ]
 
 
 class TransactionOut(TransactionIn):
     id: Annotated[int, Field(ge=1)]
 
 
-class TransactionsOut(BaseModel):
+class TransactionsOut(Schema):
     transactions: list[TransactionOut]
+    next_cursor: str | None = None
+
+
+class TransactionSearchQuery(Schema):
+    q: Annotated[
+        str, StringConstraints(strip_whitespace=True, min_length=1, max_length=200)
+    ]
+    limit: Annotated[int, Field(ge=1, le=100)] = 20
+    cursor: str | None = None
+
+
+class TransactionSearchHit(TransactionOut):
+    rank: float
+
+
+class TransactionSearchOut(Schema):
+    match: Literal["fulltext", "fuzzy"]
+    results: list[TransactionSearchHit]
+    next_cursor: str | None = None
+
+
+class TransactionListQuery(Schema):
+    limit: Annotated[int, Field(ge=1, le=500)] = 50
+    cursor: str | None = None
+    sort: Literal["date", "-date", "amount", "-amount"] = "date"
+    date_from: date | None = Field(None, alias="from")
+    date_to: date | None = Field(None, alias="to")
+    kind: Literal["expense", "income"] | None = None
+    min_amount: AmountFilter | None = None
+    max_amount: AmountFilter | None = None
+
+    @model_validator(mode="after")
+    def check_ranges(self) -> "TransactionListQuery":
+        if self.date_from and self.date_to and self.date_from > self.date_to:
+            raise ValueError("'from' must not be after 'to'")
+        if (
+            self.min_amount is not None
+            and self.max_amount is not None
+            and self.min_amount > self.max_amount
+        ):
+            raise ValueError("'min_amount' must not exceed 'max_amount'")
+        return self
+
+
+class TransactionSummaryQuery(Schema):
+    group_by: Literal["day", "week", "month", "year"] = "month"
+    date_from: date | None = Field(None, alias="from")
+    date_to: date | None = Field(None, alias="to")
+    percentiles: bool = True
+
+    @model_validator(mode="after")
+    def check_date_range(self) -> "TransactionSummaryQuery":
+        if self.date_from and self.date_to and self.date_from > self.date_to:
+            raise ValueError("'from' must not be after 'to'")
+        return self
+
+
+class SummaryBucketOut(Schema):
+    period: date
+    income: Decimal
+    expense: Decimal
+    net: Decimal
+    count: Annotated[int, Field(ge=0)]
+    income_count: Annotated[int, Field(ge=0)]
+    expense_count: Annotated[int, Field(ge=0)]
+    expense_p50: Decimal | None
+    expense_p90: Decimal | None
+
+
+class TransactionSummaryOut(Schema):
+    group_by: Literal["day", "week", "month", "year"]
+    buckets: list[SummaryBucketOut]
 
 
-class UpdateTransactionIn(BaseModel):
+class ImportLineError(Schema):
+    line: Annotated[int, Field(ge=1)]
+    errors: list[dict]
+
+
+class TransactionImportOut(Schema):
+    imported: Annotated[int, Field(ge=0)]
+    errors: list[ImportLineError]
+
+
+class TransactionExportQuery(Schema):
+    format: Literal["csv", "ndjson"] = "csv"
+
+
+class UpdateTransactionIn(Schema):
     kind: Literal["expense", "income"] | None = None
     transaction_date: date | None = None
     amount: Decimal | None = Field(None, ge=0, decimal_places=2)
-    description: str | None = Field(None, min_length=1, max_length=255)
+    description: str | None = Field(
+        None, min_length=1, max_length=255, pattern=DESCRIPTION_PATTERN
+    )
+
+
+class TransactionId(Schema):
+    id: Annotated[int, Field(ge=1)]
+
+
+class CreateOperationIn(Schema):
+    op: Literal["create"]
+    data: TransactionIn
 
 
-class TransactionId(BaseModel):
+class PatchOperationIn(Schema):
+    op: Literal["patch"]
     id: Annotated[int, Field(ge=1)]
+    data: UpdateTransactionIn
+
+
+class DeleteOperationIn(Schema):
+    op: Literal["delete"]
+    id: Annotated[int, Field(ge=1)]
+
+
+class TransactionBatchIn(Schema):
+    operations: Annotated[
+        list[
+            Annotated[
+                CreateOperationIn | PatchOperationIn | DeleteOperationIn,
+                Field(discriminator="op"),
+            ]
+        ],
+        Field(min_length=1, max_length=500),
+    ]
+
+
+class BatchResultOut(Schema):
+    op: Literal["create", "patch", "delete"]
+    id: Annotated[int, Field(ge=1)]
+    transaction: TransactionOut | None = None
+
+
+class TransactionBatchOut(Schema):
+    results: list[BatchResultOut]
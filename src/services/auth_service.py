@@ -1,10 +1,30 @@
-from pydantic import ValidationError
-
-from src.exceptions import AppError, UnauthorizedError
-from src.repositories.users_repo import get_user_by_email, insert_user
-from src.schemas.auth_user_schemas import RegisterOut, TokenOut
+from src.exceptions import ServiceUnavailableError, UnauthorizedError
+from src.repositories.revocations_repo import (
+    revoke_subject,
+    revoke_subject_async,
+    revoke_token,
+    revoke_token_async,
+)
+from src.repositories.users_repo import (
+    get_user_credentials,
+    get_user_credentials_async,
+    insert_user,
+    insert_user_async,
+    update_user,
+    update_user_async,
+)
+from src.schemas.auth_user_schemas import LogoutOut, RegisterOut, TokenOut
+from src.schemas.jwt_schemas import JWTPayload
 from src.utils.jwt_utils import create_access_token
-from src.utils.password import hash_password, verify_password
+from src.utils.password import (
+    hash_password,
+    hash_password_async,
+    needs_rehash,
+    verify_password,
+    verify_password_async,
+)
+from src.utils.revocation import note_token_revoked, note_user_revoked
+from src.utils.serialization import dump_response
 
 
 def create_user(username: str, email: str, password: str) -> dict:
@@ -22,21 +42,22 @@ def create_user(username: str, email: str, password: str) -> dict:
           dict: Created user information (username, email).
 
     Raises:
-          AppError: If schema validation fails.
+          ServiceUnavailableError: If the password hashing pool is saturated.
+          AppError: If strict output validation fails.
     """
     hashed_password = hash_password(password)
     created_user = insert_user(username, email, hashed_password)
-    try:
-        return RegisterOut.model_validate({"user": created_user}).model_dump()
-    except ValidationError as err:
-        raise AppError("Internal schema validation error") from err
+    return dump_response(RegisterOut, {"user": created_user})
 
 
 def authenticate(email: str, password: str) -> dict:
     """
-    Authenticates a user by email and password.
+    Authenticates a user by email, ignoring case, and password.
     Verifies the password and creates access token.
 
+    A password hashed with a cost other than BCRYPT_ROUNDS is hashed again
+    and stored, unless the hashing pool is saturated.
+
     Args:
         email (str): The email of the user.
         password (str): The password of the user.
@@ -45,13 +66,83 @@ def authenticate(email: str, password: str) -> dict:
         dict: Token type and access token.
     Raises:
         UnauthorizedError: If email or password is incorrect.
-        AppError: If schema validation fails.
+        ServiceUnavailableError: If the password hashing pool is saturated.
+        AppError: If strict output validation fails.
     """
-    user_record = get_user_by_email(email)
+    user_record = get_user_credentials(email)
     if not user_record or not verify_password(password, user_record["password_hash"]):
         raise UnauthorizedError("Invalid credentials")
+    if needs_rehash(user_record["password_hash"]):
+        try:
+            password_hash = hash_password(password)
+        except ServiceUnavailableError:
+            pass
+        else:
+            update_user(user_record["id"], {"password_hash": password_hash})
     access_token = create_access_token(user_record["id"])
-    try:
-        return TokenOut.model_validate({"access_token": access_token}).model_dump()
-    except ValidationError as err:
-        raise AppError("Internal schema validation error") from err
+    return dump_response(TokenOut, {"access_token": access_token})
+
+
+def logout(token: JWTPayload) -> dict:
+    """
+    Revoke an access token until it expires.
+
+    A token issued without a jti claim cannot be revoked on its own, so
+    every token of its user issued until now is revoked instead.
+
+    Args:
+        token (JWTPayload): The verified payload of the token to revoke.
+
+    Returns:
+        dict: Confirmation message.
+
+    Raises:
+        AppError: If strict output validation fails.
+    """
+    if token.jti is None:
+        revoke_subject(token.sub)
+        note_user_revoked(token.sub)
+    else:
+        revoke_token(token.jti, token.exp)
+        note_token_revoked(token.jti)
+    return dump_response(LogoutOut, {})
+
+
+# Async counterparts, used by the async views (see `create_app`). They await
+# the password hashing pool instead of blocking the event loop.
+
+
+async def create_user_async(username: str, email: str, password: str) -> dict:
+    """Async counterpart of `create_user`."""
+    hashed_password = await hash_password_async(password)
+    created_user = await insert_user_async(username, email, hashed_password)
+    return dump_response(RegisterOut, {"user": created_user})
+
+
+async def authenticate_async(email: str, password: str) -> dict:
+    """Async counterpart of `authenticate`."""
+    user_record = await get_user_credentials_async(email)
+    if not user_record or not await verify_password_async(
+        password, user_record["password_hash"]
+    ):
+        raise UnauthorizedError("Invalid credentials")
+    if needs_rehash(user_record["password_hash"]):
+        try:
+            password_hash = await hash_password_async(password)
+        except ServiceUnavailableError:
+            pass
+        else:
+            await update_user_async(user_record["id"], {"password_hash": password_hash})
+    access_token = create_access_token(user_record["id"])
+    return dump_response(TokenOut, {"access_token": access_token})
+
+
+async def logout_async(token: JWTPayload) -> dict:
+    """Async counterpart of `logout`."""
+    if token.jti is None:
+        await revoke_subject_async(token.sub)
+        note_user_revoked(token.sub)
+    else:
+        await revoke_token_async(token.jti, token.exp)
+        note_token_revoked(token.jti)
+    return dump_response(LogoutOut, {})
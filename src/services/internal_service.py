@@ -0,0 +1,102 @@
+from psycopg_pool import AsyncConnectionPool, ConnectionPool
+
+from src.database.async_connection import get_async_pool, get_async_replica_pools
+from src.database.cache import backend_stats, transaction_cache, user_cache
+from src.database.db_connection import get_pool, get_replica_pools
+from src.utils.password import hash_pool_stats
+
+# Counters psycopg_pool only reports once they have been incremented.
+_COUNTERS = (
+    "requests_num",
+    "requests_queued",
+    "requests_wait_ms",
+    "requests_errors",
+    "usage_ms",
+    "connections_num",
+    "connections_ms",
+    "connections_errors",
+    "connections_lost",
+    "returns_bad",
+)
+
+
+def _pool_stats(pool: ConnectionPool | AsyncConnectionPool, reset: bool) -> dict:
+    stats = pool.pop_stats() if reset else pool.get_stats()
+    queued = stats.get("requests_queued", 0)
+    return {
+        "name": pool.name,
+        "connections_in_use": stats["pool_size"] - stats["pool_available"],
+        "avg_wait_ms": stats.get("requests_wait_ms", 0) / queued if queued else 0,
+        "stats": {**dict.fromkeys(_COUNTERS, 0), **stats},
+    }
+
+
+def get_pool_stats(reset: bool = False) -> dict:
+    """
+    Report the state and counters of this worker's connection pools.
+
+    These are the pools the sync views use; with async views, see
+    `get_pool_stats_async`.
+
+    Args:
+        reset (bool): Reset the counters after reading them, so that the next
+            call reports only what happened in between.
+
+    Returns:
+        dict: Primary pool statistics, with the replica pools' under `replicas`.
+
+        {name, connections_in_use, avg_wait_ms, stats: {pool_min, pool_max,
+        pool_size, pool_available, requests_waiting, requests_num,
+        requests_queued, requests_wait_ms, ...}, replicas: [{name, ...},...]}
+
+        Counters psycopg_pool has not incremented yet are reported as 0.
+    """
+    return {
+        **_pool_stats(get_pool(), reset),
+        "replicas": [_pool_stats(pool, reset) for pool in get_replica_pools()],
+    }
+
+
+async def get_pool_stats_async(reset: bool = False) -> dict:
+    """Async counterpart of `get_pool_stats`; reports the async views' pools."""
+    return {
+        **_pool_stats(await get_async_pool(), reset),
+        "replicas": [
+            _pool_stats(pool, reset) for pool in await get_async_replica_pools()
+        ],
+    }
+
+
+def get_cache_stats(reset: bool = False) -> dict:
+    """
+    Report the counters of this worker's row caches.
+
+    Args:
+        reset (bool): Reset the hit and miss counters after reading them.
+
+    Returns:
+        dict: Hit and miss counters per cache, and the shared backend's
+        counters (empty when caching is disabled).
+
+        {users: {hits, misses}, transactions: {hits, misses},
+        backend: {entries, bytes, evictions}}
+    """
+    return {
+        "users": user_cache.stats(reset),
+        "transactions": transaction_cache.stats(reset),
+        "backend": backend_stats(),
+    }
+
+
+def get_password_hashing_stats(reset: bool = False) -> dict:
+    """
+    Report the queue depth and counters of this worker's password hashing pool.
+
+    Args:
+        reset (bool): Reset the peak, completed and rejected counters after
+            reading them.
+
+    Returns:
+        dict: {workers, pending, max_pending, peak_pending, completed, rejected}
+    """
+    return hash_pool_stats(reset)
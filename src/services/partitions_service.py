@@ -0,0 +1,77 @@
+from datetime import date
+
+from src.repositories.partitions_repo import (
+    create_partition,
+    detach_partition,
+    list_partitions,
+)
+
+
+def _period_bounds(start: date, interval: str) -> tuple[str, date, date]:
+    """Return the partition name and bounds of the period containing `start`."""
+    if interval == "year":
+        lower = date(start.year, 1, 1)
+        return f"transactions_y{lower.year}", lower, date(lower.year + 1, 1, 1)
+    lower = date(start.year, start.month, 1)
+    upper = date(lower.year + lower.month // 12, lower.month % 12 + 1, 1)
+    return f"transactions_m{lower:%Y_%m}", lower, upper
+
+
+def create_future_partitions(
+    interval: str, ahead: int, today: date | None = None
+) -> list[dict]:
+    """
+    Create partitions for the current period and the `ahead` following ones.
+
+    Periods overlapping an existing partition (e.g. a month inside an
+    existing yearly partition) are skipped, so the command can run on a
+    schedule.
+
+    Args:
+        interval (str): Partition size, 'year' or 'month'.
+        ahead (int): Number of future periods to create.
+        today (date | None): Reference date. Defaults to today.
+
+    Returns:
+        list[dict]: Created partitions in order.
+
+        [{name, lower, upper, moved},...]
+
+        moved is the number of rows taken over from the default partition.
+    """
+    existing = [p for p in list_partitions() if p["lower"] is not None]
+    start = today or date.today()
+    created = []
+    for _ in range(ahead + 1):
+        name, lower, upper = _period_bounds(start, interval)
+        start = upper
+        if any(p["lower"] < upper and lower < p["upper"] for p in existing):
+            continue
+        moved = create_partition(name, lower, upper)
+        created.append({"name": name, "lower": lower, "upper": upper, "moved": moved})
+    return created
+
+
+def detach_partitions_before(before: date, drop: bool = False) -> list[dict]:
+    """
+    Detach every partition that only holds transactions dated before `before`.
+
+    Args:
+        before (date): Partitions whose upper bound is on or before this date
+            are detached.
+        drop (bool): Drop the detached tables instead of keeping them.
+
+    Returns:
+        list[dict]: Detached partitions in order.
+
+        [{name, lower, upper, rollups_deleted},...]
+    """
+    detached = []
+    for partition in list_partitions():
+        if partition["upper"] is None or partition["upper"] > before:
+            continue
+        deleted = detach_partition(
+            partition["name"], partition["lower"], partition["upper"], drop
+        )
+        detached.append({**partition, "rollups_deleted": deleted})
+    return detached
@@ -1,22 +1,74 @@
+import csv
+import io
+import json
+from collections.abc import Callable, Iterator
+from datetime import date, timedelta
+from decimal import Decimal
+from itertools import batched
+from typing import IO, Any
+
+import msgpack
 from pydantic import ValidationError
 
-from src.exceptions import AppError, BadRequestError, NotFoundError
+from src.config import settings
+from src.exceptions import BadRequestError, NotFoundError, extract_loc_msg
+from src.repositories.rollups_repo import get_rollup_summary, get_rollup_summary_async
 from src.repositories.transactions_repo import (
+    apply_transaction_batch,
+    apply_transaction_batch_async,
+    copy_transactions,
     erase_transaction,
+    erase_transaction_async,
     get_all_transactions,
+    get_all_transactions_async,
     get_transaction_by_id,
+    get_transaction_by_id_async,
+    get_transaction_summary,
+    get_transaction_summary_async,
     insert_transaction,
+    insert_transaction_async,
+    iter_transactions,
+    search_transactions,
+    search_transactions_async,
     update_transaction,
+    update_transaction_async,
 )
 from src.schemas.transaction_schemas import (
+    CreateOperationIn,
+    DeleteOperationIn,
+    PatchOperationIn,
+    TransactionBatchOut,
     TransactionId,
+    TransactionImportOut,
+    TransactionIn,
     TransactionOut,
+    TransactionSearchOut,
     TransactionsOut,
+    TransactionSummaryOut,
+)
+from src.utils.json_provider import MSGPACK_MIMETYPE
+from src.utils.pagination import (
+    decode_cursor,
+    decode_search_cursor,
+    encode_cursor,
+    encode_search_cursor,
 )
+from src.utils.serialization import dump_response
+
+EXPORT_COLUMNS = ("id", "kind", "transaction_date", "amount", "description")
+IMPORT_COLUMNS = ("kind", "transaction_date", "amount", "description")
+
+
+class _ImportRejectedError(Exception):
+    """Aborts a running COPY once the upload is known to contain invalid lines."""
 
 
 def create_transaction(
-    user_id: int, kind: str, transaction_date: str, amount: float, description: str
+    user_id: int,
+    kind: str,
+    transaction_date: date,
+    amount: Decimal,
+    description: str,
 ) -> dict:
     """
     Create a transaction for the current user.
@@ -24,8 +76,8 @@ def create_transaction(
     Args:
         user_id (int): User ID
         kind (str): Transaction kind ('expense' or 'income')
-        transaction_date (str): Transaction date (YYYY-MM-DD)
-        amount (float): Transaction amount
+        transaction_date (date): Transaction date
+        amount (Decimal): Transaction amount
         description (str): Transaction description
 
     Returns:
@@ -34,22 +86,23 @@ def create_transaction(
         {tx_id, tx_kind, tx_date, tx_amount, tx_description}
 
     Raises:
-        AppError: If schema validation fails.
+        AppError: If strict output validation fails.
     """
     new_tx = insert_transaction(user_id, kind, transaction_date, amount, description)
-    try:
-        return TransactionOut.model_validate(new_tx).model_dump(mode="json")
-    except ValidationError as err:
-        raise AppError("Internal schema validation error") from err
+    return dump_response(TransactionOut, new_tx)
 
 
-def get_transaction_info(user_id: int, transaction_id: int) -> dict:
+def get_transaction_info(
+    user_id: int, transaction_id: int, data_version: int | None = None
+) -> dict:
     """
     Retrieve a transaction by ID for the current user.
 
     Args:
         user_id (int): User ID
         transaction_id (int): Transaction ID
+        data_version (int | None): The user's data version, read before
+            this call; lets the row cache serve the transaction.
 
     Returns:
         dict: Validated transaction information (TransactionOut schema)
@@ -58,38 +111,307 @@ def get_transaction_info(user_id: int, transaction_id: int) -> dict:
     Raises:
         NotFoundError: If transaction not found.
 
-        AppError: If schema validation fails.
+        AppError: If strict output validation fails.
     """
-    tx_info = get_transaction_by_id(user_id, transaction_id)
+    tx_info = get_transaction_by_id(user_id, transaction_id, data_version)
     if not tx_info:
         raise NotFoundError("Transaction not found")
-    try:
-        return TransactionOut.model_validate(tx_info).model_dump()
-    except ValidationError as err:
-        raise AppError("Internal schema validation error") from err
+    return dump_response(TransactionOut, tx_info)
 
 
-def get_transaction_list(user_id: int) -> dict:
+def get_transaction_list(
+    user_id: int,
+    limit: int,
+    cursor: str | None = None,
+    sort: str = "date",
+    filters: dict | None = None,
+) -> dict:
     """
-    Retrieve all transactions for the current user.
+    Retrieve one filtered, sorted page of transactions for the current user.
 
     Args:
         user_id (int): User ID
+        limit (int): Page size.
+        cursor (str | None): Opaque cursor from a previous page's `next_cursor`.
+        sort (str): 'date', '-date', 'amount' or '-amount'.
+        filters (dict | None): Optional date_from, date_to, kind, min_amount and
+            max_amount values.
 
     Returns:
-          list[dict]: Validated List of transactions (TransactionOut schema).
+          dict: Validated page of transactions (TransactionsOut schema).
 
-          [{tx_id, tx_kind, tx_date, tx_amount, tx_description},...]
+          {transactions: [{tx_id, tx_kind, tx_date, tx_amount, tx_description},...],
+          next_cursor}
 
-          []: If no transactions exist or user doesn't exist.
+          next_cursor is None on the last page. transactions is [] if no
+          transactions match or user doesn't exist.
     Raises:
-        AppError: If schema validation fails.
+        BadRequestError: If the cursor is malformed or belongs to another sort.
+        AppError: If strict output validation fails.
     """
-    tx_list = get_all_transactions(user_id)
+    after = decode_cursor(cursor, sort) if cursor else None
+    # Fetch one extra row to find out whether another page follows.
+    tx_list = get_all_transactions(user_id, limit + 1, after, sort, filters)
+    return _list_page(tx_list, limit, sort)
+
+
+def _list_page(tx_list: list[dict], limit: int, sort: str) -> dict:
+    """Validate a page fetched with one extra row, adding the next cursor."""
+    next_cursor = None
+    if len(tx_list) > limit:
+        tx_list = tx_list[:limit]
+        last = tx_list[-1]
+        sort_key = "amount" if sort.endswith("amount") else "transaction_date"
+        next_cursor = encode_cursor(sort, last[sort_key], last["id"])
+    return dump_response(
+        TransactionsOut, {"transactions": tx_list, "next_cursor": next_cursor}
+    )
+
+
+def search_transaction_list(
+    user_id: int, q: str, limit: int, cursor: str | None = None
+) -> dict:
+    """
+    Retrieve one page of the current user's transactions matching `q`, best first.
+
+    Full-text search is tried first; if it matches nothing, the search falls
+    back to fuzzy (trigram) matching so that typos still find results. The
+    strategy used is reported as `match` and kept by the cursor.
+
+    Args:
+        user_id (int): User ID
+        q (str): Search text.
+        limit (int): Page size.
+        cursor (str | None): Opaque cursor from a previous page's `next_cursor`.
+
+    Returns:
+          dict: Validated page of results (TransactionSearchOut schema).
+
+          {match, results: [{id, kind, transaction_date, amount, description,
+          rank},...], next_cursor}
+
+          next_cursor is None on the last page. results is [] if nothing matches.
+    Raises:
+        BadRequestError: If the cursor is malformed.
+        AppError: If strict output validation fails.
+    """
+    if cursor:
+        match, rank, tx_id = decode_search_cursor(cursor)
+        hits = search_transactions(user_id, q, match, limit + 1, (rank, tx_id))
+    else:
+        match = "fulltext"
+        hits = search_transactions(user_id, q, match, limit + 1)
+        if not hits:
+            match = "fuzzy"
+            hits = search_transactions(user_id, q, match, limit + 1)
+    return _search_page(match, hits, limit)
+
+
+def _search_page(match: str, hits: list[dict], limit: int) -> dict:
+    """Validate a search page fetched with one extra row, adding the next cursor."""
+    next_cursor = None
+    if len(hits) > limit:
+        hits = hits[:limit]
+        next_cursor = encode_search_cursor(match, hits[-1]["rank"], hits[-1]["id"])
+    return dump_response(
+        TransactionSearchOut,
+        {"match": match, "results": hits, "next_cursor": next_cursor},
+    )
+
+
+def get_spending_summary(
+    user_id: int,
+    group_by: str,
+    date_from: date | None,
+    date_to: date | None,
+    percentiles: bool = True,
+) -> dict:
+    """
+    Summarize the current user's income and expenses per period.
+
+    Monthly and yearly summaries over whole months that don't need
+    percentiles are read from the monthly rollups instead of scanning
+    transactions.
+
+    Args:
+        user_id (int): User ID
+        group_by (str): 'day', 'week', 'month' or 'year'.
+        date_from (date | None): Inclusive start date.
+        date_to (date | None): Inclusive end date.
+        percentiles (bool): Whether to compute expense percentiles.
+
+    Returns:
+        dict: Validated summary (TransactionSummaryOut schema).
+
+        {group_by, buckets: [{period, income, expense, net, count, ...},...]}
+
+    Raises:
+        AppError: If strict output validation fails.
+    """
+    if _use_rollups(group_by, date_from, date_to, percentiles):
+        buckets = get_rollup_summary(user_id, group_by, date_from, date_to)
+    else:
+        buckets = get_transaction_summary(user_id, group_by, date_from, date_to)
+    return _summary_out(group_by, buckets, percentiles)
+
+
+def _use_rollups(
+    group_by: str, date_from: date | None, date_to: date | None, percentiles: bool
+) -> bool:
+    """Whether a summary can be read from the monthly rollups."""
+    whole_months = (date_from is None or date_from.day == 1) and (
+        date_to is None or (date_to + timedelta(days=1)).day == 1
+    )
+    return not percentiles and group_by in ("month", "year") and whole_months
+
+
+def _summary_out(group_by: str, buckets: list[dict], percentiles: bool) -> dict:
+    """Validate summary buckets, blanking percentiles that were not requested."""
+    if not percentiles:
+        for bucket in buckets:
+            bucket["expense_p50"] = bucket["expense_p90"] = None
+    return dump_response(
+        TransactionSummaryOut, {"group_by": group_by, "buckets": buckets}
+    )
+
+
+def export_transactions(user_id: int, export_format: str) -> Iterator[str]:
+    """
+    Stream all transactions of the current user as CSV or NDJSON.
+
+    Rows are encoded as they arrive from the server-side cursor and emitted
+    in chunks of `EXPORT_ITERSIZE` rows, so neither the row list nor its
+    pydantic/dict representations are ever fully materialized.
+
+    Args:
+        user_id (int): User ID
+        export_format (str): 'csv' or 'ndjson'.
+
+    Yields:
+        str: Encoded chunk of the export (CSV starts with a header line).
+    """
+    itersize = settings.EXPORT_ITERSIZE
+    buffer = io.StringIO()
+    write_row: Callable[[tuple], Any]
+    if export_format == "csv":
+        writer = csv.writer(buffer, lineterminator="\n")
+        writer.writerow(EXPORT_COLUMNS)
+        write_row = writer.writerow
+    else:
+
+        def write_row(row: tuple) -> None:
+            record = dict(zip(EXPORT_COLUMNS, row, strict=True))
+            buffer.write(json.dumps(record) + "\n")
+
+    rows = iter_transactions(user_id, itersize)
+    for count, (tx_id, kind, tx_date, amount, description) in enumerate(rows, 1):
+        write_row((tx_id, kind, tx_date.isoformat(), str(amount), description))
+        if count % itersize == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def import_transactions(user_id: int, mimetype: str, stream: IO[bytes]) -> dict:
+    """
+    Bulk import transactions for the current user from a CSV, NDJSON or
+    MessagePack upload.
+
+    Lines are read and validated against TransactionIn in batches of
+    `IMPORT_BATCH_SIZE` and streamed into a single COPY. The import is
+    all-or-nothing: if any line is invalid, the COPY is rolled back and the
+    report lists the offending lines (at most `IMPORT_MAX_ERRORS`).
+
+    Args:
+        user_id (int): User ID
+        mimetype (str): 'text/csv', 'application/x-ndjson' or 'application/msgpack'.
+        stream (IO[bytes]): Request body (UTF-8 for CSV and NDJSON).
+
+    Returns:
+        dict: Import report (TransactionImportOut schema).
+
+        {imported, errors: [{line, errors: [{loc, msg}, ...]}, ...]}
+
+    Raises:
+        BadRequestError: If the CSV header is missing columns, the CSV is
+            malformed, the body is not UTF-8 or it is not valid MessagePack.
+        AppError: If strict output validation fails.
+    """
+    errors: list[dict] = []
+    records = _iter_import_records(mimetype, stream)
     try:
-        return TransactionsOut.model_validate({"transactions": tx_list}).model_dump()
-    except ValidationError as err:
-        raise AppError("Internal schema validation error") from err
+        imported = copy_transactions(user_id, _validated_rows(records, errors))
+    except _ImportRejectedError:
+        imported = 0
+    except UnicodeDecodeError as err:
+        raise BadRequestError("Upload must be UTF-8 encoded") from err
+    return dump_response(TransactionImportOut, {"imported": imported, "errors": errors})
+
+
+def _iter_import_records(
+    mimetype: str, stream: IO[bytes]
+) -> Iterator[tuple[int, dict | str]]:
+    """
+    Yield (line number, record): CSV rows and MessagePack maps as dicts,
+    NDJSON lines as raw JSON. A MessagePack object's position is its line.
+    """
+    if mimetype == MSGPACK_MIMETYPE:
+        unpacker = msgpack.Unpacker(stream)
+        try:
+            yield from enumerate(unpacker, 1)
+            # Iteration stops quietly on a truncated object; this raises instead.
+            unpacker.read_bytes(1)
+        except ValueError as err:
+            raise BadRequestError("Upload must be valid MessagePack") from err
+        return
+    text = io.TextIOWrapper(stream, encoding="utf-8", newline="")
+    if mimetype == "text/csv":
+        reader = csv.DictReader(text)
+        try:
+            if not set(IMPORT_COLUMNS) <= set(reader.fieldnames or ()):
+                raise BadRequestError(
+                    f"CSV header must contain: {', '.join(IMPORT_COLUMNS)}"
+                )
+            for record in reader:
+                yield reader.line_num, record
+        except csv.Error as err:
+            # E.g. a field longer than csv.field_size_limit(). The DictReader's
+            # own line_num only counts the rows it returned.
+            raise BadRequestError(
+                f"Upload must be valid CSV (line {reader.reader.line_num}): {err}"
+            ) from err
+    else:
+        for line_no, line in enumerate(text, 1):
+            if line.strip():
+                yield line_no, line
+
+
+def _validated_rows(
+    records: Iterator[tuple[int, dict | str]], errors: list[dict]
+) -> Iterator[tuple]:
+    """Validate records batch by batch, yielding COPY rows and collecting errors."""
+    for batch in batched(records, settings.IMPORT_BATCH_SIZE):
+        valid = []
+        for line_no, record in batch:
+            try:
+                tx = (
+                    TransactionIn.model_validate_json(record)
+                    if isinstance(record, str)
+                    else TransactionIn.model_validate(record)
+                )
+            except ValidationError as err:
+                errors.append({"line": line_no, "errors": extract_loc_msg(err)})
+                if len(errors) >= settings.IMPORT_MAX_ERRORS:
+                    raise _ImportRejectedError from err
+                continue
+            valid.append((tx.kind, tx.transaction_date, tx.amount, tx.description))
+        # Once a line failed the import is rejected; keep validating for the report.
+        if not errors:
+            yield from valid
+    if errors:
+        raise _ImportRejectedError
 
 
 def update_transaction_info(user_id: int, transaction_id: int, data: dict) -> dict:
@@ -107,17 +429,14 @@ def update_transaction_info(user_id: int, transaction_id: int, data: dict) -> di
     Raises:
         BadRequestError: If no data is provided.
         NotFoundError: If transaction not found.
-        AppError: If schema validation fails.
+        AppError: If strict output validation fails.
     """
     if not data:
         raise BadRequestError("No data provided")
     updated_tx = update_transaction(user_id, transaction_id, data)
     if not updated_tx:
         raise NotFoundError("Transaction not found")
-    try:
-        return TransactionOut.model_validate(updated_tx).model_dump()
-    except ValidationError as err:
-        raise AppError("Internal schema validation error") from err
+    return dump_response(TransactionOut, updated_tx)
 
 
 def delete_transaction(user_id: int, transaction_id: int) -> dict:
@@ -133,12 +452,187 @@ def delete_transaction(user_id: int, transaction_id: int) -> dict:
 
     Raises:
         NotFoundError: If transaction not found.
-        AppError: If schema validation fails.
+        AppError: If strict output validation fails.
     """
     deleted_tx = erase_transaction(user_id, transaction_id)
     if not deleted_tx:
         raise NotFoundError("Transaction not found")
-    try:
-        return TransactionId.model_validate(deleted_tx).model_dump()
-    except ValidationError as err:
-        raise AppError("Internal schema validation error") from err
+    return dump_response(TransactionId, deleted_tx)
+
+
+def apply_batch(
+    user_id: int,
+    operations: list[CreateOperationIn | PatchOperationIn | DeleteOperationIn],
+) -> dict:
+    """
+    Apply a batch of create, patch and delete operations for the current user.
+
+    The batch runs in one database transaction: either every operation is
+    applied or none is.
+
+    Args:
+        user_id (int): User ID
+        operations (list): Validated batch operations (TransactionBatchIn schema).
+
+    Returns:
+        dict: Per-operation results in request order (TransactionBatchOut schema).
+
+        {results: [{op, id, transaction}, ...]}
+
+    Raises:
+        BadRequestError: If a patch operation has no data.
+        NotFoundError: If a patched or deleted transaction does not exist.
+        AppError: If strict output validation fails.
+    """
+    results = apply_transaction_batch(user_id, _batch_operations(operations))
+    return _batch_out(operations, results)
+
+
+def _batch_operations(
+    operations: list[CreateOperationIn | PatchOperationIn | DeleteOperationIn],
+) -> list[tuple[str, int | None, dict]]:
+    """Convert validated operations to repository (op, id, data) tuples."""
+    batch: list[tuple[str, int | None, dict]] = []
+    for index, operation in enumerate(operations):
+        if isinstance(operation, DeleteOperationIn):
+            batch.append((operation.op, operation.id, {}))
+        elif isinstance(operation, PatchOperationIn):
+            data = operation.data.model_dump(exclude_unset=True)
+            if not data:
+                raise BadRequestError(f"No data provided (operation {index})")
+            batch.append((operation.op, operation.id, data))
+        else:
+            batch.append((operation.op, None, operation.data.model_dump()))
+    return batch
+
+
+def _batch_out(
+    operations: list[CreateOperationIn | PatchOperationIn | DeleteOperationIn],
+    results: list[dict | None],
+) -> dict:
+    """Validate batch results, failing on the first missing transaction."""
+    found: list[dict] = []
+    for index, result in enumerate(results):
+        if result is None:
+            raise NotFoundError(f"Transaction not found (operation {index})")
+        found.append(result)
+    return dump_response(
+        TransactionBatchOut,
+        {
+            "results": [
+                {
+                    "op": operation.op,
+                    "id": result["id"],
+                    "transaction": None if operation.op == "delete" else result,
+                }
+                for operation, result in zip(operations, found, strict=True)
+            ]
+        },
+    )
+
+
+# Async counterparts of the request-path services above, used by the async
+# views (see `create_app`). Validation and errors are the same.
+
+
+async def create_transaction_async(
+    user_id: int,
+    kind: str,
+    transaction_date: date,
+    amount: Decimal,
+    description: str,
+) -> dict:
+    """Async counterpart of `create_transaction`."""
+    new_tx = await insert_transaction_async(
+        user_id, kind, transaction_date, amount, description
+    )
+    return dump_response(TransactionOut, new_tx)
+
+
+async def get_transaction_info_async(
+    user_id: int, transaction_id: int, data_version: int | None = None
+) -> dict:
+    """Async counterpart of `get_transaction_info`."""
+    tx_info = await get_transaction_by_id_async(user_id, transaction_id, data_version)
+    if not tx_info:
+        raise NotFoundError("Transaction not found")
+    return dump_response(TransactionOut, tx_info)
+
+
+async def get_transaction_list_async(
+    user_id: int,
+    limit: int,
+    cursor: str | None = None,
+    sort: str = "date",
+    filters: dict | None = None,
+) -> dict:
+    """Async counterpart of `get_transaction_list`."""
+    after = decode_cursor(cursor, sort) if cursor else None
+    tx_list = await get_all_transactions_async(user_id, limit + 1, after, sort, filters)
+    return _list_page(tx_list, limit, sort)
+
+
+async def search_transaction_list_async(
+    user_id: int, q: str, limit: int, cursor: str | None = None
+) -> dict:
+    """Async counterpart of `search_transaction_list`."""
+    if cursor:
+        match, rank, tx_id = decode_search_cursor(cursor)
+        hits = await search_transactions_async(
+            user_id, q, match, limit + 1, (rank, tx_id)
+        )
+    else:
+        match = "fulltext"
+        hits = await search_transactions_async(user_id, q, match, limit + 1)
+        if not hits:
+            match = "fuzzy"
+            hits = await search_transactions_async(user_id, q, match, limit + 1)
+    return _search_page(match, hits, limit)
+
+
+async def get_spending_summary_async(
+    user_id: int,
+    group_by: str,
+    date_from: date | None,
+    date_to: date | None,
+    percentiles: bool = True,
+) -> dict:
+    """Async counterpart of `get_spending_summary`."""
+    if _use_rollups(group_by, date_from, date_to, percentiles):
+        buckets = await get_rollup_summary_async(user_id, group_by, date_from, date_to)
+    else:
+        buckets = await get_transaction_summary_async(
+            user_id, group_by, date_from, date_to
+        )
+    return _summary_out(group_by, buckets, percentiles)
+
+
+async def update_transaction_info_async(
+    user_id: int, transaction_id: int, data: dict
+) -> dict:
+    """Async counterpart of `update_transaction_info`."""
+    if not data:
+        raise BadRequestError("No data provided")
+    updated_tx = await update_transaction_async(user_id, transaction_id, data)
+    if not updated_tx:
+        raise NotFoundError("Transaction not found")
+    return dump_response(TransactionOut, updated_tx)
+
+
+async def delete_transaction_async(user_id: int, transaction_id: int) -> dict:
+    """Async counterpart of `delete_transaction`."""
+    deleted_tx = await erase_transaction_async(user_id, transaction_id)
+    if not deleted_tx:
+        raise NotFoundError("Transaction not found")
+    return dump_response(TransactionId, deleted_tx)
+
+
+async def apply_batch_async(
+    user_id: int,
+    operations: list[CreateOperationIn | PatchOperationIn | DeleteOperationIn],
+) -> dict:
+    """Async counterpart of `apply_batch`."""
+    results = await apply_transaction_batch_async(
+        user_id, _batch_operations(operations)
+    )
+    return _batch_out(operations, results)
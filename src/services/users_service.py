@@ -1,32 +1,38 @@
-from pydantic import ValidationError
-
-from src.exceptions import AppError, BadRequestError, NotFoundError
-from src.repositories.users_repo import delete_user, get_user, update_user
+from src.exceptions import BadRequestError, NotFoundError
+from src.repositories.users_repo import (
+    delete_user,
+    delete_user_async,
+    get_user,
+    get_user_async,
+    update_user,
+    update_user_async,
+)
 from src.schemas.auth_user_schemas import DeleteUserOut, UpdateUserOut, UserOut
-from src.utils.password import hash_password
+from src.utils.password import hash_password, hash_password_async
+from src.utils.revocation import note_user_revoked
+from src.utils.serialization import dump_response
 
 
-def get_user_info(user_id: int) -> dict:
+def get_user_info(user_id: int, data_version: int | None = None) -> dict:
     """
     Retrieve a user's information by ID.
 
     Args:
         user_id (int): The unique identifier of the user.
+        data_version (int | None): The user's data version, read before
+            this call; lets the row cache serve the user.
 
     Returns:
           dict: Validated user information (username, email).
 
     Raises:
           NotFoundError: If no user exist with the given ID.
-          AppError: If schema validation fails.
+          AppError: If strict output validation fails.
     """
-    user_info = get_user(user_id)
+    user_info = get_user(user_id, data_version)
     if not user_info:
         raise NotFoundError("User not found")
-    try:
-        return UserOut.model_validate(user_info).model_dump()
-    except ValidationError as err:
-        raise AppError("Internal schema validation error") from err
+    return dump_response(UserOut, user_info)
 
 
 def update_user_info(user_id: int, data: dict) -> dict:
@@ -43,25 +49,22 @@ def update_user_info(user_id: int, data: dict) -> dict:
     Raises:
           BadRequestError: If data is empty.
           NotFoundError: If no user exist with the given ID.
-          AppError: If schema validation fails.
+          ServiceUnavailableError: If the password hashing pool is saturated.
+          AppError: If strict output validation fails.
     """
     if not data:
         raise BadRequestError("No data provided")
     if "password_hash" in data:
-        pwd = data.get("password_hash")
-        data["password_hash"] = hash_password(pwd)
+        data["password_hash"] = hash_password(data["password_hash"])
     updated_info = update_user(user_id, data)
     if not updated_info:
         raise NotFoundError("User not found")
-    try:
-        return UpdateUserOut.model_validate(updated_info).model_dump()
-    except ValidationError as err:
-        raise AppError("Internal schema validation error") from err
+    return dump_response(UpdateUserOut, updated_info)
 
 
 def delete_user_account(user_id: int) -> dict:
     """
-    Delete a user by their ID.
+    Delete a user by their ID, revoking all of their access tokens.
 
     Args:
         user_id (int): ID of the user to delete.
@@ -71,12 +74,46 @@ def delete_user_account(user_id: int) -> dict:
 
     Raises:
           NotFoundError: If no user exist with the given ID.
-          AppError: If schema validation fails.
+          AppError: If strict output validation fails.
     """
     deleted_username = delete_user(user_id)
     if not deleted_username:
         raise NotFoundError("User not found")
-    try:
-        return DeleteUserOut.model_validate(deleted_username).model_dump()
-    except ValidationError as err:
-        raise AppError("Internal schema validation error") from err
+    note_user_revoked(user_id)
+    return dump_response(DeleteUserOut, deleted_username)
+
+
+# Async counterparts, used by the async views (see `create_app`).
+
+
+async def get_user_info_async(user_id: int, data_version: int | None = None) -> dict:
+    """Async counterpart of `get_user_info`."""
+    user_info = await get_user_async(user_id, data_version)
+    if not user_info:
+        raise NotFoundError("User not found")
+    return dump_response(UserOut, user_info)
+
+
+async def update_user_info_async(user_id: int, data: dict) -> dict:
+    """
+    Async counterpart of `update_user_info`.
+
+    Password hashing awaits the hashing pool instead of blocking the event loop.
+    """
+    if not data:
+        raise BadRequestError("No data provided")
+    if "password_hash" in data:
+        data["password_hash"] = await hash_password_async(data["password_hash"])
+    updated_info = await update_user_async(user_id, data)
+    if not updated_info:
+        raise NotFoundError("User not found")
+    return dump_response(UpdateUserOut, updated_info)
+
+
+async def delete_user_account_async(user_id: int) -> dict:
+    """Async counterpart of `delete_user_account`."""
+    deleted_username = await delete_user_async(user_id)
+    if not deleted_username:
+        raise NotFoundError("User not found")
+    note_user_revoked(user_id)
+    return dump_response(DeleteUserOut, deleted_username)
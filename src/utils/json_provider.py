@@ -0,0 +1,116 @@
+from datetime import date
+from decimal import Decimal
+from typing import Any, cast
+
+import msgpack
+import orjson
+from flask import Response, has_request_context, request
+from flask.json.provider import DefaultJSONProvider, JSONProvider
+
+MSGPACK_MIMETYPE = "application/msgpack"
+
+
+def _default(obj: Any) -> Any:
+    """Encode the types orjson does not handle natively."""
+    if isinstance(obj, Decimal):
+        # As a string, so amounts keep their exact value and scale ("12.50").
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _msgpack_default(obj: Any) -> Any:
+    """Encode Decimals and dates for MessagePack as the JSON providers do."""
+    if isinstance(obj, Decimal):
+        return str(obj)
+    if isinstance(obj, date):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not serializable")
+
+
+def wants_msgpack() -> bool:
+    """Whether the current request's Accept header prefers MessagePack to JSON."""
+    return (
+        has_request_context()
+        and request.accept_mimetypes.best_match(("application/json", MSGPACK_MIMETYPE))
+        == MSGPACK_MIMETYPE
+    )
+
+
+def _response_class(provider: JSONProvider) -> type[Response]:
+    # Typed on the sansio App, which only a Flask app is at runtime.
+    return cast(type[Response], provider._app.response_class)
+
+
+class _MsgpackNegotiation(JSONProvider):
+    """
+    Encodes responses as MessagePack for clients that prefer it.
+
+    `jsonify` and dicts returned by views go through `response`, so every
+    endpoint negotiates: 'Accept: application/msgpack' gets MessagePack,
+    anything else (or no Accept header) gets JSON.
+    """
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        if wants_msgpack():
+            obj = self._prepare_response_obj(args, kwargs)
+            response = _response_class(self)(
+                msgpack.packb(obj, default=_msgpack_default),
+                mimetype=MSGPACK_MIMETYPE,
+            )
+        else:
+            response = cast(Response, super().response(*args, **kwargs))
+        response.vary.add("Accept")
+        return response
+
+
+class OrjsonProvider(JSONProvider):
+    """
+    JSON provider encoding and decoding with orjson.
+
+    Dates are encoded natively as ISO 8601 strings and Decimals as strings.
+    Keys keep their insertion order; responses are indented in debug mode.
+    """
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj, default=_default).decode()
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        obj = self._prepare_response_obj(args, kwargs)
+        option = orjson.OPT_APPEND_NEWLINE
+        if self._app.debug:
+            option |= orjson.OPT_INDENT_2
+        return _response_class(self)(
+            orjson.dumps(obj, default=_default, option=option),
+            mimetype="application/json",
+        )
+
+
+class StdlibProvider(DefaultJSONProvider):
+    """
+    Flask's default provider, encoding dates as ISO 8601 like `OrjsonProvider`.
+
+    Flask itself encodes dates as HTTP dates ('Sat, 01 Mar 2025 00:00:00 GMT').
+    """
+
+    @staticmethod
+    def default(o: Any) -> Any:
+        if isinstance(o, date):
+            return o.isoformat()
+        return DefaultJSONProvider.default(o)
+
+
+class NegotiatingOrjsonProvider(_MsgpackNegotiation, OrjsonProvider):
+    """`OrjsonProvider` with MessagePack content negotiation."""
+
+
+class NegotiatingStdlibProvider(_MsgpackNegotiation, StdlibProvider):
+    """`StdlibProvider` with MessagePack content negotiation."""
+
+
+JSON_PROVIDERS: dict[str, type[JSONProvider]] = {
+    "orjson": NegotiatingOrjsonProvider,
+    "stdlib": NegotiatingStdlibProvider,
+}
@@ -1,5 +1,13 @@
 import datetime
+import hmac
+import inspect
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Callable
 from functools import wraps
+from typing import Any
 
 import jwt
 from flask import g, request
@@ -8,12 +16,16 @@ from pydantic import ValidationError
 from src.config import settings
 from src.exceptions import UnauthorizedError
 from src.schemas.jwt_schemas import JWTPayload
+from src.utils.rate_limit import limit_user
+from src.utils.revocation import ensure_not_revoked, ensure_not_revoked_async
 
 
 def create_access_token(user_id: int) -> str:
     """
     Creates a signed JWT access token for a given user ID.
 
+    Each token gets a unique `jti`, so that it can be revoked on its own.
+
     Args:
         user_id (int): The ID of the user.
 
@@ -23,10 +35,12 @@ def create_access_token(user_id: int) -> str:
     Raises:
         jwt.PyJWTError: If token encoding fails.
     """
+    now = datetime.datetime.now(datetime.UTC)
     payload = {
         "sub": str(user_id),
-        "exp": datetime.datetime.now(datetime.UTC)
-        + datetime.timedelta(seconds=settings.JWT_EXPIRE_IN),
+        "iat": now,
+        "exp": now + datetime.timedelta(seconds=settings.JWT_EXPIRE_IN),
+        "jti": str(uuid.uuid4()),
     }
     return jwt.encode(
         payload, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM
@@ -61,12 +75,83 @@ def decode_token(token: str) -> JWTPayload:
         raise UnauthorizedError("Invalid token data") from err
 
 
-def jwt_required(f):
+class _VerifiedTokens:
+    """
+    Payloads of recently verified tokens, least recently used evicted first.
+
+    Entries are keyed by an HMAC of the token under the signing key, so raw
+    tokens are never kept and a new key invalidates every entry. An entry is
+    only returned while its token's `exp` is in the future.
+    """
+
+    def __init__(self) -> None:
+        self._entries: OrderedDict[bytes, JWTPayload] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, digest: bytes) -> JWTPayload | None:
+        with self._lock:
+            payload = self._entries.get(digest)
+            if payload is None:
+                return None
+            if payload.exp <= time.time():
+                del self._entries[digest]
+                return None
+            self._entries.move_to_end(digest)
+            return payload
+
+    def add(self, digest: bytes, payload: JWTPayload) -> None:
+        with self._lock:
+            self._entries[digest] = payload
+            while len(self._entries) > settings.JWT_CACHE_SIZE:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_verified_tokens = _VerifiedTokens()
+
+
+def verify_token(token: str) -> JWTPayload:
+    """
+    Return the payload of a valid access token, verifying each token once.
+
+    A token's payload is cached after its first successful `decode_token`,
+    so the clients reusing it skip signature verification until it expires.
+    Revocation is not checked here (see `ensure_not_revoked`).
+
+    Args:
+        token (str): The encoded JWT token.
+
+    Returns:
+        JWTPayload: The decoded token payload.
+
+    Raises:
+        UnauthorizedError: If the token is expired, invalid, or contains invalid data.
+    """
+    digest = hmac.digest(settings.JWT_SECRET_KEY.encode(), token.encode(), "sha256")
+    payload = _verified_tokens.get(digest)
+    if payload is None:
+        payload = decode_token(token)
+        _verified_tokens.add(digest, payload)
+    return payload
+
+
+def jwt_required(f: Callable) -> Callable:
     """
     Flask route decorator that enforces JWT authentication.
 
+    Works on both sync and async route functions.
+
     Extracts and verifies the 'Authorization: Bearer <token>' header,
-    decodes the token, and attaches `user_id` to `flask.g`.
+    decodes the token (or reuses its earlier verification, see
+    `verify_token`), rejects revoked tokens, attaches `user_id` and the
+    token's payload (`jwt`) to `flask.g` and takes a token from the user's
+    rate limit bucket.
 
     Args:
         f (Callable): The route function to wrap.
@@ -75,20 +160,50 @@ def jwt_required(f):
         Callable: The wrapped route function.
 
     Raises:
-        UnauthorizedError: If the header is missing, invalid, or the token is invalid.
+        UnauthorizedError: If the header is missing, invalid, or the token is
+            invalid or revoked.
+        TooManyRequestsError: If the user exceeded the blueprint's rate limit.
     """
 
+    if inspect.iscoroutinefunction(f):
+
+        @wraps(f)
+        async def decorated_async(*args: Any, **kwargs: Any) -> Any:
+            payload = _verify_request_token()
+            await ensure_not_revoked_async(payload)
+            _set_current_user(payload)
+            return await f(*args, **kwargs)
+
+        return decorated_async
+
     @wraps(f)
-    def decorated(*args, **kwargs):
-        auth_header = request.headers.get("Authorization")
-        if not auth_header:
-            raise UnauthorizedError("Missing or invalid Authorization header.")
-        parts = auth_header.split()
-        if not parts[0] == "Bearer":
-            raise UnauthorizedError("Missing or invalid Bearer header.")
-        token = parts[1]
-        payload = decode_token(token)
-        g.user_id = payload.sub
+    def decorated(*args: Any, **kwargs: Any) -> Any:
+        _authenticate_request()
         return f(*args, **kwargs)
 
     return decorated
+
+
+def _authenticate_request() -> None:
+    """Authenticate the request's bearer token and rate limit its user."""
+    payload = _verify_request_token()
+    ensure_not_revoked(payload)
+    _set_current_user(payload)
+
+
+def _verify_request_token() -> JWTPayload:
+    """Return the verified payload of the request's bearer token."""
+    auth_header = request.headers.get("Authorization")
+    if not auth_header:
+        raise UnauthorizedError("Missing or invalid Authorization header.")
+    parts = auth_header.split()
+    if not parts[0] == "Bearer":
+        raise UnauthorizedError("Missing or invalid Bearer header.")
+    return verify_token(parts[1])
+
+
+def _set_current_user(payload: JWTPayload) -> None:
+    """Set `g.jwt` and `g.user_id`, and rate limit the user."""
+    g.jwt = payload
+    g.user_id = payload.sub
+    limit_user(payload.sub)
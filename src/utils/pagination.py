@@ -0,0 +1,128 @@
+import base64
+import binascii
+import json
+import math
+from datetime import date
+from decimal import Decimal, InvalidOperation
+from typing import Any
+
+from src.exceptions import BadRequestError
+
+# transactions.id is a SERIAL (int4) column.
+MAX_TRANSACTION_ID = 2**31 - 1
+
+# Digits PostgreSQL's NUMERIC accepts before and after the decimal point.
+NUMERIC_MAX_INTEGER_DIGITS = 131_072
+NUMERIC_MAX_SCALE = 16_383
+
+
+def _check_id(tx_id: Any) -> int:
+    value = int(tx_id)
+    if not 1 <= value <= MAX_TRANSACTION_ID:
+        raise ValueError(f"Transaction ID out of range: {value}")
+    return value
+
+
+def _check_amount(value: Decimal) -> Decimal:
+    exponent = value.as_tuple().exponent
+    # The exponent is 'n', 'N' or 'F' for NaNs and infinities.
+    if (
+        not isinstance(exponent, int)
+        or value.adjusted() >= NUMERIC_MAX_INTEGER_DIGITS
+        or -exponent > NUMERIC_MAX_SCALE
+    ):
+        raise ValueError(f"Amount out of range: {value}")
+    return value
+
+
+def encode_cursor(sort: str, value: date | Decimal, transaction_id: int) -> str:
+    """
+    Encodes the sort key of the last row on a page into an opaque cursor.
+
+    Args:
+        sort (str): Sort order the page was produced with (e.g. '-date').
+        value (date | Decimal): Sort column value of the last returned row.
+        transaction_id (int): Transaction ID of the last returned row.
+
+    Returns:
+        str: URL-safe cursor string.
+    """
+    key = value.isoformat() if isinstance(value, date) else str(value)
+    raw = json.dumps([sort, key, transaction_id])
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, sort: str) -> tuple[date | Decimal, int]:
+    """
+    Decodes an opaque cursor back into its (sort value, id) key.
+
+    Args:
+        cursor (str): Cursor previously returned as `next_cursor`.
+        sort (str): Sort order of the current request.
+
+    Returns:
+        tuple[date | Decimal, int]: Sort column value and ID to continue after.
+
+    Raises:
+        BadRequestError: If the cursor is malformed or was issued for another sort.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        cursor_sort, key, tx_id = json.loads(base64.urlsafe_b64decode(padded))
+        value: date | Decimal
+        if sort.endswith("date"):
+            value = date.fromisoformat(key)
+        else:
+            value = _check_amount(Decimal(key))
+        tx_id = _check_id(tx_id)
+    except (
+        binascii.Error,
+        ValueError,
+        TypeError,
+        OverflowError,
+        InvalidOperation,
+    ) as err:
+        raise BadRequestError("Invalid cursor") from err
+    if cursor_sort != sort:
+        raise BadRequestError("Cursor does not match sort order")
+    return value, tx_id
+
+
+def encode_search_cursor(match: str, rank: float, transaction_id: int) -> str:
+    """
+    Encodes the rank key of the last search result on a page into an opaque cursor.
+
+    Args:
+        match (str): Search strategy the page was produced with.
+        rank (float): Rank of the last returned row.
+        transaction_id (int): Transaction ID of the last returned row.
+
+    Returns:
+        str: URL-safe cursor string.
+    """
+    raw = json.dumps([match, rank, transaction_id])
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_search_cursor(cursor: str) -> tuple[str, float, int]:
+    """
+    Decodes an opaque search cursor back into its (match, rank, id) key.
+
+    Args:
+        cursor (str): Cursor previously returned as `next_cursor`.
+
+    Returns:
+        tuple[str, float, int]: Search strategy, rank and ID to continue after.
+
+    Raises:
+        BadRequestError: If the cursor is malformed.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        match, rank, tx_id = json.loads(base64.urlsafe_b64decode(padded))
+        rank, tx_id = float(rank), _check_id(tx_id)
+    except (binascii.Error, ValueError, TypeError, OverflowError) as err:
+        raise BadRequestError("Invalid cursor") from err
+    if match not in ("fulltext", "fuzzy") or not math.isfinite(rank):
+        raise BadRequestError("Invalid cursor")
+    return match, rank, tx_id
@@ -1,30 +1,171 @@
+import asyncio
+import os
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
+
 import bcrypt
 
+from src.config import settings
+from src.exceptions import ServiceUnavailableError
+
+
+class _HashPool:
+    """
+    The worker threads bcrypt runs on, and their queue-depth counters.
+
+    bcrypt releases the GIL while hashing, so PASSWORD_HASH_WORKERS threads
+    use at most that many cores however many logins arrive at once, leaving
+    the rest to the other endpoints. Operations beyond PASSWORD_HASH_QUEUE_SIZE
+    pending ones are rejected instead of queued.
+    """
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget the worker threads and zero the counters."""
+        self.executor: ThreadPoolExecutor | None = None
+        self.pending = 0
+        self.peak_pending = 0
+        self.completed = 0
+        self.rejected = 0
+        self.lock = threading.Lock()
+
+    def submit[T](self, fn: Callable[..., T], *args: Any) -> Future[T]:
+        with self.lock:
+            if self.pending >= settings.PASSWORD_HASH_QUEUE_SIZE:
+                self.rejected += 1
+                raise ServiceUnavailableError(
+                    "Too many password operations in progress, retry shortly"
+                )
+            if self.executor is None:
+                self.executor = ThreadPoolExecutor(
+                    settings.PASSWORD_HASH_WORKERS, thread_name_prefix="bcrypt"
+                )
+            self.pending += 1
+            self.peak_pending = max(self.peak_pending, self.pending)
+            return self.executor.submit(self._run, fn, *args)
+
+    def _run[T](self, fn: Callable[..., T], *args: Any) -> T:
+        try:
+            return fn(*args)
+        finally:
+            with self.lock:
+                self.pending -= 1
+                self.completed += 1
+
+
+_pool = _HashPool()
+
+
+def _hash(password: str) -> str:
+    salt = bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
+    return bcrypt.hashpw(password.encode("utf-8"), salt).decode("utf-8")
+
+
+def _verify(plain_password: str, hashed_password: str) -> bool:
+    return bcrypt.checkpw(
+        plain_password.encode("utf-8"), hashed_password.encode("utf-8")
+    )
+
 
 def hash_password(password: str) -> str:
     """
-    Hashes a plaintext password using bcrypt.
+    Hashes a plaintext password using bcrypt with BCRYPT_ROUNDS rounds.
+
+    Runs on the password hashing pool; the caller waits for the result.
 
     Args:
         password (str): The plaintext password to hash.
 
     Returns:
         str: The bcrypt-hashed password (UTF-8 string).
+
+    Raises:
+        ServiceUnavailableError: If the hashing pool's queue is full.
     """
-    return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+    return _pool.submit(_hash, password).result()
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     Verifies that a plaintext password matches a bcrypt hash.
 
+    Runs on the password hashing pool; the caller waits for the result.
+
     Args:
         plain_password (str): The plaintext password to check.
         hashed_password (str): The bcrypt-hashed password to compare against.
 
     Returns:
         bool: True if the password matches, False otherwise.
+
+    Raises:
+        ServiceUnavailableError: If the hashing pool's queue is full.
     """
-    return bcrypt.checkpw(
-        plain_password.encode("utf-8"), hashed_password.encode("utf-8")
+    return _pool.submit(_verify, plain_password, hashed_password).result()
+
+
+async def hash_password_async(password: str) -> str:
+    """Async counterpart of `hash_password`; awaits the pool without blocking."""
+    return await asyncio.wrap_future(_pool.submit(_hash, password))
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Async counterpart of `verify_password`; awaits the pool without blocking."""
+    return await asyncio.wrap_future(
+        _pool.submit(_verify, plain_password, hashed_password)
     )
+
+
+def needs_rehash(hashed_password: str) -> bool:
+    """
+    Whether a bcrypt hash was made with a cost other than BCRYPT_ROUNDS.
+
+    Args:
+        hashed_password (str): A bcrypt hash, e.g. '$2b$12$...'.
+
+    Returns:
+        bool: True if the password should be hashed again.
+    """
+    return int(hashed_password.split("$")[2]) != settings.BCRYPT_ROUNDS
+
+
+def hash_pool_stats(reset: bool = False) -> dict:
+    """
+    Report the password hashing pool's size and queue depth.
+
+    Args:
+        reset (bool): Reset the peak, completed and rejected counters after
+            reading them.
+
+    Returns:
+        dict: Pool counters.
+
+        {workers, pending, max_pending, peak_pending, completed, rejected}
+
+        pending counts operations queued or running right now.
+    """
+    with _pool.lock:
+        stats = {
+            "workers": settings.PASSWORD_HASH_WORKERS,
+            "pending": _pool.pending,
+            "max_pending": settings.PASSWORD_HASH_QUEUE_SIZE,
+            "peak_pending": _pool.peak_pending,
+            "completed": _pool.completed,
+            "rejected": _pool.rejected,
+        }
+        if reset:
+            _pool.peak_pending = _pool.pending
+            _pool.completed = _pool.rejected = 0
+    return stats
+
+
+def _reset_after_fork() -> None:
+    # The pool's threads do not exist in the child.
+    _pool.reset()
+
+
+os.register_at_fork(after_in_child=_reset_after_fork)
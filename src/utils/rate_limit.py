@@ -0,0 +1,155 @@
+import functools
+import threading
+import time
+from collections.abc import Callable
+from typing import Protocol
+
+from flask import Flask, request
+
+from src.config import settings
+from src.exceptions import TooManyRequestsError
+
+_PERIODS = {"second": 1.0, "minute": 60.0, "hour": 3600.0}
+
+
+@functools.cache
+def parse_limit(spec: str) -> tuple[float, float]:
+    """
+    Parse a limit such as '120/minute' into a token bucket's shape.
+
+    Args:
+        spec (str): '<requests>/<second|minute|hour>'.
+
+    Returns:
+        tuple[float, float]: Bucket capacity (the burst allowed) and refill
+        rate in tokens per second.
+
+    Raises:
+        ValueError: If the limit is malformed.
+    """
+    count, _, period = spec.partition("/")
+    if period not in _PERIODS or not count.isdigit() or int(count) < 1:
+        raise ValueError(f"Invalid rate limit: {spec!r}")
+    return float(count), int(count) / _PERIODS[period]
+
+
+class BucketBackend(Protocol):
+    """Storage of token buckets, shared by every request of a worker."""
+
+    def take(self, key: str, capacity: float, refill: float) -> float: ...
+
+
+class MemoryBuckets:
+    """
+    Per-worker token buckets, at most `max_keys` of them.
+
+    Past `max_keys`, the least recently used bucket is dropped; a client
+    coming back after that starts with a full bucket.
+    """
+
+    def __init__(self, max_keys: int) -> None:
+        self.max_keys = max_keys
+        self._buckets: dict[str, tuple[float, float]] = {}
+        self._lock = threading.Lock()
+
+    def take(self, key: str, capacity: float, refill: float) -> float:
+        """
+        Take one token from the bucket under `key`.
+
+        Returns:
+            float: 0 if a token was taken, else seconds until one is available.
+        """
+        now = time.monotonic()
+        with self._lock:
+            tokens, last = self._buckets.pop(key, (capacity, now))
+            tokens = min(capacity, tokens + (now - last) * refill)
+            if tokens >= 1:
+                tokens -= 1
+                wait = 0.0
+            else:
+                wait = (1 - tokens) / refill
+            self._buckets[key] = (tokens, now)
+            if len(self._buckets) > self.max_keys:
+                del self._buckets[next(iter(self._buckets))]
+        return wait
+
+
+class _Backend:
+    """The bucket backend of this worker, built on first use."""
+
+    def __init__(self, factory: Callable[[], BucketBackend]) -> None:
+        self.factory = factory
+        self._backend: BucketBackend | None = None
+        self._lock = threading.Lock()
+
+    def get(self) -> BucketBackend:
+        if self._backend is None:
+            with self._lock:
+                if self._backend is None:
+                    self._backend = self.factory()
+        return self._backend
+
+    def replace(self, factory: Callable[[], BucketBackend]) -> None:
+        with self._lock:
+            self.factory = factory
+            self._backend = None
+
+
+_backend = _Backend(lambda: MemoryBuckets(settings.RATE_LIMIT_MAX_KEYS))
+
+
+def use_backend(factory: Callable[[], BucketBackend]) -> None:
+    """
+    Replace the bucket backend, e.g. with one on a store shared by all workers.
+
+    Args:
+        factory (Callable[[], BucketBackend]): Builds the new backend on first use.
+    """
+    _backend.replace(factory)
+
+
+def _enforce(kind: str, client: object) -> None:
+    blueprint = request.blueprint
+    spec = settings.RATE_LIMITS.get(blueprint or "")
+    if not settings.RATE_LIMIT_ENABLED or spec is None:
+        return
+    capacity, refill = parse_limit(spec)
+    wait = _backend.get().take(f"{kind}:{blueprint}:{client}", capacity, refill)
+    if wait:
+        raise TooManyRequestsError("Too many requests", retry_after=wait)
+
+
+def limit_user(user_id: int) -> None:
+    """
+    Take a token from the user's bucket of the current request's blueprint.
+
+    Args:
+        user_id (int): The authenticated user.
+
+    Raises:
+        TooManyRequestsError: If the user's bucket is empty.
+    """
+    _enforce("user", user_id)
+
+
+def register_rate_limits(app: Flask) -> None:
+    """
+    Limit every request by client IP, per blueprint, as set in RATE_LIMITS.
+
+    Authenticated requests are also limited per user by `jwt_required`
+    (see `limit_user`). The limits are parsed here so that a malformed one
+    fails at startup. Behind reverse proxies, set TRUSTED_PROXY_HOPS so that
+    the client IP is read from X-Forwarded-For rather than being the proxy's.
+
+    Args:
+        app (Flask): The application.
+
+    Raises:
+        ValueError: If a limit in RATE_LIMITS is malformed.
+    """
+    for spec in settings.RATE_LIMITS.values():
+        parse_limit(spec)
+
+    @app.before_request
+    def limit_client_ip() -> None:
+        _enforce("ip", request.remote_addr)
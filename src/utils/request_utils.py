@@ -0,0 +1,87 @@
+import hmac
+from collections.abc import Callable
+from functools import wraps
+from typing import Any
+
+import msgpack
+from flask import request
+
+from src.config import settings
+from src.exceptions import NotFoundError, UnauthorizedError, UnsupportedMediaTypeError
+from src.utils.json_provider import MSGPACK_MIMETYPE
+
+# Request body types of views that take structured data (see `request_payload`).
+PAYLOAD_MIMETYPES = ("application/json", MSGPACK_MIMETYPE)
+
+
+def accepts(*mimetypes: str) -> Callable:
+    """
+    Route decorator declaring the request body content types a view accepts.
+
+    Views without it only accept JSON bodies (see `ensure_json_payload`);
+    views declaring no mimetypes take no body and accept any.
+
+    Args:
+        *mimetypes (str): Accepted request mimetypes, e.g. 'text/csv'.
+
+    Returns:
+        Callable: Decorator that tags the view function.
+    """
+
+    def decorator(f: Callable) -> Callable:
+        f.accepted_mimetypes = mimetypes  # type: ignore[attr-defined]
+        return f
+
+    return decorator
+
+
+def request_payload() -> Any:
+    """
+    Decode the request body of a view accepting `PAYLOAD_MIMETYPES`.
+
+    Returns:
+        Any: The decoded MessagePack or JSON body.
+
+    Raises:
+        UnsupportedMediaTypeError: If a MessagePack body cannot be decoded.
+    """
+    if request.mimetype != MSGPACK_MIMETYPE:
+        return request.json
+    try:
+        return msgpack.unpackb(request.get_data())
+    except (ValueError, TypeError) as err:
+        raise UnsupportedMediaTypeError(
+            "Request body must contain valid MessagePack"
+        ) from err
+
+
+def internal_token_required(f: Callable) -> Callable:
+    """
+    Route decorator restricting a view to callers holding the internal API token.
+
+    The token is sent in the 'X-Internal-Token' header and compared with
+    `settings.INTERNAL_API_TOKEN`. While no token is configured, the view
+    behaves as if it did not exist.
+
+    Args:
+        f (Callable): The route function to wrap.
+
+    Returns:
+        Callable: The wrapped route function.
+
+    Raises:
+        NotFoundError: If no internal token is configured.
+        UnauthorizedError: If the header is missing or does not match.
+    """
+
+    @wraps(f)
+    def decorated(*args: Any, **kwargs: Any) -> Any:
+        expected = settings.INTERNAL_API_TOKEN
+        if not expected:
+            raise NotFoundError("Not found")
+        provided = request.headers.get("X-Internal-Token", "")
+        if not hmac.compare_digest(provided.encode(), expected.encode()):
+            raise UnauthorizedError("Invalid internal token")
+        return f(*args, **kwargs)
+
+    return decorated
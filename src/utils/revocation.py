@@ -0,0 +1,180 @@
+import hashlib
+import math
+import os
+import threading
+import time
+from collections.abc import Iterable
+
+from src.config import settings
+from src.exceptions import UnauthorizedError
+from src.repositories.revocations_repo import (
+    is_token_revoked,
+    is_token_revoked_async,
+    list_revocations,
+    list_revocations_async,
+)
+from src.schemas.jwt_schemas import JWTPayload
+
+
+class BloomFilter:
+    """
+    Set membership with no false negatives and a bounded false positive rate.
+
+    Sized for `capacity` keys at `error_rate`; each key sets `hashes` bits
+    derived from one BLAKE2b digest (double hashing).
+    """
+
+    def __init__(self, capacity: int, error_rate: float) -> None:
+        bits = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self.size = max(bits, 8)
+        self.hashes = max(round(self.size / capacity * math.log(2)), 1)
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, key: str) -> Iterable[int]:
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hashes))
+
+    def add(self, key: str) -> None:
+        for pos in self._positions(key):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, key: str) -> bool:
+        return all(
+            self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key)
+        )
+
+
+def _token_key(jti: str) -> str:
+    return f"jti:{jti}"
+
+
+def _user_key(user_id: int) -> str:
+    return f"sub:{user_id}"
+
+
+class _Revocations:
+    """
+    This worker's Bloom filter of the revoked tokens and users.
+
+    The filter is rebuilt from the database every REVOCATION_REFRESH_INTERVAL
+    seconds by the first request that finds it stale, while the others keep
+    using the current one. Revocations made by this worker are added to it
+    at once. A token that is not in the filter is certainly not revoked, so
+    only filter positives (revoked tokens and rare false positives) cost a
+    database round trip.
+    """
+
+    def __init__(self) -> None:
+        self.bloom: BloomFilter | None = None
+        self.loaded_at = 0.0
+        # Keys revoked by this worker since the running refresh started.
+        self.local: set[str] = set()
+        self.lock = threading.Lock()
+
+    def claim_refresh(self) -> bool:
+        """Whether the caller should refresh the filter now."""
+        now = time.monotonic()
+        with self.lock:
+            if (
+                self.bloom is not None
+                and now - self.loaded_at < settings.REVOCATION_REFRESH_INTERVAL
+            ):
+                return False
+            self.loaded_at = now
+            self.local = set()
+            return True
+
+    def abort_refresh(self) -> None:
+        """Let the next request retry a refresh that failed."""
+        with self.lock:
+            self.loaded_at = 0.0
+
+    def load(self, jtis: list[str], user_ids: list[int]) -> None:
+        """Replace the filter with one holding the given revocations."""
+        keys = [_token_key(jti) for jti in jtis] + [_user_key(uid) for uid in user_ids]
+        capacity = max(settings.REVOCATION_FILTER_CAPACITY, 2 * len(keys))
+        bloom = BloomFilter(capacity, settings.REVOCATION_FILTER_ERROR_RATE)
+        for key in keys:
+            bloom.add(key)
+        with self.lock:
+            for key in self.local:
+                bloom.add(key)
+            self.bloom = bloom
+
+    def add(self, key: str) -> None:
+        with self.lock:
+            if self.bloom is not None:
+                self.bloom.add(key)
+            self.local.add(key)
+
+    def might_revoke(self, payload: JWTPayload) -> bool:
+        bloom = self.bloom
+        return (
+            bloom is None
+            or (payload.jti is not None and _token_key(payload.jti) in bloom)
+            or _user_key(payload.sub) in bloom
+        )
+
+
+_revocations = _Revocations()
+
+
+def ensure_not_revoked(payload: JWTPayload) -> None:
+    """
+    Reject a verified token that has been revoked.
+
+    Tokens without a jti claim cannot be revoked on their own, and tokens
+    without an iat claim are rejected by any revocation of their user.
+
+    Args:
+        payload (JWTPayload): The token's verified claims.
+
+    Raises:
+        UnauthorizedError: If the token or its user's tokens were revoked.
+        psycopg.errors.Error: If the filter refresh or check query fails.
+    """
+    if _revocations.claim_refresh():
+        try:
+            _revocations.load(*list_revocations(settings.JWT_EXPIRE_IN))
+        except BaseException:
+            _revocations.abort_refresh()
+            raise
+    if _revocations.might_revoke(payload) and is_token_revoked(
+        payload.jti, payload.sub, payload.iat
+    ):
+        raise UnauthorizedError("Revoked token")
+
+
+async def ensure_not_revoked_async(payload: JWTPayload) -> None:
+    """Async counterpart of `ensure_not_revoked`."""
+    if _revocations.claim_refresh():
+        try:
+            _revocations.load(*await list_revocations_async(settings.JWT_EXPIRE_IN))
+        except BaseException:
+            _revocations.abort_refresh()
+            raise
+    if _revocations.might_revoke(payload) and await is_token_revoked_async(
+        payload.jti, payload.sub, payload.iat
+    ):
+        raise UnauthorizedError("Revoked token")
+
+
+def note_token_revoked(jti: str) -> None:
+    """Add a token this worker just revoked to its filter."""
+    _revocations.add(_token_key(jti))
+
+
+def note_user_revoked(user_id: int) -> None:
+    """Add a user whose tokens this worker just revoked to its filter."""
+    _revocations.add(_user_key(user_id))
+
+
+def _reset_after_fork() -> None:
+    # The lock may have been held by another thread at the fork; the
+    # parent's filter is kept until the child's first refresh.
+    _revocations.lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_reset_after_fork)
@@ -0,0 +1,47 @@
+from functools import cache
+
+from pydantic import ValidationError
+from pydantic_core import PydanticUndefined
+
+from src.config import settings
+from src.exceptions import AppError
+from src.schemas.base import Schema
+
+
+@cache
+def _defaults(schema: type[Schema]) -> dict:
+    """Default values of the schema's top-level fields that have one."""
+    return {
+        name: field.default
+        for name, field in schema.model_fields.items()
+        if field.default is not PydanticUndefined
+    }
+
+
+def dump_response(schema: type[Schema], data: dict) -> dict:
+    """
+    Serialize service output for a JSON response in the shape of `schema`.
+
+    The data comes from our own database and code, so by default it is not
+    validated again: it is returned as is, with the schema's top-level
+    defaults (e.g. the masked password) filled in. Decimals and dates are
+    left to the app's JSON provider. With STRICT_OUTPUT_VALIDATION, the data
+    is validated against the schema first, which catches rows that drift
+    from it.
+
+    Args:
+        schema (type[Schema]): Output schema of the response.
+        data (dict): Output data, e.g. database rows in the schema's shape.
+
+    Returns:
+        dict: Response data for `jsonify`.
+
+    Raises:
+        AppError: If strict validation is enabled and fails.
+    """
+    if settings.STRICT_OUTPUT_VALIDATION:
+        try:
+            return schema.model_validate(data).model_dump()
+        except ValidationError as err:
+            raise AppError("Internal schema validation error") from err
+    return {**_defaults(schema), **data}
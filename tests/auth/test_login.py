@@ -1,5 +1,10 @@
 from http import HTTPStatus
 
+from src.config import settings
+from src.repositories.users_repo import get_user_by_email, get_user_credentials
+
+LOW_COST = 4
+
 
 def test_login_success(client, registered_user):
     """POST /auth/login should return an access token."""
@@ -19,6 +24,26 @@ def test_login_success(client, registered_user):
     assert data["token_type"] == "Bearer"
 
 
+def test_login_email_ignores_case(client, registered_user):
+    """Logging in should accept the email in any case."""
+    response = client.post(
+        "/auth/login",
+        json={
+            "email": registered_user["email"].upper(),
+            "password": registered_user["password"],
+        },
+    )
+
+    assert response.status_code == HTTPStatus.OK
+
+
+def test_user_credentials_are_projected(registered_user):
+    """The login lookup should read only the user's id and password hash."""
+    record = get_user_credentials(registered_user["email"].upper())
+    assert set(record) == {"id", "password_hash"}
+    assert record["id"] == registered_user["id"]
+
+
 def test_login_wrong_password(client, registered_user):
     """Wrong password should fail login and return 401"""
     response = client.post(
@@ -37,3 +62,33 @@ def test_login_non_existing_user(client):
     )
 
     assert response.status_code == HTTPStatus.UNAUTHORIZED
+
+
+def _login(client, user):
+    return client.post(
+        "/auth/login", json={"email": user["email"], "password": user["password"]}
+    )
+
+
+def test_login_rehashes_with_new_cost(client, registered_user, monkeypatch):
+    """A successful login should rehash a password stored with another cost."""
+    monkeypatch.setattr(settings, "BCRYPT_ROUNDS", LOW_COST)
+    old_hash = get_user_by_email(registered_user["email"])["password_hash"]
+
+    assert _login(client, registered_user).status_code == HTTPStatus.OK
+
+    new_hash = get_user_by_email(registered_user["email"])["password_hash"]
+    assert new_hash != old_hash
+    assert new_hash.startswith(f"$2b${LOW_COST:02d}$")
+    assert _login(client, registered_user).status_code == HTTPStatus.OK
+    assert get_user_by_email(registered_user["email"])["password_hash"] == new_hash
+
+
+def test_login_when_hashing_pool_saturated(client, registered_user, monkeypatch):
+    """Logins beyond the hashing queue should get 503 with Retry-After."""
+    monkeypatch.setattr(settings, "PASSWORD_HASH_QUEUE_SIZE", 0)
+
+    response = _login(client, registered_user)
+
+    assert response.status_code == HTTPStatus.SERVICE_UNAVAILABLE
+    assert response.headers["Retry-After"] == "1"
@@ -0,0 +1,125 @@
+import time
+from http import HTTPStatus
+
+import jwt
+
+from src.config import settings
+from src.database.db_connection import get_conn
+from src.utils.jwt_utils import decode_token
+from tests.factories import make_token
+
+
+def test_logout_success(client, auth_user):
+    """POST /auth/logout should revoke the token it was called with."""
+    _user, headers = auth_user
+
+    response = client.post("/auth/logout", headers=headers)
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.get_json() == {"message": "Logged out successfully"}
+    response = client.get("/me", headers=headers)
+    assert response.status_code == HTTPStatus.UNAUTHORIZED
+    assert response.get_json()["error"] == "Revoked token"
+
+
+def test_logout_keeps_other_tokens(client, auth_user):
+    """Logging out should not revoke the user's other tokens."""
+    user, headers = auth_user
+    other_headers = {"Authorization": f"Bearer {make_token(user['id'])}"}
+
+    client.post("/auth/logout", headers=headers)
+
+    assert client.get("/me", headers=other_headers).status_code == HTTPStatus.OK
+
+
+def _legacy_headers(user_id: int) -> dict:
+    """Headers with a token issued before tokens carried iat and jti claims."""
+    payload = {"sub": str(user_id), "exp": int(time.time()) + 60}
+    token = jwt.encode(
+        payload, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM
+    )
+    return {"Authorization": f"Bearer {token}"}
+
+
+def test_legacy_token_stays_valid(client, auth_user):
+    """A token without iat and jti should be accepted while unrevoked."""
+    user, headers = auth_user
+    client.post("/auth/logout", headers=headers)
+
+    response = client.get("/me", headers=_legacy_headers(user["id"]))
+
+    assert response.status_code == HTTPStatus.OK
+
+
+def test_legacy_token_logout_revokes_user_tokens(client, auth_user):
+    """Logging out with a token without jti should revoke the user's tokens."""
+    user, headers = auth_user
+    legacy_headers = _legacy_headers(user["id"])
+
+    response = client.post("/auth/logout", headers=legacy_headers)
+
+    assert response.status_code == HTTPStatus.OK
+    assert client.get("/me", headers=legacy_headers).status_code == (
+        HTTPStatus.UNAUTHORIZED
+    )
+    assert client.get("/me", headers=headers).status_code == HTTPStatus.UNAUTHORIZED
+
+
+def test_logout_requires_token(client):
+    """POST /auth/logout without a token should return 401."""
+    response = client.post("/auth/logout")
+    assert response.status_code == HTTPStatus.UNAUTHORIZED
+
+
+def test_deleted_user_tokens_are_revoked(client, auth_user, patch_repo):
+    """Tokens of a deleted user should be rejected before reaching the views."""
+    _user, headers = auth_user
+    client.delete("/me", headers=headers)
+
+    with patch_repo("src.services.users_service.get_user") as get_user:
+        response = client.get("/me", headers=headers)
+
+    assert response.status_code == HTTPStatus.UNAUTHORIZED
+    assert response.get_json()["error"] == "Revoked token"
+    get_user.assert_not_called()
+
+
+def test_unrevoked_token_skips_database_check(client, auth_user, patch_repo):
+    """A token missing from the revocation filter should not be looked up."""
+    _user, headers = auth_user
+    client.get("/me", headers=headers)
+
+    with patch_repo("src.utils.revocation.is_token_revoked") as is_revoked:
+        response = client.get("/me", headers=headers)
+
+    assert response.status_code == HTTPStatus.OK
+    is_revoked.assert_not_called()
+
+
+def test_other_workers_revocations_are_loaded(client, auth_user, monkeypatch):
+    """Revocations made elsewhere should apply once the filter is refreshed."""
+    _user, headers = auth_user
+    client.get("/me", headers=headers)
+    payload = decode_token(headers["Authorization"].removeprefix("Bearer "))
+    with get_conn() as conn:
+        conn.execute(
+            "INSERT INTO revoked_tokens (jti, expires_at) "
+            "VALUES (%s, to_timestamp(%s))",
+            (payload.jti, payload.exp),
+        )
+
+    assert client.get("/me", headers=headers).status_code == HTTPStatus.OK
+
+    monkeypatch.setattr("src.config.settings.REVOCATION_REFRESH_INTERVAL", 0)
+    assert client.get("/me", headers=headers).status_code == HTTPStatus.UNAUTHORIZED
+
+
+def test_purge_revocations_command(app, client, auth_user):
+    """`flask db purge-revocations` should report how many rows it deleted."""
+    _user, headers = auth_user
+    client.post("/auth/logout", headers=headers)
+
+    result = app.test_cli_runner().invoke(args=["db", "purge-revocations"])
+
+    assert result.exit_code == 0
+    assert result.output.startswith("Purged ")
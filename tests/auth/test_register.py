@@ -50,6 +50,17 @@ def test_register_duplicate_email_fails(client, user_payload):
     assert response.status_code == HTTPStatus.CONFLICT
 
 
+def test_register_duplicate_email_other_case_fails(client, user_payload):
+    """Emails differing only in case should belong to the same account."""
+
+    client.post("/auth/register", json=user_payload)
+    response = client.post(
+        "/auth/register", json={**user_payload, "email": user_payload["email"].upper()}
+    )
+
+    assert response.status_code == HTTPStatus.CONFLICT
+
+
 def test_register_invalid_password_too_short(client, user_payload):
     """Password too short should fail validation"""
 
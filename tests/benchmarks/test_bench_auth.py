@@ -0,0 +1,25 @@
+"""Per-request authentication: verifying every token vs. the verified-token cache.
+
+Run with `pytest tests/benchmarks` to compare.
+"""
+
+import pytest
+from flask import Flask
+
+from src.config import settings
+from src.utils.jwt_utils import _authenticate_request, _verified_tokens
+from tests.factories import make_token
+
+CACHE_SIZES = {"uncached": 0, "cached": 10_000}
+
+
+@pytest.mark.parametrize("mode", CACHE_SIZES)
+@pytest.mark.benchmark(group="jwt-auth")
+def test_bench_authenticate_request(benchmark, mode, monkeypatch):
+    """jwt_required's work for a client reusing the same token."""
+    monkeypatch.setattr(settings, "JWT_CACHE_SIZE", CACHE_SIZES[mode])
+    _verified_tokens.clear()
+    headers = {"Authorization": f"Bearer {make_token(42)}"}
+    with Flask(__name__).test_request_context(headers=headers):
+        benchmark(_authenticate_request)
+    _verified_tokens.clear()
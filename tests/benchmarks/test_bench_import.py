@@ -0,0 +1,47 @@
+"""Bulk import: one COPY upload vs. one POST /transactions/ per row.
+
+Run with `pytest tests/benchmarks` to compare.
+"""
+
+import pytest
+
+ROWS = 200
+
+
+def _csv_body(rows: int) -> str:
+    lines = ["kind,transaction_date,amount,description"]
+    lines += [f"expense,2025-03-{i % 28 + 1:02d},{i}.25,Row {i}" for i in range(rows)]
+    return "\n".join(lines) + "\n"
+
+
+@pytest.mark.benchmark(group="import")
+def test_bench_import_per_row_posts(benchmark, client, auth_user):
+    """Baseline: one authenticated POST (and pool checkout) per transaction."""
+    _user, headers = auth_user
+    payload = {
+        "kind": "expense",
+        "transaction_date": "2025-03-01",
+        "amount": "10.25",
+        "description": "Row",
+    }
+
+    def post_rows():
+        for _ in range(ROWS):
+            client.post("/transactions/", json=payload, headers=headers)
+
+    benchmark.pedantic(post_rows, rounds=3, iterations=1)
+
+
+@pytest.mark.benchmark(group="import")
+def test_bench_import_copy(benchmark, client, auth_user):
+    """POST /transactions/import: a single request and COPY for all rows."""
+    _user, headers = auth_user
+    body = _csv_body(ROWS)
+
+    def import_rows():
+        response = client.post(
+            "/transactions/import", data=body, content_type="text/csv", headers=headers
+        )
+        assert response.get_json()["imported"] == ROWS
+
+    benchmark.pedantic(import_rows, rounds=3, iterations=1)
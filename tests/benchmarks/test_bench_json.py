@@ -0,0 +1,38 @@
+"""JSON encoding of a 500-row transaction page: orjson vs. Flask's json module.
+
+Run with `pytest tests/benchmarks` to compare.
+"""
+
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from flask import Flask
+
+from src.utils.json_provider import JSON_PROVIDERS
+
+ROWS = 500
+
+PAGE = {
+    "transactions": [
+        {
+            "id": i,
+            "kind": "expense",
+            "transaction_date": date(2025, 3, i % 28 + 1),
+            "amount": Decimal(f"{i}.25"),
+            "description": f"Row {i}",
+        }
+        for i in range(1, ROWS + 1)
+    ],
+    "next_cursor": None,
+}
+
+
+@pytest.mark.parametrize("name", JSON_PROVIDERS)
+@pytest.mark.benchmark(group="json-response")
+def test_bench_json_response(benchmark, name):
+    """jsonify() of one page with each provider."""
+    app = Flask(__name__)
+    app.json = JSON_PROVIDERS[name](app)
+    with app.app_context():
+        benchmark(app.json.response, PAGE)
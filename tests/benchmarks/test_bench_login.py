@@ -0,0 +1,48 @@
+"""The login path split into its database lookup and its bcrypt check.
+
+Run with `pytest tests/benchmarks` to compare; bcrypt at BCRYPT_ROUNDS
+should dwarf the indexed lookup.
+"""
+
+import pytest
+
+from src.repositories.users_repo import get_user_by_email, get_user_credentials
+from src.services.auth_service import authenticate
+from src.utils.password import verify_password
+from tests.factories import make_user
+
+# bcrypt takes a good fraction of a second per call at the default cost.
+BCRYPT_ROUNDS = 5
+
+
+@pytest.fixture(scope="module")
+def login_user():
+    return make_user()
+
+
+@pytest.mark.parametrize("lookup", [get_user_credentials, get_user_by_email])
+@pytest.mark.benchmark(group="login")
+def test_bench_login_lookup(benchmark, lookup, login_user):
+    """The database part of a login, by an email in another case."""
+    benchmark(lookup, login_user["email"].upper())
+
+
+@pytest.mark.benchmark(group="login")
+def test_bench_login_verify_password(benchmark, login_user):
+    """The bcrypt part of a login."""
+    record = get_user_credentials(login_user["email"])
+    benchmark.pedantic(
+        verify_password,
+        (login_user["password"], record["password_hash"]),
+        rounds=BCRYPT_ROUNDS,
+    )
+
+
+@pytest.mark.benchmark(group="login")
+def test_bench_authenticate(benchmark, login_user):
+    """A whole login: lookup, bcrypt check and token."""
+    benchmark.pedantic(
+        authenticate,
+        (login_user["email"], login_user["password"]),
+        rounds=BCRYPT_ROUNDS,
+    )
@@ -0,0 +1,18 @@
+"""Cost of one rate limit check against a warm in-memory bucket.
+
+Run with `pytest tests/benchmarks` to see it.
+"""
+
+import pytest
+
+from src.utils.rate_limit import MemoryBuckets, parse_limit
+
+
+@pytest.mark.benchmark(group="rate-limit")
+def test_bench_take_token(benchmark):
+    """MemoryBuckets.take() for a client well within its limit."""
+    buckets = MemoryBuckets(max_keys=100_000)
+    for i in range(10_000):
+        buckets.take(f"ip:tx:10.0.{i // 256}.{i % 256}", 1e9, 1e9)
+    capacity, refill = parse_limit("1000000/second")
+    benchmark(buckets.take, "ip:tx:10.0.0.1", capacity, refill)
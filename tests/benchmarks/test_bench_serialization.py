@@ -0,0 +1,60 @@
+"""Response serialization: trusted database rows vs. strict re-validation.
+
+Run with `pytest tests/benchmarks` to compare.
+"""
+
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from src.config import settings
+from src.schemas.transaction_schemas import TransactionsOut
+from src.utils.serialization import dump_response
+
+ROWS = 500
+
+PAGE = {
+    "transactions": [
+        {
+            "id": i,
+            "kind": "expense",
+            "transaction_date": date(2025, 3, i % 28 + 1),
+            "amount": Decimal(f"{i}.25"),
+            "description": f"Row {i}",
+        }
+        for i in range(1, ROWS + 1)
+    ],
+    "next_cursor": None,
+}
+
+MODES = {"trusted": False, "strict": True}
+
+
+@pytest.mark.parametrize("mode", MODES)
+@pytest.mark.benchmark(group="serialize-page")
+def test_bench_serialize_page(benchmark, mode, monkeypatch):
+    """dump_response() of one 500-row page, as get_transaction_list does."""
+    monkeypatch.setattr(settings, "STRICT_OUTPUT_VALIDATION", MODES[mode])
+    benchmark(dump_response, TransactionsOut, PAGE)
+
+
+@pytest.mark.parametrize("mode", MODES)
+@pytest.mark.benchmark(group="list-response")
+def test_bench_list_response(benchmark, mode, client, auth_user, monkeypatch):
+    """GET /transactions/?limit=500 end to end, database included."""
+    monkeypatch.setattr(settings, "STRICT_OUTPUT_VALIDATION", MODES[mode])
+    _user, headers = auth_user
+    client.post(
+        "/transactions/import",
+        data="kind,transaction_date,amount,description\n"
+        + "".join(f"expense,2025-03-01,{i}.25,Row {i}\n" for i in range(ROWS)),
+        content_type="text/csv",
+        headers=headers,
+    )
+
+    def get_page():
+        response = client.get(f"/transactions/?limit={ROWS}", headers=headers)
+        assert len(response.get_json()["transactions"]) == ROWS
+
+    benchmark(get_page)
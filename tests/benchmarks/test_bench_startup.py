@@ -0,0 +1,39 @@
+"""Cold start: importing the app, and process start to first response.
+
+Each round runs in a fresh interpreter. Run with `pytest tests/benchmarks`
+to compare; set WARM_UP=true in the environment to measure a warm start.
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+IMPORT_APP = "import src.app"
+
+# Login with unknown credentials: goes through routing, schema validation
+# and one database query, without bcrypt.
+FIRST_RESPONSE = """
+from src.app import create_app
+
+response = create_app().test_client().post(
+    "/auth/login", json={"email": "nobody@example.com", "password": "password123"}
+)
+assert response.status_code == 401, response.status_code
+"""
+
+
+def _run(code: str) -> None:
+    subprocess.run([sys.executable, "-c", code], check=True)  # noqa: S603
+
+
+@pytest.mark.benchmark(group="startup")
+def test_bench_startup_import(benchmark):
+    """Interpreter start plus `import src.app`."""
+    benchmark.pedantic(_run, args=(IMPORT_APP,), rounds=5, iterations=1)
+
+
+@pytest.mark.benchmark(group="startup")
+def test_bench_startup_first_response(benchmark):
+    """Interpreter start to the first response that needs the database."""
+    benchmark.pedantic(_run, args=(FIRST_RESPONSE,), rounds=5, iterations=1)
@@ -1,24 +1,50 @@
+from unittest.mock import AsyncMock, patch
+
 import pytest
 from faker import Faker
 
 from src.app import create_app
+from src.config import settings
 from tests.factories import make_token, make_transaction, make_user
 
 fake = Faker()
 
 
-@pytest.fixture(scope="session")
-def app():
-    app = create_app()
+@pytest.fixture(scope="session", params=["sync", "async"])
+def app(request):
+    """Fixture: The app with sync views, then with async views."""
+    app = create_app(async_views=request.param == "async")
     app.config["TESTING"] = True
     yield app
 
 
+@pytest.fixture(autouse=True)
+def no_rate_limits(monkeypatch):
+    """Fixture: Disables rate limiting; tests of it re-enable it."""
+    monkeypatch.setattr(settings, "RATE_LIMIT_ENABLED", False)
+
+
 @pytest.fixture()
 def client(app):
     return app.test_client()
 
 
+@pytest.fixture()
+def patch_repo(app):
+    """Fixture: Patches a repository function as seen by a service module.
+
+    In async mode the function's async counterpart (`<name>_async`) is
+    patched instead, so the same test covers the view the app serves.
+    """
+
+    def _patch(target: str, **kwargs):
+        if app.config["ASYNC_VIEWS"]:
+            return patch(f"{target}_async", new_callable=AsyncMock, **kwargs)
+        return patch(target, **kwargs)
+
+    return _patch
+
+
 @pytest.fixture()
 def faker():
     return fake
@@ -0,0 +1,57 @@
+import threading
+
+import pytest
+from flask import g
+
+from src.database.async_connection import (
+    close_async_pool,
+    get_async_conn,
+    get_async_pool,
+    run_coroutine,
+)
+
+USER_ID = 7
+
+
+async def _select(value: int, delay: float = 0.0) -> int:
+    async with get_async_conn() as conn:
+        cur = await conn.execute("SELECT %s::int FROM pg_sleep(%s)", (value, delay))
+        (result,) = await cur.fetchone()
+        return result
+
+
+def test_run_coroutine_returns_result():
+    """Coroutines should run on the shared loop and return their result."""
+    assert run_coroutine(_select(1)) == 1
+
+
+def test_run_coroutine_raises():
+    """Exceptions raised by the coroutine should reach the caller."""
+
+    async def fail():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError, match="boom"):
+        run_coroutine(fail())
+
+
+def test_run_coroutine_sees_flask_context(app):
+    """The coroutine should see and update the caller's request context."""
+
+    async def read_and_write_g():
+        g.seen = g.user_id
+        return threading.current_thread().name
+
+    with app.test_request_context():
+        g.user_id = USER_ID
+        thread_name = run_coroutine(read_and_write_g())
+        assert g.seen == USER_ID
+    assert thread_name == "db-event-loop"
+
+
+def test_async_pool_reopens_after_close():
+    """Closing the async pool should let the next checkout open a new one."""
+    pool = run_coroutine(get_async_pool())
+    close_async_pool()
+    assert run_coroutine(_select(1)) == 1
+    assert run_coroutine(get_async_pool()) is not pool
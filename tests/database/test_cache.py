@@ -0,0 +1,274 @@
+import fnmatch
+import time
+from datetime import date
+from decimal import Decimal
+from http import HTTPStatus
+
+import pytest
+
+from src.database import cache
+from src.database.cache import (
+    LRUBackend,
+    RecordCache,
+    RedisBackend,
+    transaction_cache,
+    use_backend,
+    user_cache,
+)
+from src.database.db_connection import get_conn
+from src.database.query_registry import queries
+from src.repositories.transactions_repo import (
+    GET_TRANSACTION,
+    apply_transaction_batch,
+    get_transaction_by_id,
+)
+from src.repositories.users_repo import (
+    GET_USER,
+    delete_user,
+    get_data_version,
+    get_user,
+)
+from tests.factories import make_transaction
+
+ROW = {"id": 1, "amount": Decimal("12.50"), "transaction_date": date(2024, 5, 1)}
+
+
+class StandInRedis:
+    """In-memory stand-in for a redis-py client, with millisecond expiry."""
+
+    def __init__(self):
+        self.data: dict[str, tuple[float, bytes]] = {}
+
+    def get(self, name):
+        expires, value = self.data.get(name, (0.0, None))
+        return value if expires > time.monotonic() else None
+
+    def set(self, name, value, px):
+        self.data[name] = (time.monotonic() + px / 1000, value)
+
+    def delete(self, *names):
+        for name in names:
+            self.data.pop(name, None)
+
+    def scan_iter(self, match):
+        return [name.encode() for name in self.data if fnmatch.fnmatch(name, match)]
+
+
+@pytest.fixture()
+def redis_backend():
+    """Fixture: Routes every cache to a Redis backend on a stand-in client."""
+    client = StandInRedis()
+    use_backend(lambda: RedisBackend(client, ttl=60))
+    yield client
+    use_backend(cache._default_backend)
+
+
+def test_lru_evicts_least_recently_used():
+    """Past max_entries, the least recently read entry should be evicted."""
+    backend = LRUBackend(max_entries=2, max_bytes=1024, ttl=60)
+    backend.set("a", b"1")
+    backend.set("b", b"2")
+    backend.get("a")
+    backend.set("c", b"3")
+
+    assert backend.get("b") is None
+    assert backend.get("a") == b"1"
+    assert backend.stats() == {"entries": 2, "bytes": 2, "evictions": 1}
+
+
+def test_lru_bounded_by_bytes():
+    """Entries should be evicted to keep the total size under max_bytes."""
+    backend = LRUBackend(max_entries=100, max_bytes=10, ttl=60)
+    backend.set("a", b"x" * 6)
+    backend.set("b", b"y" * 6)
+    backend.set("huge", b"z" * 11)
+
+    assert backend.get("a") is None
+    assert backend.get("huge") is None
+    assert backend.stats()["bytes"] == 6  # noqa: PLR2004
+
+
+def test_lru_entries_expire(monkeypatch):
+    """Entries older than the TTL should be treated as misses."""
+    backend = LRUBackend(max_entries=10, max_bytes=1024, ttl=5)
+    backend.set("a", b"1")
+    now = time.monotonic()
+    monkeypatch.setattr(cache.time, "monotonic", lambda: now + 6)
+    assert backend.get("a") is None
+    assert backend.stats()["entries"] == 0
+
+
+def test_record_cache_round_trip():
+    """Cached rows should come back equal, as fresh copies, with counted hits."""
+    records = RecordCache("test:")
+    assert records.get((1,), 1) is None
+    records.set((1,), ROW, 1)
+
+    first = records.get((1,), 1)
+    first["amount"] = Decimal(0)
+    assert records.get((1,), 1) == ROW
+    assert records.stats(reset=True) == {"hits": 2, "misses": 1}
+    assert records.stats() == {"hits": 0, "misses": 0}
+
+
+def test_record_cache_misses_other_versions():
+    """A row cached at one data version should not be served at another."""
+    records = RecordCache("test:")
+    records.set((1,), ROW, 1)
+    assert records.get((1,), 2) is None
+    records.set((1,), ROW, 2)
+    assert records.get((1,), 1) is None
+    assert records.get((1,), 2) == ROW
+
+
+def test_writes_through_other_workers_are_not_served_stale(client, auth_user):
+    """A cached row changed where this cache is not told should be a miss."""
+    user, headers = auth_user
+    first = client.get("/me", headers=headers)
+    with get_conn() as conn:
+        conn.execute(
+            "UPDATE users SET username = 'elsewhere' WHERE id = %s", (user["id"],)
+        )
+
+    response = client.get(
+        "/me", headers={**headers, "If-None-Match": first.headers["ETag"]}
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.get_json()["username"] == "elsewhere"
+    again = client.get(
+        "/me", headers={**headers, "If-None-Match": response.headers["ETag"]}
+    )
+    assert again.status_code == HTTPStatus.NOT_MODIFIED
+
+
+def test_rows_are_cached_under_their_own_version(auth_user, added_transaction):
+    """A row should be cached under the version read with it, not the caller's."""
+    user, _headers = auth_user
+    version = get_data_version(user["id"])
+    # E.g. a version read on a replica that lags behind the row's.
+    stale = version - 1
+    key = (user["id"], added_transaction["id"])
+
+    row = get_transaction_by_id(user["id"], added_transaction["id"], stale)
+    user_row = get_user(user["id"], stale)
+
+    assert "data_version" not in row
+    assert "data_version" not in user_row
+    assert transaction_cache.get(key, stale) is None
+    assert transaction_cache.get(key, version) == row
+    assert user_cache.get((user["id"],), stale) is None
+    assert user_cache.get((user["id"],), version) == user_row
+
+
+def test_repeated_lookups_hit_the_cache(added_transaction, auth_user):
+    """A second lookup of the same transaction should not query the database."""
+    user, _headers = auth_user
+    version = get_data_version(user["id"])
+    get_transaction_by_id(user["id"], added_transaction["id"], version)
+    before = queries.stats()[GET_TRANSACTION]
+
+    row = get_transaction_by_id(user["id"], added_transaction["id"], version)
+
+    assert row["amount"] == added_transaction["amount"]
+    assert queries.stats()[GET_TRANSACTION] == before
+
+
+def test_transaction_writes_invalidate(client, auth_user, added_transaction):
+    """PATCH and DELETE should drop the cached transaction at once."""
+    _user, headers = auth_user
+    url = f"/transactions/{added_transaction['id']}"
+    client.get(url, headers=headers)
+
+    client.patch(url, json={"description": "Changed"}, headers=headers)
+    assert client.get(url, headers=headers).get_json()["description"] == "Changed"
+
+    client.delete(url, headers=headers)
+    assert client.get(url, headers=headers).status_code == HTTPStatus.NOT_FOUND
+
+
+def test_batch_invalidates(auth_user, added_transaction):
+    """Batch patches should drop the cached copies of the rows they change."""
+    user, _headers = auth_user
+    version = get_data_version(user["id"])
+    get_transaction_by_id(user["id"], added_transaction["id"], version)
+    apply_transaction_batch(
+        user["id"], [("patch", added_transaction["id"], {"description": "Batched"})]
+    )
+    key = (user["id"], added_transaction["id"])
+    assert transaction_cache.get(key, version) is None
+    row = get_transaction_by_id(
+        user["id"], added_transaction["id"], get_data_version(user["id"])
+    )
+    assert row["description"] == "Batched"
+
+
+def test_user_writes_invalidate(client, auth_user, faker):
+    """PATCH /me should drop the cached user at once."""
+    _user, headers = auth_user
+    client.get("/me", headers=headers)
+    username = faker.user_name()
+    client.patch("/me", json={"username": username}, headers=headers)
+    assert client.get("/me", headers=headers).get_json()["username"] == username
+
+
+def test_delete_user_drops_their_rows(auth_user, added_transaction):
+    """Deleting a user should drop their cached user and transactions."""
+    user, _headers = auth_user
+    version = get_data_version(user["id"])
+    get_user(user["id"], version)
+    get_transaction_by_id(user["id"], added_transaction["id"], version)
+
+    delete_user(user["id"])
+
+    assert user_cache.get((user["id"],), version) is None
+    assert transaction_cache.get((user["id"], added_transaction["id"]), version) is None
+    assert get_transaction_by_id(user["id"], added_transaction["id"]) is None
+
+
+def test_disabled_cache_always_queries(auth_user, monkeypatch):
+    """With CACHE_MAX_ENTRIES = 0 every lookup should reach the database."""
+    user, _headers = auth_user
+    monkeypatch.setattr(cache.settings, "CACHE_MAX_ENTRIES", 0)
+    use_backend(cache._default_backend)
+    try:
+        before = queries.stats().get(GET_USER, 0)
+        version = get_data_version(user["id"])
+        get_user(user["id"], version)
+        get_user(user["id"], version)
+        assert queries.stats()[GET_USER] == before + 2
+    finally:
+        monkeypatch.undo()
+        use_backend(cache._default_backend)
+
+
+def test_redis_backend(redis_backend, client, auth_user):
+    """The Redis backend should serve and invalidate rows like the LRU one."""
+    user, headers = auth_user
+    client.get("/me", headers=headers)
+    assert f"cache:user:{user['id']}" in redis_backend.data
+
+    before = queries.stats()[GET_USER]
+    assert client.get("/me", headers=headers).status_code == HTTPStatus.OK
+    assert queries.stats()[GET_USER] == before
+
+    client.patch("/me", json={"username": "redis-user"}, headers=headers)
+    assert f"cache:user:{user['id']}" not in redis_backend.data
+    assert client.get("/me", headers=headers).get_json()["username"] == "redis-user"
+
+
+def test_redis_backend_clear_by_prefix(redis_backend):
+    """Clearing a user's transactions should leave other users' rows alone."""
+    transaction_cache.set((1, 10), ROW, 1)
+    transaction_cache.set((12, 10), ROW, 1)
+    transaction_cache.clear(1)
+    assert transaction_cache.get((1, 10), 1) is None
+    assert transaction_cache.get((12, 10), 1) == ROW
+
+
+def test_make_transaction_is_not_cached(auth_user):
+    """Inserts should not populate the cache; only lookups do."""
+    user, _headers = auth_user
+    tx = make_transaction(user_id=user["id"])
+    version = get_data_version(user["id"])
+    assert transaction_cache.get((user["id"], tx["id"]), version) is None
@@ -0,0 +1,58 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from src.database import db_connection
+from src.database.db_connection import close_pool, get_conn, get_pool
+
+
+def test_import_does_not_open_pool():
+    """Importing the app should not create a pool or connect to the database."""
+    code = (
+        "import src.app\n"
+        "from src.database import db_connection\n"
+        "assert db_connection._current.pool is None\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)  # noqa: S603
+
+
+def test_pool_reopens_after_close():
+    """Closing the pool should let the next checkout open a new one."""
+    pool = get_pool()
+    close_pool()
+    with get_conn() as conn:
+        assert conn.execute("SELECT 1").fetchone() == (1,)
+    assert get_pool() is not pool
+
+
+@pytest.mark.filterwarnings("ignore::DeprecationWarning")
+def test_forked_child_gets_its_own_pool():
+    """A forked process should use a new pool and leave the parent's connections alive."""
+    parent_pool = get_pool()
+    parent_pool.wait()
+    before = parent_pool.get_stats().get("connections_lost", 0)
+
+    pid = os.fork()
+    if pid == 0:
+        try:
+            pool = get_pool()
+            with get_conn() as conn:
+                conn.execute("SELECT 1")
+            pool.close()
+            os._exit(0 if pool is not parent_pool else 1)
+        except BaseException:
+            os._exit(2)
+    _, status = os.waitpid(pid, 0)
+    assert os.waitstatus_to_exitcode(status) == 0
+
+    assert db_connection._current.pool is parent_pool
+    conns = [parent_pool.getconn() for _ in range(parent_pool.min_size)]
+    try:
+        for conn in conns:
+            assert conn.execute("SELECT 1").fetchone() == (1,)
+    finally:
+        for conn in conns:
+            parent_pool.putconn(conn)
+    assert parent_pool.get_stats().get("connections_lost", 0) == before
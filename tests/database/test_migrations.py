@@ -0,0 +1,123 @@
+import psycopg
+import pytest
+
+from src.config import settings
+from src.database.migrate import (
+    _run_sql,
+    current_version,
+    discover_migrations,
+    downgrade,
+    upgrade,
+)
+
+
+def _index_exists(name: str) -> bool:
+    with psycopg.connect(settings.db_url) as conn:
+        row = conn.execute("SELECT to_regclass(%s)", (name,)).fetchone()
+    return row[0] is not None
+
+
+def test_migrations_are_numbered_sequentially():
+    """Migration versions should start at 1 and have no gaps."""
+    versions = [m.version for m in discover_migrations()]
+    assert versions == list(range(1, len(versions) + 1))
+
+
+def test_upgrade_is_idempotent():
+    """Upgrading an up-to-date database should apply nothing."""
+    assert upgrade() == []
+    assert current_version() == discover_migrations()[-1].version
+
+
+def test_downgrade_then_upgrade_date_indexes():
+    """Reverting and re-applying 0002 should drop and recreate its indexes."""
+    latest = current_version()
+    try:
+        reverted = downgrade(1)
+        assert [m.version for m in reverted] == list(range(latest, 1, -1))
+        assert current_version() == 1
+        assert not _index_exists("transactions_user_date_id_idx")
+        assert not _index_exists("transactions_date_brin_idx")
+    finally:
+        upgrade()
+    assert current_version() == latest
+    assert _index_exists("transactions_user_date_id_idx")
+    assert _index_exists("transactions_date_brin_idx")
+
+
+def test_discover_rejects_missing_down_file(tmp_path):
+    """A migration without its down file should be rejected."""
+    (tmp_path / "0001_only_up.up.sql").write_text("SELECT 1;")
+    with pytest.raises(ValueError, match="needs both up and down"):
+        discover_migrations(tmp_path)
+
+
+def test_cli_upgrade_up_to_date(app):
+    """`flask db upgrade` should report an up-to-date schema."""
+    result = app.test_cli_runner().invoke(args=["db", "upgrade"])
+    assert result.exit_code == 0
+    assert "Already up to date." in result.output
+
+
+def test_retry_rebuilds_index_left_invalid(app):
+    """A no-transaction retry should rebuild an index a failed run left INVALID."""
+    script = (
+        "-- migrate:no-transaction\n"
+        "CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS retry_probe_idx"
+        " ON retry_probe (n);\n"
+    )
+    with psycopg.connect(settings.db_url, autocommit=True) as conn:
+        conn.execute("CREATE TABLE retry_probe (n INTEGER)")
+        try:
+            conn.execute("INSERT INTO retry_probe VALUES (1), (1)")
+            with pytest.raises(psycopg.errors.UniqueViolation):
+                _run_sql(conn, script, "SELECT %s", (1,))
+            conn.execute("DELETE FROM retry_probe")
+
+            _run_sql(conn, script, "SELECT %s", (1,))
+
+            valid = conn.execute(
+                "SELECT indisvalid FROM pg_index"
+                " WHERE indexrelid = 'retry_probe_idx'::regclass"
+            ).fetchone()[0]
+            assert valid
+        finally:
+            conn.execute("DROP TABLE retry_probe")
+
+
+# Version before 0009_users_email_case_insensitive.
+BEFORE_CASE_INSENSITIVE_EMAILS = 8
+
+
+def _email_constraint_exists(conn) -> bool:
+    return conn.execute(
+        "SELECT EXISTS (SELECT FROM pg_constraint WHERE conname = 'users_email_key')"
+    ).fetchone()[0]
+
+
+def test_case_insensitive_emails_refuse_case_duplicates(app):
+    """0009 should fail before any change while emails differ only in case."""
+    emails = ("Case.Dup@example.com", "case.dup@example.com")
+    downgrade(BEFORE_CASE_INSENSITIVE_EMAILS)
+    try:
+        with psycopg.connect(settings.db_url, autocommit=True) as conn:
+            for email in emails:
+                conn.execute(
+                    "INSERT INTO users (username, email, password_hash)"
+                    " VALUES ('dup', %s, 'x')",
+                    (email,),
+                )
+            with pytest.raises(psycopg.errors.RaiseException, match="only in case"):
+                upgrade()
+            assert current_version() == BEFORE_CASE_INSENSITIVE_EMAILS
+            assert _email_constraint_exists(conn)
+            assert not _index_exists("users_email_lower_key")
+
+            conn.execute("DELETE FROM users WHERE email = %s", (emails[0],))
+            upgrade()
+            assert not _email_constraint_exists(conn)
+            assert _index_exists("users_email_lower_key")
+    finally:
+        with psycopg.connect(settings.db_url, autocommit=True) as conn:
+            conn.execute("DELETE FROM users WHERE email = ANY(%s)", (list(emails),))
+        upgrade()
@@ -0,0 +1,109 @@
+from datetime import date
+from decimal import Decimal
+from http import HTTPStatus
+
+import psycopg
+
+from src.config import settings
+from src.repositories.partitions_repo import detach_partition, list_partitions
+from src.repositories.rollups_repo import find_rollup_drift
+from src.repositories.transactions_repo import insert_transaction
+from src.services.partitions_service import (
+    create_future_partitions,
+    detach_partitions_before,
+)
+
+
+def _partition_of(transaction_id: int) -> str:
+    with psycopg.connect(settings.db_url) as conn:
+        row = conn.execute(
+            "SELECT tableoid::regclass::text FROM transactions WHERE id = %s",
+            (transaction_id,),
+        ).fetchone()
+    return row[0]
+
+
+def _add(user_id: int, transaction_date: str) -> dict:
+    return insert_transaction(
+        user_id=user_id,
+        kind="expense",
+        transaction_date=transaction_date,
+        amount="12.50",
+        description="Partitioned",
+    )
+
+
+def test_transactions_table_is_partitioned():
+    """The migration should leave yearly partitions and a default partition."""
+    names = [p["name"] for p in list_partitions()]
+    assert f"transactions_y{date.today().year}" in names
+    assert names[-1] == "transactions_default"
+
+
+def test_create_partition_takes_over_default_rows(client, auth_user):
+    """A new partition should adopt matching rows from the default partition."""
+    user, headers = auth_user
+    tx = _add(user["id"], "2051-05-10")
+    assert _partition_of(tx["id"]) == "transactions_default"
+    try:
+        created = create_future_partitions("month", 0, today=date(2051, 5, 20))
+        assert [(p["name"], p["moved"]) for p in created] == [
+            ("transactions_m2051_05", 1)
+        ]
+        assert _partition_of(tx["id"]) == "transactions_m2051_05"
+        response = client.get(f"/transactions/{tx['id']}", headers=headers)
+        assert response.status_code == HTTPStatus.OK
+        assert find_rollup_drift() == []
+    finally:
+        detach_partition(
+            "transactions_m2051_05", date(2051, 5, 1), date(2051, 6, 1), drop=True
+        )
+
+
+def test_create_skips_covered_periods():
+    """Periods inside an existing partition should not be created again."""
+    today = date.today()
+    assert create_future_partitions("month", 0, today=today) == []
+    assert create_future_partitions("year", 0, today=today) == []
+
+
+def test_detach_old_partition_drops_rollups(client, auth_user):
+    """Detaching should remove the partition's rows and their rollups."""
+    user, headers = auth_user
+    create_future_partitions("year", 0, today=date(1990, 3, 1))
+    tx = _add(user["id"], "1990-06-01")
+
+    detached = detach_partitions_before(date(1991, 1, 1), drop=True)
+
+    assert [(p["name"], p["rollups_deleted"]) for p in detached] == [
+        ("transactions_y1990", 1)
+    ]
+    assert "transactions_y1990" not in [p["name"] for p in list_partitions()]
+    response = client.get(f"/transactions/{tx['id']}", headers=headers)
+    assert response.status_code == HTTPStatus.NOT_FOUND
+    assert find_rollup_drift() == []
+
+
+def test_patch_moves_row_across_partitions(client, auth_user):
+    """Changing the year should move the row and keep the rollups in sync."""
+    user, headers = auth_user
+    year = date.today().year
+    tx = _add(user["id"], f"{year}-03-01")
+    response = client.patch(
+        f"/transactions/{tx['id']}",
+        json={"transaction_date": f"{year + 1}-03-01"},
+        headers=headers,
+    )
+    assert response.status_code == HTTPStatus.OK
+    assert _partition_of(tx["id"]) == f"transactions_y{year + 1}"
+    assert response.json["amount"] == str(Decimal("12.50"))
+    assert find_rollup_drift() == []
+
+
+def test_cli_partitions_create(app):
+    """`flask db partitions create` should report existing partitions."""
+    result = app.test_cli_runner().invoke(
+        args=["db", "partitions", "create", "--ahead", "0"]
+    )
+    assert result.exit_code == 0
+    assert "All partitions already exist." in result.output
@@ -0,0 +1,50 @@
+from http import HTTPStatus
+
+import pytest
+
+from src.database.db_connection import get_conn
+from src.database.query_registry import QueryRegistry, queries
+from src.repositories.transactions_repo import (
+    GET_TRANSACTION,
+    _update_transaction_query,
+)
+from src.repositories.users_repo import GET_USER
+from tests.factories import make_transaction
+
+
+def test_register_rejects_duplicate_names():
+    """Registering the same name twice should raise."""
+    registry = QueryRegistry()
+    registry.register("select_one", "SELECT 1")
+    with pytest.raises(ValueError, match="already registered"):
+        registry.register("select_one", "SELECT 2")
+
+
+def test_update_variants_are_cached_by_column_set():
+    """UPDATE statements should be built once per sorted column set."""
+    name = _update_transaction_query(["kind", "amount"])
+    assert name == "update_transaction(amount,kind)"
+    assert _update_transaction_query(["amount", "kind"]) == name
+
+
+def test_calls_are_counted(client, auth_user):
+    """Every execution of a registered statement should be counted."""
+    user, headers = auth_user
+    transactions = [make_transaction(user_id=user["id"]) for _ in range(2)]
+    before = queries.stats().get(GET_TRANSACTION, 0)
+    for tx in transactions:
+        response = client.get(f"/transactions/{tx['id']}", headers=headers)
+        assert response.status_code == HTTPStatus.OK
+    assert queries.stats()[GET_TRANSACTION] == before + 2
+
+
+def test_statements_are_prepared_on_the_server(registered_user):
+    """Registered statements should be prepared on the connection that ran them."""
+    with get_conn() as conn:
+        with conn.cursor() as cur:
+            queries.execute(cur, GET_USER, (registered_user["id"],))
+        prepared = conn.execute(
+            "SELECT count(*) FROM pg_prepared_statements WHERE statement LIKE %s",
+            ("%SELECT username, email, data_version FROM users WHERE id = $1%",),
+        ).fetchone()[0]
+    assert prepared == 1
@@ -0,0 +1,184 @@
+import itertools
+import time
+from contextlib import asynccontextmanager, contextmanager
+from http import HTTPStatus
+
+import psycopg
+import pytest
+
+from src.config import settings
+from src.database.async_connection import (
+    close_async_pool,
+    get_async_pool,
+    get_async_replica_pools,
+    run_coroutine,
+)
+from src.database.db_connection import (
+    WRITE_MARKER_COOKIE,
+    _recent_writers,
+    close_pool,
+    get_conn,
+    get_pool,
+    get_replica_pools,
+)
+from src.repositories.users_repo import get_data_version
+
+# GET /me reads the user's data version (for its ETag), then the user.
+READS_PER_GET = 2
+
+
+@pytest.fixture()
+def replica(app, monkeypatch):
+    """Fixture: Routes reads to a 'replica' pool (on the same database)."""
+    monkeypatch.setattr(settings, "DB_REPLICA_URLS", [settings.db_url])
+    close_pool()
+    close_async_pool()
+    if app.config["ASYNC_VIEWS"]:
+        (pool,) = run_coroutine(get_async_replica_pools())
+    else:
+        (pool,) = get_replica_pools()
+    yield pool
+    close_pool()
+    close_async_pool()
+
+
+def _replica_requests(pool) -> int:
+    return pool.get_stats().get("requests_num", 0)
+
+
+def test_reads_use_replica(client, auth_user, replica):
+    """GET /me should be served from the replica pool."""
+    _user, headers = auth_user
+    response = client.get("/me", headers=headers)
+    assert response.status_code == HTTPStatus.OK
+    assert _replica_requests(replica) == READS_PER_GET
+
+
+def test_reads_after_write_use_primary(client, auth_user, replica):
+    """A user's read right after their own write should go to the primary."""
+    _user, headers = auth_user
+    response = client.patch("/me", json={"username": "renamed"}, headers=headers)
+    assert response.status_code == HTTPStatus.OK
+    response = client.get("/me", headers=headers)
+    assert response.get_json()["username"] == "renamed"
+    assert _replica_requests(replica) == 0
+
+
+def test_write_marker_pins_other_workers(client, auth_user, replica):
+    """Workers that did not serve a write should learn of it from its cookie."""
+    _user, headers = auth_user
+    client.patch("/me", json={"username": "renamed"}, headers=headers)
+    assert client.get_cookie(WRITE_MARKER_COOKIE) is not None
+    # As seen by another worker.
+    _recent_writers.until.clear()
+
+    response = client.get("/me", headers=headers)
+
+    assert response.get_json()["username"] == "renamed"
+    assert _replica_requests(replica) == 0
+
+
+def test_forged_write_marker_is_ignored(client, auth_user, replica):
+    """A write marker with a bad signature should not pin reads."""
+    user, headers = auth_user
+    client.set_cookie(WRITE_MARKER_COOKIE, f"{user['id']}:{time.time() + 60}:0")
+
+    client.get("/me", headers=headers)
+
+    assert _replica_requests(replica) == READS_PER_GET
+
+
+def test_reads_return_to_replica_after_window(client, auth_user, replica, monkeypatch):
+    """Once the read-your-writes window has passed, reads go back to replicas."""
+    monkeypatch.setattr(settings, "DB_READ_YOUR_WRITES_WINDOW", 0.0)
+    _user, headers = auth_user
+    client.patch("/me", json={"username": "renamed"}, headers=headers)
+    client.get("/me", headers=headers)
+    assert _replica_requests(replica) == READS_PER_GET
+
+
+def test_no_replicas_configured():
+    """Without DB_REPLICA_URLS there should be no replica pools."""
+    assert settings.DB_REPLICA_URLS == []
+    assert get_replica_pools() == []
+
+
+class _LaggingReplica:
+    """A 'replica' whose reads all see the snapshot taken when it was created."""
+
+    def __init__(self, async_views: bool) -> None:
+        self.async_views = async_views
+        if async_views:
+            self.conn = run_coroutine(self._connect_async())
+        else:
+            self.conn = psycopg.connect(settings.db_url)
+            self.conn.isolation_level = psycopg.IsolationLevel.REPEATABLE_READ
+            self.conn.execute("SELECT 1")
+
+    @staticmethod
+    async def _connect_async() -> psycopg.AsyncConnection:
+        conn = await psycopg.AsyncConnection.connect(settings.db_url)
+        await conn.set_isolation_level(psycopg.IsolationLevel.REPEATABLE_READ)
+        await conn.execute("SELECT 1")
+        return conn
+
+    def connection(self):
+        return self._async_connection() if self.async_views else self._connection()
+
+    @contextmanager
+    def _connection(self):
+        yield self.conn
+
+    @asynccontextmanager
+    async def _async_connection(self):
+        yield self.conn
+
+    def close(self) -> None:
+        if self.async_views:
+            run_coroutine(self.conn.close())
+        else:
+            self.conn.close()
+
+
+def test_request_reads_one_replica(app, client, auth_user, monkeypatch):
+    """A response's ETag and body should come from the same replica."""
+    user, headers = auth_user
+    lagging = _LaggingReplica(app.config["ASYNC_VIEWS"])
+    old_version = get_data_version(user["id"])
+    with get_conn() as conn:
+        conn.execute(
+            "UPDATE users SET username = 'renamed' WHERE id = %s", (user["id"],)
+        )
+    new_version = get_data_version(user["id"])
+    if app.config["ASYNC_VIEWS"]:
+        up_to_date = run_coroutine(get_async_pool())
+
+        async def replicas():
+            return [lagging, up_to_date]
+
+        monkeypatch.setattr(
+            "src.database.async_connection.get_async_replica_pools", replicas
+        )
+    else:
+        up_to_date = get_pool()
+        monkeypatch.setattr(
+            "src.database.db_connection.get_replica_pools",
+            lambda: [lagging, up_to_date],
+        )
+    # Unpinned, the first request would read its version on the up-to-date
+    # replica and the user on the lagging one.
+    picks = itertools.cycle([1, 0])
+    monkeypatch.setattr(
+        "src.database.db_connection.random.randrange", lambda _n: next(picks)
+    )
+
+    try:
+        responses = [client.get("/me", headers=headers) for _ in range(2)]
+    finally:
+        lagging.close()
+
+    tagged = [
+        (int(r.get_etag()[0].split("-")[1]), r.get_json()["username"])
+        for r in responses
+    ]
+    assert tagged == [(new_version, "renamed"), (old_version, user["username"])]
@@ -0,0 +1,37 @@
+from http import HTTPStatus
+
+import pytest
+
+from src.config import settings
+
+TOKEN = "internal-secret"
+
+
+@pytest.fixture()
+def internal_headers(monkeypatch):
+    monkeypatch.setattr(settings, "INTERNAL_API_TOKEN", TOKEN)
+    return {"X-Internal-Token": TOKEN}
+
+
+def test_cache_stats_success(client, internal_headers, auth_user):
+    """GET /internal/cache should report hits, misses and backend counters."""
+    _user, headers = auth_user
+    client.get(
+        "/internal/cache", query_string={"reset": "true"}, headers=internal_headers
+    )
+    client.get("/me", headers=headers)
+    client.get("/me", headers=headers)
+
+    response = client.get("/internal/cache", headers=internal_headers)
+
+    assert response.status_code == HTTPStatus.OK
+    data = response.get_json()
+    assert data["users"] == {"hits": 1, "misses": 1}
+    assert data["backend"]["entries"] >= 1
+    assert "evictions" in data["backend"]
+
+
+def test_cache_stats_wrong_token(client, internal_headers):
+    """Should return 401 when the token does not match."""
+    response = client.get("/internal/cache", headers={"X-Internal-Token": "nope"})
+    assert response.status_code == HTTPStatus.UNAUTHORIZED
@@ -0,0 +1,37 @@
+from http import HTTPStatus
+
+import pytest
+
+from src.config import settings
+
+TOKEN = "internal-secret"
+
+
+@pytest.fixture()
+def internal_headers(monkeypatch):
+    monkeypatch.setattr(settings, "INTERNAL_API_TOKEN", TOKEN)
+    return {"X-Internal-Token": TOKEN}
+
+
+def test_password_hashing_stats(client, internal_headers, registered_user):
+    """GET /internal/password-hashing should report the pool's queue depth."""
+    client.get(
+        "/internal/password-hashing",
+        query_string={"reset": "true"},
+        headers=internal_headers,
+    )
+    client.post(
+        "/auth/login",
+        json={"email": registered_user["email"], "password": "wrong_password"},
+    )
+
+    response = client.get("/internal/password-hashing", headers=internal_headers)
+
+    assert response.status_code == HTTPStatus.OK
+    data = response.get_json()
+    assert data["workers"] == settings.PASSWORD_HASH_WORKERS
+    assert data["max_pending"] == settings.PASSWORD_HASH_QUEUE_SIZE
+    assert data["pending"] == 0
+    assert data["completed"] == 1
+    assert data["peak_pending"] >= 1
+    assert data["rejected"] == 0
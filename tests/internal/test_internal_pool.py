@@ -0,0 +1,57 @@
+from http import HTTPStatus
+
+import pytest
+
+from src.config import settings
+
+TOKEN = "internal-secret"
+
+
+@pytest.fixture()
+def internal_headers(monkeypatch):
+    monkeypatch.setattr(settings, "INTERNAL_API_TOKEN", TOKEN)
+    return {"X-Internal-Token": TOKEN}
+
+
+def test_pool_stats_success(client, internal_headers, auth_user):
+    """GET /internal/pool should report the pool counters."""
+    _user, headers = auth_user
+    client.get("/me", headers=headers)
+    response = client.get("/internal/pool", headers=internal_headers)
+    assert response.status_code == HTTPStatus.OK
+    data = response.get_json()
+    expected_max = settings.DB_POOL_MAX_SIZE or settings.DB_POOL_MIN_SIZE
+    assert data["stats"]["pool_max"] == expected_max
+    assert data["stats"]["requests_num"] >= 1
+    assert 0 <= data["connections_in_use"] <= data["stats"]["pool_size"]
+
+
+def test_pool_stats_report_pools_serving_views(app, client, internal_headers):
+    """The async views' pools should be reported when the app serves them."""
+    response = client.get("/internal/pool", headers=internal_headers)
+    expected = (
+        "expense-tracker-async" if app.config["ASYNC_VIEWS"] else "expense-tracker"
+    )
+    assert response.get_json()["name"] == expected
+
+
+def test_pool_stats_reset(client, internal_headers):
+    """reset=true should zero the counters for the next read."""
+    client.get(
+        "/internal/pool", query_string={"reset": "true"}, headers=internal_headers
+    )
+    response = client.get("/internal/pool", headers=internal_headers)
+    assert response.get_json()["stats"]["requests_num"] == 0
+
+
+def test_pool_stats_wrong_token(client, internal_headers):
+    """Should return 401 when the token does not match."""
+    response = client.get("/internal/pool", headers={"X-Internal-Token": "nope"})
+    assert response.status_code == HTTPStatus.UNAUTHORIZED
+
+
+def test_pool_stats_disabled_without_token(client, monkeypatch):
+    """Should return 404 while no internal token is configured."""
+    monkeypatch.setattr(settings, "INTERNAL_API_TOKEN", None)
+    response = client.get("/internal/pool", headers={"X-Internal-Token": ""})
+    assert response.status_code == HTTPStatus.NOT_FOUND
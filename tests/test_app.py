@@ -0,0 +1,11 @@
+from src.app import warm_up
+from src.config import settings
+from src.database.db_connection import get_pool
+from src.schemas.base import build_schemas
+
+
+def test_warm_up_opens_pool_and_builds_schemas():
+    """warm_up() should leave the pool filled and no schema left to build."""
+    warm_up()
+    assert build_schemas() == 0
+    assert get_pool().get_stats()["pool_size"] >= settings.DB_POOL_MIN_SIZE
@@ -0,0 +1,95 @@
+from http import HTTPStatus
+
+from src.repositories.transactions_repo import get_transaction_by_id
+from tests.factories import make_transaction
+
+
+def test_tx_batch_success(client, auth_user, tx_payload):
+    """POST /transactions/batch should apply all operations in order, returns 200 and results"""
+    user, headers = auth_user
+    to_patch = make_transaction(user_id=user["id"])
+    to_delete = make_transaction(user_id=user["id"])
+
+    operations = [
+        {"op": "create", "data": tx_payload},
+        {"op": "patch", "id": to_patch["id"], "data": {"description": "Patched"}},
+        {"op": "delete", "id": to_delete["id"]},
+    ]
+    response = client.post(
+        "/transactions/batch", json={"operations": operations}, headers=headers
+    )
+    assert response.status_code == HTTPStatus.OK
+    created, patched, deleted = response.get_json()["results"]
+
+    assert created["op"] == "create"
+    assert created["transaction"]["description"] == tx_payload["description"]
+    assert created["transaction"]["amount"] == tx_payload["amount"]
+    assert get_transaction_by_id(user["id"], created["id"])
+
+    assert patched["id"] == to_patch["id"]
+    assert patched["transaction"]["description"] == "Patched"
+
+    assert deleted == {"op": "delete", "id": to_delete["id"], "transaction": None}
+    assert get_transaction_by_id(user["id"], to_delete["id"]) is None
+
+
+def test_tx_batch_is_atomic(client, auth_user, tx_payload):
+    """Should return 404 and roll back every operation when one target is missing."""
+    user, headers = auth_user
+    existing = make_transaction(user_id=user["id"])
+    operations = [
+        {"op": "patch", "id": existing["id"], "data": {"description": "Patched"}},
+        {"op": "create", "data": tx_payload},
+        {"op": "delete", "id": 999999999},
+    ]
+    response = client.post(
+        "/transactions/batch", json={"operations": operations}, headers=headers
+    )
+    assert response.status_code == HTTPStatus.NOT_FOUND
+    assert "operation 2" in response.get_json()["error"]
+    tx = get_transaction_by_id(user["id"], existing["id"])
+    assert tx["description"] == existing["description"]
+
+
+def test_tx_batch_other_users_transaction(client, auth_user, registered_user):
+    """Should return 404 when an operation targets another user's transaction."""
+    _user, headers = auth_user
+    foreign = make_transaction(user_id=registered_user["id"])
+    response = client.post(
+        "/transactions/batch",
+        json={"operations": [{"op": "delete", "id": foreign["id"]}]},
+        headers=headers,
+    )
+    assert response.status_code == HTTPStatus.NOT_FOUND
+    assert get_transaction_by_id(registered_user["id"], foreign["id"])
+
+
+def test_tx_batch_empty_patch(client, auth_user, added_transaction):
+    """Should return 400 when a patch operation carries no fields."""
+    _user, headers = auth_user
+    response = client.post(
+        "/transactions/batch",
+        json={
+            "operations": [{"op": "patch", "id": added_transaction["id"], "data": {}}]
+        },
+        headers=headers,
+    )
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+
+
+def test_tx_batch_invalid_operation(client, auth_user):
+    """Should return 400 for unknown operations or an empty batch."""
+    _user, headers = auth_user
+    for body in ({"operations": []}, {"operations": [{"op": "merge", "id": 1}]}):
+        response = client.post("/transactions/batch", json=body, headers=headers)
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+
+
+def test_tx_batch_user_not_found(client, nonexisting_user_headers, tx_payload):
+    """Should return 404 when creating transactions for a user that doesn't exist."""
+    response = client.post(
+        "/transactions/batch",
+        json={"operations": [{"op": "create", "data": tx_payload}]},
+        headers=nonexisting_user_headers,
+    )
+    assert response.status_code == HTTPStatus.NOT_FOUND
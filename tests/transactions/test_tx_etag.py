@@ -0,0 +1,132 @@
+from http import HTTPStatus
+
+import psycopg
+
+from src.config import settings
+from src.repositories.users_repo import get_data_version
+from src.utils.json_provider import MSGPACK_MIMETYPE
+from tests.factories import make_transaction, make_user
+
+
+def _revalidate(client, url, headers):
+    """GET `url`, then GET it again with the returned ETag."""
+    first = client.get(url, headers=headers)
+    assert first.status_code == HTTPStatus.OK
+    etag = first.headers["ETag"]
+    second = client.get(url, headers={**headers, "If-None-Match": etag})
+    return etag, second
+
+
+def test_tx_list_not_modified(client, auth_user, added_transaction):
+    """A repeated list request with the current ETag should get an empty 304."""
+    _user, headers = auth_user
+    etag, response = _revalidate(client, "/transactions/?limit=5", headers)
+
+    assert response.status_code == HTTPStatus.NOT_MODIFIED
+    assert response.data == b""
+    assert response.headers["ETag"] == etag
+    assert "Accept" in response.headers["Vary"]
+
+
+def test_tx_info_not_modified(client, auth_user, added_transaction):
+    """A repeated GET by ID with the current ETag should get an empty 304."""
+    _user, headers = auth_user
+    url = f"/transactions/{added_transaction['id']}"
+    _etag, response = _revalidate(client, url, headers)
+    assert response.status_code == HTTPStatus.NOT_MODIFIED
+
+
+def test_user_info_not_modified(client, auth_user):
+    """GET /me should honour If-None-Match too."""
+    _user, headers = auth_user
+    _etag, response = _revalidate(client, "/me", headers)
+    assert response.status_code == HTTPStatus.NOT_MODIFIED
+
+
+def test_not_modified_skips_the_view(client, auth_user, patch_repo):
+    """A 304 should be answered from the version alone, without reading rows."""
+    _user, headers = auth_user
+    etag = client.get("/transactions/", headers=headers).headers["ETag"]
+
+    with patch_repo(
+        "src.services.transactions_service.get_all_transactions",
+        side_effect=AssertionError("rows fetched"),
+    ):
+        response = client.get(
+            "/transactions/", headers={**headers, "If-None-Match": etag}
+        )
+    assert response.status_code == HTTPStatus.NOT_MODIFIED
+
+
+def test_writes_change_the_etag(client, auth_user, added_transaction, tx_payload):
+    """Creating, updating and deleting transactions should each change the ETag."""
+    _user, headers = auth_user
+    url = f"/transactions/{added_transaction['id']}"
+    etags = [client.get(url, headers=headers).headers["ETag"]]
+
+    client.post("/transactions/", json=tx_payload, headers=headers)
+    etags.append(client.get(url, headers=headers).headers["ETag"])
+    client.patch(url, json={"description": "Changed"}, headers=headers)
+    etags.append(client.get(url, headers=headers).headers["ETag"])
+
+    assert len(set(etags)) == len(etags)
+    response = client.get(url, headers={**headers, "If-None-Match": etags[0]})
+    assert response.status_code == HTTPStatus.OK
+    assert response.get_json()["description"] == "Changed"
+
+    client.delete(url, headers=headers)
+    response = client.get("/transactions/", headers=headers)
+    assert response.headers["ETag"] not in etags
+
+
+def test_profile_update_changes_the_etag(client, auth_user, faker):
+    """Updating the profile should change the /me ETag."""
+    _user, headers = auth_user
+    before = client.get("/me", headers=headers).headers["ETag"]
+    client.patch("/me", json={"username": faker.user_name()}, headers=headers)
+    after = client.get("/me", headers={**headers, "If-None-Match": before})
+    assert after.status_code == HTTPStatus.OK
+    assert after.headers["ETag"] != before
+
+
+def test_etag_depends_on_representation(client, auth_user, added_transaction):
+    """JSON and MessagePack bodies, and different queries, should not share tags."""
+    _user, headers = auth_user
+    as_json = client.get("/transactions/", headers=headers)
+    as_msgpack = client.get(
+        "/transactions/", headers={**headers, "Accept": MSGPACK_MIMETYPE}
+    )
+    sorted_page = client.get("/transactions/?sort=-amount", headers=headers)
+
+    tags = {r.headers["ETag"] for r in (as_json, as_msgpack, sorted_page)}
+    assert len(tags) == 3  # noqa: PLR2004
+
+
+def test_other_users_writes_keep_the_etag(client, auth_user):
+    """Writes by another user should not invalidate this user's tags."""
+    _user, headers = auth_user
+    etag = client.get("/transactions/", headers=headers).headers["ETag"]
+    make_transaction(user_id=make_user()["id"])
+    response = client.get("/transactions/", headers={**headers, "If-None-Match": etag})
+    assert response.status_code == HTTPStatus.NOT_MODIFIED
+
+
+def test_statement_bumps_version_once(auth_user):
+    """A statement touching many of a user's rows should bump the version once."""
+    user, _headers = auth_user
+    for _ in range(3):
+        make_transaction(user_id=user["id"])
+    before = get_data_version(user["id"])
+    with psycopg.connect(settings.db_url) as conn:
+        conn.execute(
+            "UPDATE transactions SET description = 'Bulk' WHERE user_id = %s",
+            (user["id"],),
+        )
+    assert get_data_version(user["id"]) == before + 1
+
+
+def test_missing_user_has_no_etag(client, nonexisting_user_headers):
+    """Without a user row there is no version, so the response is untagged."""
+    response = client.get("/transactions/", headers=nonexisting_user_headers)
+    assert response.status_code == HTTPStatus.OK
+    assert "ETag" not in response.headers
@@ -0,0 +1,80 @@
+import csv
+import io
+import json
+from http import HTTPStatus
+from unittest.mock import patch
+
+from tests.factories import make_transaction
+
+
+def test_tx_export_csv(client, auth_user):
+    """GET /transactions/export should stream all transactions as CSV with a header."""
+    user, headers = auth_user
+    created = [make_transaction(user_id=user["id"]) for _ in range(3)]
+
+    response = client.get("/transactions/export", headers=headers)
+    assert response.status_code == HTTPStatus.OK
+    assert response.mimetype == "text/csv"
+    assert "attachment" in response.headers["Content-Disposition"]
+
+    rows = list(csv.DictReader(io.StringIO(response.get_data(as_text=True))))
+    assert {int(row["id"]) for row in rows} == {tx["id"] for tx in created}
+    by_id = {int(row["id"]): row for row in rows}
+    for tx in created:
+        row = by_id[tx["id"]]
+        assert row["kind"] == tx["kind"]
+        assert row["transaction_date"] == str(tx["transaction_date"])
+        assert row["amount"] == str(tx["amount"])
+        assert row["description"] == tx["description"]
+
+
+def test_tx_export_ndjson(client, auth_user):
+    """GET /transactions/export?format=ndjson should stream one JSON object per line."""
+    user, headers = auth_user
+    created = [make_transaction(user_id=user["id"]) for _ in range(3)]
+
+    response = client.get("/transactions/export?format=ndjson", headers=headers)
+    assert response.status_code == HTTPStatus.OK
+    assert response.mimetype == "application/x-ndjson"
+
+    records = [
+        json.loads(line) for line in response.get_data(as_text=True).splitlines()
+    ]
+    assert [r["id"] for r in records] == [
+        tx["id"]
+        for tx in sorted(created, key=lambda tx: (tx["transaction_date"], tx["id"]))
+    ]
+    assert records[0]["amount"] == str(
+        next(tx["amount"] for tx in created if tx["id"] == records[0]["id"])
+    )
+
+
+def test_tx_export_streams_in_chunks(client, auth_user):
+    """Export should be emitted in several chunks when the ledger exceeds itersize."""
+    user, headers = auth_user
+    for _ in range(5):
+        make_transaction(user_id=user["id"])
+
+    with patch("src.services.transactions_service.settings.EXPORT_ITERSIZE", 2):
+        response = client.get("/transactions/export?format=ndjson", headers=headers)
+        chunks = list(response.response)
+
+    assert response.status_code == HTTPStatus.OK
+    assert len(chunks) == 3  # noqa: PLR2004
+    assert sum(chunk.count(b"\n") for chunk in chunks) == 5  # noqa: PLR2004
+
+
+def test_tx_export_empty_ledger(client, nonexisting_user_headers):
+    """Should return only the CSV header when the user has no transactions."""
+    response = client.get("/transactions/export", headers=nonexisting_user_headers)
+    assert response.status_code == HTTPStatus.OK
+    assert response.get_data(as_text=True) == (
+        "id,kind,transaction_date,amount,description\n"
+    )
+
+
+def test_tx_export_invalid_format(client, auth_user):
+    """Should return 400 when export format is not supported."""
+    _user, headers = auth_user
+    response = client.get("/transactions/export?format=xml", headers=headers)
+    assert response.status_code == HTTPStatus.BAD_REQUEST
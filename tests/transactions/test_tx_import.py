@@ -0,0 +1,130 @@
+import csv
+import json
+from http import HTTPStatus
+from unittest.mock import patch
+
+from src.repositories.transactions_repo import get_all_transactions
+
+CSV_BODY = (
+    "kind,transaction_date,amount,description\n"
+    "expense,2025-01-05,12.50,Coffee beans\n"
+    'income,2025-01-31,2500.00,"Salary, January"\n'
+)
+
+
+def test_tx_import_csv_success(client, auth_user):
+    """POST /transactions/import should COPY all CSV rows, returns 201 and row count"""
+    user, headers = auth_user
+    response = client.post(
+        "/transactions/import", data=CSV_BODY, content_type="text/csv", headers=headers
+    )
+    assert response.status_code == HTTPStatus.CREATED
+    assert response.get_json() == {"imported": 2, "errors": []}
+
+    rows = get_all_transactions(user["id"], limit=10)
+    assert [row["description"] for row in rows] == ["Coffee beans", "Salary, January"]
+    assert str(rows[0]["amount"]) == "12.50"
+
+
+def test_tx_import_ndjson_success(client, auth_user, tx_payload):
+    """POST /transactions/import should accept NDJSON bodies, skipping blank lines."""
+    user, headers = auth_user
+    body = json.dumps(tx_payload) + "\n\n" + json.dumps(tx_payload) + "\n"
+    response = client.post(
+        "/transactions/import",
+        data=body,
+        content_type="application/x-ndjson",
+        headers=headers,
+    )
+    assert response.status_code == HTTPStatus.CREATED
+    assert response.get_json()["imported"] == 2  # noqa: PLR2004
+    assert len(get_all_transactions(user["id"], limit=10)) == 2  # noqa: PLR2004
+
+
+def test_tx_import_reports_invalid_lines(client, auth_user, tx_payload):
+    """Should return 422 with per-line errors and import nothing when a line is invalid."""
+    user, headers = auth_user
+    bad_amount = {**tx_payload, "amount": -1}
+    body = "\n".join([json.dumps(tx_payload), "{not json", json.dumps(bad_amount), ""])
+    response = client.post(
+        "/transactions/import",
+        data=body,
+        content_type="application/x-ndjson",
+        headers=headers,
+    )
+    assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+    data = response.get_json()
+    assert data["imported"] == 0
+    assert [error["line"] for error in data["errors"]] == [2, 3]
+    assert data["errors"][1]["errors"][0]["loc"] == ["amount"]
+    assert get_all_transactions(user["id"], limit=10) == []
+
+
+def test_tx_import_stops_at_max_errors(client, auth_user):
+    """Should stop reading the upload once IMPORT_MAX_ERRORS lines failed."""
+    _user, headers = auth_user
+    body = "kind,transaction_date,amount,description\n" + "bogus,,,\n" * 10
+    with patch("src.services.transactions_service.settings.IMPORT_MAX_ERRORS", 3):
+        response = client.post(
+            "/transactions/import", data=body, content_type="text/csv", headers=headers
+        )
+    assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+    assert [error["line"] for error in response.get_json()["errors"]] == [2, 3, 4]
+
+
+def test_tx_import_csv_missing_columns(client, auth_user):
+    """Should return 400 when the CSV header lacks required columns."""
+    _user, headers = auth_user
+    response = client.post(
+        "/transactions/import",
+        data="kind,amount\nexpense,1.00\n",
+        content_type="text/csv",
+        headers=headers,
+    )
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+
+
+def test_tx_import_csv_oversized_field(client, auth_user):
+    """Should return 400 naming the line when a CSV field exceeds the size limit."""
+    user, headers = auth_user
+    oversized = "x" * (csv.field_size_limit() + 1)
+    body = CSV_BODY + f"expense,2025-02-01,1.00,{oversized}\n"
+
+    response = client.post(
+        "/transactions/import", data=body, content_type="text/csv", headers=headers
+    )
+
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    assert "(line 4)" in response.get_json()["error"]
+    assert get_all_transactions(user["id"], limit=10) == []
+
+
+def test_tx_import_csv_nul_byte(client, auth_user):
+    """Should report a line with a NUL character instead of failing the COPY."""
+    _user, headers = auth_user
+    body = CSV_BODY + "expense,2025-02-01,1.00,Coffee\x00beans\n"
+
+    response = client.post(
+        "/transactions/import", data=body, content_type="text/csv", headers=headers
+    )
+
+    assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+    assert response.get_json()["errors"][0]["line"] == 4  # noqa: PLR2004
+
+
+def test_tx_import_user_not_found(client, nonexisting_user_headers):
+    """Should return 404 when importing for a user that doesn't exist."""
+    response = client.post(
+        "/transactions/import",
+        data=CSV_BODY,
+        content_type="text/csv",
+        headers=nonexisting_user_headers,
+    )
+    assert response.status_code == HTTPStatus.NOT_FOUND
+
+
+def test_tx_import_unsupported_content_type(client, auth_user, tx_payload):
+    """Should return 415 when the upload is neither CSV nor NDJSON."""
+    _user, headers = auth_user
+    response = client.post("/transactions/import", json=tx_payload, headers=headers)
+    assert response.status_code == HTTPStatus.UNSUPPORTED_MEDIA_TYPE
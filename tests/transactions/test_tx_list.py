@@ -1,5 +1,14 @@
+import base64
+import json
 from http import HTTPStatus
 
+import pytest
+
+from src.repositories.transactions_repo import insert_transaction
+from tests.factories import make_transaction
+
+PAGE_SIZE = 2
+
 
 def test_tx_list_success(client, auth_user, added_transaction):
     """GET transactions/ Should return a 200, and a list of transactions that belong to that user."""
@@ -23,3 +32,169 @@ def test_tx_list_user_not_found(client, nonexisting_user_headers):
     assert response.status_code == HTTPStatus.OK
     data = response.get_json()
     assert data["transactions"] == []
+
+
+def test_tx_list_pagination(client, auth_user):
+    """Should walk all transactions page by page in (date, id) order using next_cursor."""
+    user, headers = auth_user
+    created_ids = {make_transaction(user_id=user["id"])["id"] for _ in range(5)}
+
+    seen = []
+    cursor = None
+    while True:
+        query = {"limit": PAGE_SIZE}
+        if cursor is not None:
+            query["cursor"] = cursor
+        response = client.get("/transactions/", query_string=query, headers=headers)
+        assert response.status_code == HTTPStatus.OK
+        data = response.get_json()
+        assert len(data["transactions"]) <= PAGE_SIZE
+        seen.extend(data["transactions"])
+        cursor = data["next_cursor"]
+        if cursor is None:
+            break
+
+    assert {tx["id"] for tx in seen} == created_ids
+    assert len(seen) == len(created_ids)
+    keys = [(tx["transaction_date"], tx["id"]) for tx in seen]
+    assert keys == sorted(keys)
+
+
+def test_tx_list_last_page_has_no_cursor(client, auth_user, added_transaction):
+    """Should return next_cursor null when all transactions fit in one page."""
+    _user, headers = auth_user
+    response = client.get("/transactions/", headers=headers)
+    assert response.status_code == HTTPStatus.OK
+    assert response.get_json()["next_cursor"] is None
+
+
+def test_tx_list_invalid_cursor(client, auth_user):
+    """Should return 400 when cursor is malformed."""
+    _user, headers = auth_user
+    response = client.get(
+        "/transactions/", query_string={"cursor": "not-a-cursor"}, headers=headers
+    )
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+
+
+def _raw_cursor(*key) -> str:
+    return base64.urlsafe_b64encode(json.dumps(key).encode()).decode()
+
+
+@pytest.mark.parametrize(
+    "key",
+    [
+        ("amount", "10.00", float("inf")),
+        ("amount", "10.00", 2**31),
+        ("amount", "Infinity", 1),
+        ("amount", "NaN", 1),
+        ("amount", "1e999999999", 1),
+        ("amount", "1e-99999", 1),
+    ],
+)
+def test_tx_list_out_of_range_cursor(client, auth_user, key):
+    """Should return 400 for a cursor whose key the database cannot compare."""
+    _user, headers = auth_user
+    response = client.get(
+        "/transactions/",
+        query_string={"sort": "amount", "cursor": _raw_cursor(*key)},
+        headers=headers,
+    )
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+
+
+def test_tx_list_invalid_limit(client, auth_user):
+    """Should return 400 when limit is out of range."""
+    _user, headers = auth_user
+    response = client.get("/transactions/", query_string={"limit": 0}, headers=headers)
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+
+
+def _list(client, headers, **query):
+    response = client.get("/transactions/", query_string=query, headers=headers)
+    assert response.status_code == HTTPStatus.OK
+    return response.get_json()
+
+
+def test_tx_list_filters(client, auth_user):
+    """Should only return transactions matching date range, kind and amount range."""
+    user, headers = auth_user
+    rows = [
+        ("expense", "2025-01-15", "10.00"),
+        ("expense", "2025-02-03", "25.00"),
+        ("income", "2025-02-10", "25.00"),
+        ("expense", "2025-02-20", "80.00"),
+        ("expense", "2025-03-01", "30.00"),
+    ]
+    ids = [
+        insert_transaction(user["id"], kind, tx_date, amount, "x")["id"]
+        for kind, tx_date, amount in rows
+    ]
+
+    data = _list(client, headers, **{"from": "2025-02-01", "to": "2025-02-28"})
+    assert [tx["id"] for tx in data["transactions"]] == ids[1:4]
+
+    data = _list(client, headers, kind="expense", min_amount="20", max_amount="50")
+    assert [tx["id"] for tx in data["transactions"]] == [ids[1], ids[4]]
+
+
+def test_tx_list_sort_by_amount_desc_paginates(client, auth_user):
+    """Should page through results in descending amount order with stable ties."""
+    user, headers = auth_user
+    amounts = ["5.00", "70.00", "12.50", "70.00", "1.00"]
+    for amount in amounts:
+        insert_transaction(user["id"], "expense", "2025-01-01", amount, "x")
+
+    seen = []
+    data = _list(client, headers, sort="-amount", limit=PAGE_SIZE)
+    seen += data["transactions"]
+    while data["next_cursor"]:
+        data = _list(
+            client, headers, sort="-amount", limit=PAGE_SIZE, cursor=data["next_cursor"]
+        )
+        seen += data["transactions"]
+
+    assert [tx["amount"] for tx in seen] == sorted(amounts, key=float, reverse=True)
+    tied = [tx["id"] for tx in seen if tx["amount"] == "70.00"]
+    assert tied == sorted(tied, reverse=True)
+
+
+def test_tx_list_sort_by_date_desc(client, auth_user):
+    """Should return newest transactions first with sort=-date."""
+    user, headers = auth_user
+    for tx_date in ("2025-01-01", "2025-03-01", "2025-02-01"):
+        insert_transaction(user["id"], "income", tx_date, "1.00", "x")
+    data = _list(client, headers, sort="-date")
+    dates = [tx["transaction_date"] for tx in data["transactions"]]
+    assert dates == ["2025-03-01", "2025-02-01", "2025-01-01"]
+
+
+def test_tx_list_cursor_from_other_sort(client, auth_user):
+    """Should return 400 when a cursor is reused with a different sort."""
+    user, headers = auth_user
+    for _ in range(3):
+        make_transaction(user_id=user["id"])
+    cursor = _list(client, headers, limit=1)["next_cursor"]
+    response = client.get(
+        "/transactions/",
+        query_string={"limit": 1, "cursor": cursor, "sort": "amount"},
+        headers=headers,
+    )
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+
+
+def test_tx_list_invalid_filters(client, auth_user):
+    """Should return 400 for invalid filter values or inverted ranges."""
+    _user, headers = auth_user
+    for query in (
+        {"kind": "transfer"},
+        {"sort": "description"},
+        {"min_amount": "-1"},
+        {"min_amount": "10", "max_amount": "5"},
+        {"min_amount": "1e99999999"},
+        {"max_amount": "Infinity"},
+        {"max_amount": "0.001"},
+        {"from": "2025-02-01", "to": "2025-01-01"},
+    ):
+        response = client.get("/transactions/", query_string=query, headers=headers)
+        assert response.status_code == HTTPStatus.BAD_REQUEST
@@ -0,0 +1,105 @@
+from http import HTTPStatus
+
+import msgpack
+
+MSGPACK = "application/msgpack"
+
+
+def test_tx_list_msgpack_response(client, auth_user, added_transaction):
+    """GET /transactions/ should return MessagePack when the client prefers it."""
+    _user, headers = auth_user
+    as_json = client.get("/transactions/", headers=headers)
+    response = client.get("/transactions/", headers={**headers, "Accept": MSGPACK})
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.mimetype == MSGPACK
+    assert "Accept" in response.vary
+    assert msgpack.unpackb(response.data) == as_json.get_json()
+    assert as_json.mimetype == "application/json"
+
+
+def test_tx_json_stays_default(client, auth_user):
+    """Clients accepting anything should keep getting JSON."""
+    _user, headers = auth_user
+    response = client.get("/transactions/", headers={**headers, "Accept": "*/*"})
+    assert response.mimetype == "application/json"
+
+
+def test_tx_error_msgpack_response(client, auth_user):
+    """Error responses should be negotiated too."""
+    _user, headers = auth_user
+    response = client.get(
+        "/transactions/999999", headers={**headers, "Accept": MSGPACK}
+    )
+    assert response.status_code == HTTPStatus.NOT_FOUND
+    assert msgpack.unpackb(response.data) == {"error": "Transaction not found"}
+
+
+def test_tx_create_msgpack_body(client, auth_user, tx_payload):
+    """POST /transactions/ should accept a MessagePack body."""
+    _user, headers = auth_user
+    response = client.post(
+        "/transactions/",
+        data=msgpack.packb(tx_payload),
+        content_type=MSGPACK,
+        headers=headers,
+    )
+    assert response.status_code == HTTPStatus.CREATED
+    assert response.get_json()["description"] == tx_payload["description"]
+
+
+def test_tx_create_invalid_msgpack_body(client, auth_user):
+    """A body that is not MessagePack should be rejected with 415."""
+    _user, headers = auth_user
+    response = client.post(
+        "/transactions/", data=b"\xc1", content_type=MSGPACK, headers=headers
+    )
+    assert response.status_code == HTTPStatus.UNSUPPORTED_MEDIA_TYPE
+
+
+def test_tx_batch_msgpack_body(client, auth_user, tx_payload):
+    """POST /transactions/batch should accept a MessagePack body."""
+    _user, headers = auth_user
+    body = {"operations": [{"op": "create", "data": tx_payload}]}
+    response = client.post(
+        "/transactions/batch",
+        data=msgpack.packb(body),
+        content_type=MSGPACK,
+        headers={**headers, "Accept": MSGPACK},
+    )
+    assert response.status_code == HTTPStatus.OK
+    (result,) = msgpack.unpackb(response.data)["results"]
+    assert result["transaction"]["amount"] == tx_payload["amount"]
+
+
+def test_tx_import_msgpack(client, auth_user, tx_payload):
+    """POST /transactions/import should take a stream of MessagePack maps."""
+    _user, headers = auth_user
+    invalid = {**tx_payload, "kind": "gift"}
+    body = b"".join(msgpack.packb(record) for record in (tx_payload, invalid))
+    response = client.post(
+        "/transactions/import", data=body, content_type=MSGPACK, headers=headers
+    )
+    assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+    assert [error["line"] for error in response.get_json()["errors"]] == [2]
+
+    response = client.post(
+        "/transactions/import",
+        data=msgpack.packb(tx_payload),
+        content_type=MSGPACK,
+        headers=headers,
+    )
+    assert response.status_code == HTTPStatus.CREATED
+    assert response.get_json()["imported"] == 1
+
+
+def test_tx_import_truncated_msgpack(client, auth_user, tx_payload):
+    """A MessagePack upload cut off inside an object should be rejected."""
+    _user, headers = auth_user
+    response = client.post(
+        "/transactions/import",
+        data=msgpack.packb(tx_payload)[:-1],
+        content_type=MSGPACK,
+        headers=headers,
+    )
+    assert response.status_code == HTTPStatus.BAD_REQUEST
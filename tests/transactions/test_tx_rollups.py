@@ -0,0 +1,108 @@
+from datetime import date
+from decimal import Decimal
+from http import HTTPStatus
+
+import psycopg
+
+from src.config import settings
+from src.repositories.rollups_repo import find_rollup_drift
+from src.repositories.transactions_repo import insert_transaction
+
+
+def _rollups(user_id):
+    with psycopg.connect(settings.db_url) as conn:
+        rows = conn.execute(
+            """SELECT month, kind, total, tx_count FROM transaction_monthly_rollups
+               WHERE user_id = %s ORDER BY month, kind""",
+            (user_id,),
+        ).fetchall()
+    return [
+        (month.isoformat(), kind, total, count) for month, kind, total, count in rows
+    ]
+
+
+def test_rollups_follow_create_patch_delete(client, auth_user, tx_payload):
+    """Rollups should track inserts, patches moving month/kind, and deletes."""
+    user, headers = auth_user
+    tx_payload.update(transaction_date="2025-01-10", amount="10.00")
+    tx_id = client.post("/transactions/", json=tx_payload, headers=headers).json["id"]
+    client.post("/transactions/", json=tx_payload, headers=headers)
+    assert _rollups(user["id"]) == [("2025-01-01", "expense", Decimal("20.00"), 2)]
+
+    client.patch(
+        f"/transactions/{tx_id}",
+        json={"transaction_date": "2025-02-03", "kind": "income", "amount": "7.50"},
+        headers=headers,
+    )
+    assert _rollups(user["id"]) == [
+        ("2025-01-01", "expense", Decimal("10.00"), 1),
+        ("2025-02-01", "income", Decimal("7.50"), 1),
+    ]
+
+    client.delete(f"/transactions/{tx_id}", headers=headers)
+    assert _rollups(user["id"]) == [("2025-01-01", "expense", Decimal("10.00"), 1)]
+    assert find_rollup_drift() == []
+
+
+def test_rollups_follow_bulk_import(client, auth_user):
+    """Rows loaded through COPY should be counted in the rollups."""
+    user, headers = auth_user
+    body = (
+        "kind,transaction_date,amount,description\n"
+        "expense,2025-03-01,1.25,a\nexpense,2025-03-31,2.25,b\n"
+    )
+    response = client.post(
+        "/transactions/import", data=body, content_type="text/csv", headers=headers
+    )
+    assert response.status_code == HTTPStatus.CREATED
+    assert _rollups(user["id"]) == [("2025-03-01", "expense", Decimal("3.50"), 2)]
+
+
+def test_rollups_removed_with_user(client, auth_user):
+    """Deleting a user should drop their rollups without errors."""
+    user, headers = auth_user
+    insert_transaction(user["id"], "income", "2025-04-01", "5.00", "x")
+    assert client.delete("/me", headers=headers).status_code == HTTPStatus.OK
+    assert _rollups(user["id"]) == []
+
+
+def test_summary_from_rollups_matches_scan(client, auth_user):
+    """Monthly summaries without percentiles should match the scanning path."""
+    user, headers = auth_user
+    for kind, tx_date, amount in [
+        ("income", date(2024, 12, 31), "100.00"),
+        ("expense", date(2025, 1, 2), "12.40"),
+        ("expense", date(2025, 1, 28), "0.60"),
+        ("income", date(2025, 2, 14), "50.00"),
+    ]:
+        insert_transaction(user["id"], kind, tx_date, amount, "x")
+
+    for query in ("group_by=month", "group_by=year&from=2025-01-01&to=2025-12-31"):
+        rollup = client.get(
+            f"/transactions/summary?{query}&percentiles=false", headers=headers
+        ).json
+        scan = client.get(f"/transactions/summary?{query}", headers=headers).json
+        for bucket in scan["buckets"]:
+            bucket.update(expense_p50=None, expense_p90=None)
+        assert rollup == scan
+
+
+def test_cli_rollups_verify_and_rebuild(app, auth_user):
+    """`flask db rollups verify|rebuild` should detect and repair drift."""
+    user, _headers = auth_user
+    insert_transaction(user["id"], "expense", "2025-05-05", "3.00", "x")
+    with psycopg.connect(settings.db_url) as conn:
+        conn.execute(
+            "UPDATE transaction_monthly_rollups SET total = total + 1 WHERE user_id = %s",
+            (user["id"],),
+        )
+
+    runner = app.test_cli_runner()
+    result = runner.invoke(args=["db", "rollups", "verify"])
+    assert result.exit_code == 1
+    assert f"user={user['id']} month=2025-05-01" in result.output
+
+    assert runner.invoke(args=["db", "rollups", "rebuild"]).exit_code == 0
+    result = runner.invoke(args=["db", "rollups", "verify"])
+    assert result.exit_code == 0
+    assert _rollups(user["id"]) == [("2025-05-01", "expense", Decimal("3.00"), 1)]
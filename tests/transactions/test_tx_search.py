@@ -0,0 +1,132 @@
+import base64
+import json
+from http import HTTPStatus
+
+import pytest
+
+from src.repositories.transactions_repo import insert_transaction
+
+PAGE_SIZE = 2
+
+
+def add_described(user_id: int, *descriptions: str) -> list[dict]:
+    return [
+        insert_transaction(
+            user_id=user_id,
+            kind="expense",
+            transaction_date="2024-03-01",
+            amount="10.00",
+            description=description,
+        )
+        for description in descriptions
+    ]
+
+
+def test_tx_search_fulltext(client, auth_user):
+    """Should return stemmed full-text matches only, ranked best first."""
+    user, headers = auth_user
+    add_described(
+        user["id"],
+        "Weekly groceries",
+        "Groceries and groceries again",
+        "Cinema tickets",
+    )
+    response = client.get(
+        "/transactions/search", query_string={"q": "grocery"}, headers=headers
+    )
+    assert response.status_code == HTTPStatus.OK
+    data = response.get_json()
+    assert data["match"] == "fulltext"
+    assert [tx["description"] for tx in data["results"]] == [
+        "Groceries and groceries again",
+        "Weekly groceries",
+    ]
+    assert data["next_cursor"] is None
+
+
+def test_tx_search_fuzzy_fallback(client, auth_user):
+    """Should fall back to trigram matching when the words match nothing."""
+    user, headers = auth_user
+    add_described(user["id"], "Weekly groceries", "Cinema tickets")
+    response = client.get(
+        "/transactions/search", query_string={"q": "grocries"}, headers=headers
+    )
+    assert response.status_code == HTTPStatus.OK
+    data = response.get_json()
+    assert data["match"] == "fuzzy"
+    assert [tx["description"] for tx in data["results"]] == ["Weekly groceries"]
+
+
+def test_tx_search_pagination(client, auth_user):
+    """Should walk all matches page by page using next_cursor."""
+    user, headers = auth_user
+    created = add_described(user["id"], *(f"Coffee beans {i}" for i in range(5)))
+    add_described(user["id"], "Rent")
+
+    seen = []
+    cursor = None
+    while True:
+        query = {"q": "coffee", "limit": PAGE_SIZE}
+        if cursor is not None:
+            query["cursor"] = cursor
+        response = client.get(
+            "/transactions/search", query_string=query, headers=headers
+        )
+        assert response.status_code == HTTPStatus.OK
+        data = response.get_json()
+        assert len(data["results"]) <= PAGE_SIZE
+        seen.extend(data["results"])
+        cursor = data["next_cursor"]
+        if cursor is None:
+            break
+
+    assert sorted(tx["id"] for tx in seen) == sorted(tx["id"] for tx in created)
+
+
+def test_tx_search_only_own_transactions(client, auth_user, nonexisting_user_headers):
+    """Should not return other users' transactions."""
+    user, _headers = auth_user
+    add_described(user["id"], "Weekly groceries")
+    response = client.get(
+        "/transactions/search",
+        query_string={"q": "groceries"},
+        headers=nonexisting_user_headers,
+    )
+    assert response.status_code == HTTPStatus.OK
+    assert response.get_json()["results"] == []
+
+
+def test_tx_search_missing_query(client, auth_user):
+    """Should return 400 when q is missing or blank."""
+    _user, headers = auth_user
+    for query in ({}, {"q": "   "}):
+        response = client.get(
+            "/transactions/search", query_string=query, headers=headers
+        )
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+
+
+def test_tx_search_invalid_cursor(client, auth_user):
+    """Should return 400 for a malformed cursor."""
+    _user, headers = auth_user
+    response = client.get(
+        "/transactions/search",
+        query_string={"q": "groceries", "cursor": "not-a-cursor"},
+        headers=headers,
+    )
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+
+
+@pytest.mark.parametrize(
+    "key", [("fulltext", float("inf"), 1), ("fulltext", 0.5, float("-inf"))]
+)
+def test_tx_search_out_of_range_cursor(client, auth_user, key):
+    """Should return 400 for a cursor with a non-finite rank or ID."""
+    _user, headers = auth_user
+    cursor = base64.urlsafe_b64encode(json.dumps(key).encode()).decode()
+    response = client.get(
+        "/transactions/search",
+        query_string={"q": "groceries", "cursor": cursor},
+        headers=headers,
+    )
+    assert response.status_code == HTTPStatus.BAD_REQUEST
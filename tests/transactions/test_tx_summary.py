@@ -0,0 +1,79 @@
+from http import HTTPStatus
+
+from src.repositories.transactions_repo import insert_transaction
+
+
+def _add(user_id, kind, tx_date, amount):
+    return insert_transaction(user_id, kind, tx_date, amount, f"{kind} {amount}")
+
+
+def test_tx_summary_by_month(client, auth_user):
+    """GET /transactions/summary should return per-month totals computed in SQL."""
+    user, headers = auth_user
+    _add(user["id"], "income", "2025-01-31", "1000.00")
+    _add(user["id"], "expense", "2025-01-05", "10.00")
+    _add(user["id"], "expense", "2025-01-20", "30.00")
+    _add(user["id"], "expense", "2025-02-01", "5.50")
+
+    response = client.get("/transactions/summary?group_by=month", headers=headers)
+    assert response.status_code == HTTPStatus.OK
+    data = response.get_json()
+    assert data["group_by"] == "month"
+    january, february = data["buckets"]
+
+    assert january["period"] == "2025-01-01"
+    assert january["income"] == "1000.00"
+    assert january["expense"] == "40.00"
+    assert january["net"] == "960.00"
+    assert january["count"] == 3  # noqa: PLR2004
+    assert january["income_count"] == 1
+    assert january["expense_count"] == 2  # noqa: PLR2004
+    assert january["expense_p50"] == "20.00"
+    assert january["expense_p90"] == "28.00"
+
+    assert february["period"] == "2025-02-01"
+    assert february["income"] == "0"
+    assert february["net"] == "-5.50"
+    assert february["expense_p50"] == "5.50"
+
+
+def test_tx_summary_date_range_and_year(client, auth_user):
+    """Should only aggregate transactions inside from/to, bucketed by year."""
+    user, headers = auth_user
+    _add(user["id"], "expense", "2023-12-31", "99.00")
+    _add(user["id"], "expense", "2024-06-15", "12.00")
+    _add(user["id"], "income", "2024-07-01", "20.00")
+
+    response = client.get(
+        "/transactions/summary?group_by=year&from=2024-01-01&to=2024-12-31",
+        headers=headers,
+    )
+    assert response.status_code == HTTPStatus.OK
+    (bucket,) = response.get_json()["buckets"]
+    assert bucket["period"] == "2024-01-01"
+    assert bucket["net"] == "8.00"
+
+
+def test_tx_summary_income_only_has_no_percentiles(client, auth_user):
+    """Buckets without expenses should have null expense percentiles."""
+    user, headers = auth_user
+    _add(user["id"], "income", "2025-03-03", "10.00")
+    response = client.get("/transactions/summary?group_by=day", headers=headers)
+    (bucket,) = response.get_json()["buckets"]
+    assert bucket["period"] == "2025-03-03"
+    assert bucket["expense_p50"] is None
+
+
+def test_tx_summary_empty(client, nonexisting_user_headers):
+    """Should return no buckets when the user has no transactions."""
+    response = client.get("/transactions/summary", headers=nonexisting_user_headers)
+    assert response.status_code == HTTPStatus.OK
+    assert response.get_json() == {"group_by": "month", "buckets": []}
+
+
+def test_tx_summary_invalid_query(client, auth_user):
+    """Should return 400 for an unknown group_by or an inverted date range."""
+    _user, headers = auth_user
+    for query in ("group_by=hour", "from=2025-02-01&to=2025-01-01", "from=yesterday"):
+        response = client.get(f"/transactions/summary?{query}", headers=headers)
+        assert response.status_code == HTTPStatus.BAD_REQUEST
@@ -1,5 +1,4 @@
 from http import HTTPStatus
-from unittest.mock import patch
 
 from src.repositories.users_repo import get_user_by_email
 
@@ -14,9 +13,9 @@ def test_user_delete_success(client, auth_user):
     assert not get_user_by_email(user["email"])
 
 
-def test_user_delete_user_not_found(client, auth_user):
+def test_user_delete_user_not_found(client, auth_user, patch_repo):
     """Should return 404 when user no longer exists."""
     _user, headers = auth_user
-    with patch("src.services.users_service.delete_user", return_value=None):
+    with patch_repo("src.services.users_service.delete_user", return_value=None):
         response = client.delete("/me", headers=headers)
         assert response.status_code == HTTPStatus.NOT_FOUND
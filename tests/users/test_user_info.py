@@ -1,5 +1,4 @@
 from http import HTTPStatus
-from unittest.mock import patch
 
 
 def test_user_info_success(client, auth_user):
@@ -15,9 +14,9 @@ def test_user_info_success(client, auth_user):
     assert data["email"] == user["email"]
 
 
-def test_user_info_user_not_found(client, auth_user):
+def test_user_info_user_not_found(client, auth_user, patch_repo):
     """Should return 404 when user no longer exists."""
     _user, headers = auth_user
-    with patch("src.services.users_service.get_user", return_value=None):
+    with patch_repo("src.services.users_service.get_user", return_value=None):
         response = client.get("/me", headers=headers)
         assert response.status_code == HTTPStatus.NOT_FOUND
@@ -1,5 +1,4 @@
 from http import HTTPStatus
-from unittest.mock import patch
 
 
 def test_user_update_one_field_success(client, auth_user):
@@ -41,10 +40,10 @@ def test_user_update_all_fields_success(client, auth_user, user_payload):
     assert data["password"] != user["password"]
 
 
-def test_user_update_user_not_found(client, auth_user, user_payload):
+def test_user_update_user_not_found(client, auth_user, user_payload, patch_repo):
     """Should return 404 when user no longer exists."""
     _user, headers = auth_user
-    with patch("src.services.users_service.update_user", return_value=None):
+    with patch_repo("src.services.users_service.update_user", return_value=None):
         response = client.patch("/me", json=user_payload, headers=headers)
         assert response.status_code == HTTPStatus.NOT_FOUND
 
@@ -0,0 +1,44 @@
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from flask import Flask
+
+from src.utils.json_provider import JSON_PROVIDERS
+
+PAYLOAD = {"amount": Decimal("12.50"), "transaction_date": date(2025, 3, 1)}
+
+
+@pytest.fixture(params=JSON_PROVIDERS)
+def json_app(request):
+    """Fixture: A bare app using each configurable JSON provider."""
+    json_app = Flask(__name__)
+    json_app.json = JSON_PROVIDERS[request.param](json_app)
+    return json_app
+
+
+def test_provider_encodes_decimals_and_dates(json_app):
+    """Decimals keep their scale as strings; dates are ISO 8601."""
+    assert json_app.json.loads(json_app.json.dumps(PAYLOAD)) == {
+        "amount": "12.50",
+        "transaction_date": "2025-03-01",
+    }
+
+
+def test_provider_response(json_app):
+    """response() should return the encoded JSON body."""
+    with json_app.app_context():
+        response = json_app.json.response(PAYLOAD)
+    assert response.mimetype == "application/json"
+    assert response.get_json() == {"amount": "12.50", "transaction_date": "2025-03-01"}
+
+
+def test_provider_rejects_unknown_types(json_app):
+    """Objects without a JSON form should still raise TypeError."""
+    with pytest.raises(TypeError):
+        json_app.json.dumps({"value": object()})
+
+
+def test_app_uses_orjson(app):
+    """The app should use the configured provider (orjson by default)."""
+    assert isinstance(app.json, JSON_PROVIDERS["orjson"])
@@ -1,5 +1,6 @@
+from src.config import settings
 from src.repositories.users_repo import get_user_by_email
-from src.utils.password import verify_password
+from src.utils.password import hash_password, needs_rehash, verify_password
 
 
 def test_password_is_hashed_on_registration(client, registered_user):
@@ -8,3 +9,13 @@ def test_password_is_hashed_on_registration(client, registered_user):
 
     assert user["password_hash"] != registered_user["password"]
     assert verify_password(registered_user["password"], user["password_hash"])
+
+
+def test_needs_rehash_compares_cost(monkeypatch):
+    """Only hashes made with a cost other than BCRYPT_ROUNDS need rehashing."""
+    monkeypatch.setattr(settings, "BCRYPT_ROUNDS", 4)
+    hashed = hash_password("Secret1234!")
+    assert hashed.startswith("$2b$04$")
+    assert not needs_rehash(hashed)
+    monkeypatch.setattr(settings, "BCRYPT_ROUNDS", 5)
+    assert needs_rehash(hashed)
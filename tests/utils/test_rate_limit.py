@@ -0,0 +1,115 @@
+from http import HTTPStatus
+
+import pytest
+
+from src.app import create_app
+from src.config import settings
+from src.utils import rate_limit
+from src.utils.rate_limit import MemoryBuckets, parse_limit, use_backend
+
+LOGIN_LIMIT = 3
+
+
+@pytest.fixture()
+def limits(monkeypatch):
+    """Fixture: Enables rate limiting with small limits and fresh buckets."""
+    monkeypatch.setattr(settings, "RATE_LIMIT_ENABLED", True)
+    monkeypatch.setattr(
+        settings, "RATE_LIMITS", {"auth": f"{LOGIN_LIMIT}/minute", "user": "2/hour"}
+    )
+    use_backend(lambda: MemoryBuckets(max_keys=100))
+    yield
+    use_backend(lambda: MemoryBuckets(settings.RATE_LIMIT_MAX_KEYS))
+
+
+def _login(client):
+    return client.post(
+        "/auth/login", json={"email": "nobody@example.com", "password": "whatever"}
+    )
+
+
+def test_parse_limit():
+    """Limits should parse into capacity and tokens per second."""
+    assert parse_limit("120/minute") == (120, 2)
+    for spec in ("0/minute", "ten/minute", "5/day", "5"):
+        with pytest.raises(ValueError, match="Invalid rate limit"):
+            parse_limit(spec)
+
+
+def test_bucket_refills_over_time(monkeypatch):
+    """An empty bucket should report the wait until its next token."""
+    now = 1000.0
+    monkeypatch.setattr(rate_limit.time, "monotonic", lambda: now)
+    buckets = MemoryBuckets(max_keys=10)
+
+    assert buckets.take("k", capacity=2, refill=0.5) == 0
+    assert buckets.take("k", capacity=2, refill=0.5) == 0
+    assert buckets.take("k", capacity=2, refill=0.5) == pytest.approx(2)
+
+    now += 2
+    assert buckets.take("k", capacity=2, refill=0.5) == 0
+
+
+def test_bucket_count_is_bounded():
+    """Past max_keys, the least recently used bucket should be dropped."""
+    buckets = MemoryBuckets(max_keys=2)
+    for key in ("a", "b", "a", "c"):
+        buckets.take(key, capacity=1, refill=1)
+    assert list(buckets._buckets) == ["a", "c"]
+
+
+def test_ip_limit_returns_429(client, limits):
+    """Logins past the per-IP limit should get 429 with Retry-After."""
+    for _ in range(LOGIN_LIMIT):
+        assert _login(client).status_code == HTTPStatus.UNAUTHORIZED
+
+    response = _login(client)
+
+    assert response.status_code == HTTPStatus.TOO_MANY_REQUESTS
+    assert int(response.headers["Retry-After"]) == 20  # noqa: PLR2004
+
+
+def test_ip_limit_behind_proxy(limits, monkeypatch):
+    """Behind a trusted proxy, each forwarded client IP should get its own bucket."""
+    monkeypatch.setattr(settings, "TRUSTED_PROXY_HOPS", 1)
+    client = create_app(async_views=False).test_client()
+    proxy = {"REMOTE_ADDR": "10.0.0.1"}
+
+    def login_from(address):
+        return client.post(
+            "/auth/login",
+            json={"email": "nobody@example.com", "password": "whatever"},
+            headers={"X-Forwarded-For": address},
+            environ_base=proxy,
+        )
+
+    for _ in range(LOGIN_LIMIT):
+        login_from("203.0.113.1")
+
+    assert login_from("203.0.113.1").status_code == HTTPStatus.TOO_MANY_REQUESTS
+    assert login_from("203.0.113.2").status_code == HTTPStatus.UNAUTHORIZED
+
+
+def test_limits_are_per_blueprint(client, limits, auth_user):
+    """Exhausting one blueprint's bucket should not throttle another."""
+    _user, headers = auth_user
+    for _ in range(LOGIN_LIMIT + 1):
+        _login(client)
+    assert client.get("/me", headers=headers).status_code == HTTPStatus.OK
+    assert client.get("/transactions/", headers=headers).status_code == HTTPStatus.OK
+
+
+def test_user_limit_returns_429(client, limits, auth_user):
+    """An authenticated user should be limited across client IPs."""
+    _user, headers = auth_user
+    for address in ("10.0.0.1", "10.0.0.2"):
+        response = client.get(
+            "/me", headers=headers, environ_base={"REMOTE_ADDR": address}
+        )
+        assert response.status_code == HTTPStatus.OK
+
+    response = client.get(
+        "/me", headers=headers, environ_base={"REMOTE_ADDR": "10.0.0.3"}
+    )
+    assert response.status_code == HTTPStatus.TOO_MANY_REQUESTS
+    assert int(response.headers["Retry-After"]) == 1800  # noqa: PLR2004
@@ -0,0 +1,31 @@
+from src.utils.revocation import BloomFilter
+
+CAPACITY = 10_000
+ERROR_RATE = 0.01
+
+
+def test_bloom_filter_has_no_false_negatives():
+    """Every key added should be reported as present."""
+    bloom = BloomFilter(CAPACITY, ERROR_RATE)
+    keys = [f"jti:{i}" for i in range(CAPACITY)]
+    for key in keys:
+        bloom.add(key)
+
+    assert all(key in bloom for key in keys)
+
+
+def test_bloom_filter_false_positive_rate():
+    """A full filter should report absent keys at about its error rate."""
+    bloom = BloomFilter(CAPACITY, ERROR_RATE)
+    for i in range(CAPACITY):
+        bloom.add(f"jti:{i}")
+
+    false_positives = sum(f"sub:{i}" in bloom for i in range(CAPACITY))
+
+    assert false_positives < CAPACITY * ERROR_RATE * 2
+
+
+def test_empty_bloom_filter_is_empty():
+    """Nothing should be reported in a filter nothing was added to."""
+    bloom = BloomFilter(CAPACITY, ERROR_RATE)
+    assert not any(f"jti:{i}" in bloom for i in range(1000))
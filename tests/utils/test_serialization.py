@@ -0,0 +1,64 @@
+from datetime import date
+from decimal import Decimal
+from http import HTTPStatus
+
+import pytest
+
+from src.config import settings
+from src.exceptions import AppError
+from src.schemas.auth_user_schemas import UpdateUserOut
+from src.schemas.transaction_schemas import TransactionsOut, TransactionSummaryOut
+from src.utils.serialization import dump_response
+
+TX_ROW = {
+    "id": 1,
+    "kind": "expense",
+    "transaction_date": date(2025, 3, 1),
+    "amount": Decimal("12.50"),
+    "description": "Coffee",
+}
+
+BUCKET_ROW = {
+    "period": date(2025, 3, 1),
+    "income": Decimal("0"),
+    "expense": Decimal("12.50"),
+    "net": Decimal("-12.50"),
+    "count": 1,
+    "income_count": 0,
+    "expense_count": 1,
+    "expense_p50": None,
+    "expense_p90": None,
+}
+
+
+@pytest.mark.parametrize(
+    ("schema", "data"),
+    [
+        (TransactionsOut, {"transactions": [TX_ROW], "next_cursor": None}),
+        (TransactionSummaryOut, {"group_by": "month", "buckets": [BUCKET_ROW]}),
+        (UpdateUserOut, {"username": "jake", "email": "jake@example.com"}),
+    ],
+)
+def test_trusted_output_matches_strict(schema, data, monkeypatch):
+    """Trusted rows should serialize exactly as validated ones do."""
+    trusted = dump_response(schema, data)
+    monkeypatch.setattr(settings, "STRICT_OUTPUT_VALIDATION", True)
+    assert trusted == dump_response(schema, data)
+
+
+def test_strict_output_rejects_drifted_rows(monkeypatch):
+    """Strict mode should fail on rows that do not match the schema."""
+    monkeypatch.setattr(settings, "STRICT_OUTPUT_VALIDATION", True)
+    with pytest.raises(AppError, match="Internal schema validation error"):
+        dump_response(TransactionsOut, {"transactions": [{**TX_ROW, "id": 0}]})
+
+
+def test_strict_output_responses(client, added_transaction, auth_user, monkeypatch):
+    """Responses should be the same with strict output validation enabled."""
+    _user, headers = auth_user
+    trusted = client.get("/transactions/", headers=headers).get_json()
+    monkeypatch.setattr(settings, "STRICT_OUTPUT_VALIDATION", True)
+    response = client.get("/transactions/", headers=headers)
+    assert response.status_code == HTTPStatus.OK
+    assert response.get_json() == trusted
+    assert trusted["transactions"][0]["amount"] == str(added_transaction["amount"])
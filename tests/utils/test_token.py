@@ -1,4 +1,13 @@
+import time
 from http import HTTPStatus
+from unittest.mock import patch
+
+import pytest
+
+from src.config import settings
+from src.exceptions import UnauthorizedError
+from src.utils.jwt_utils import _verified_tokens, decode_token, verify_token
+from tests.factories import make_token
 
 
 def test_jwt_required_success(client, auth_user):
@@ -51,3 +60,54 @@ def test_jwt_required_invalid_bearer(client, auth_user):
     new_headers = {"Authorization": f"Bearerrrr {token}"}
     response = client.get("/me", headers=new_headers)
     assert response.status_code == HTTPStatus.UNAUTHORIZED
+
+
+@pytest.fixture()
+def token_cache():
+    """Fixture: An empty verified-token cache, emptied again afterwards."""
+    _verified_tokens.clear()
+    yield _verified_tokens
+    _verified_tokens.clear()
+
+
+def test_verified_token_is_decoded_once(token_cache, registered_user):
+    """A reused token should only be verified on its first use."""
+    token = make_token(registered_user["id"])
+    with patch("src.utils.jwt_utils.decode_token", wraps=decode_token) as decode:
+        assert verify_token(token).sub == registered_user["id"]
+        assert verify_token(token).sub == registered_user["id"]
+    assert decode.call_count == 1
+
+
+def test_cached_token_expires(token_cache, registered_user, monkeypatch):
+    """A cached token should not be served from the cache past its exp."""
+    token = make_token(registered_user["id"])
+    verify_token(token)
+    later = time.time() + settings.JWT_EXPIRE_IN + 1
+    monkeypatch.setattr("src.utils.jwt_utils.time.time", lambda: later)
+
+    with (
+        patch(
+            "src.utils.jwt_utils.decode_token",
+            side_effect=UnauthorizedError("Expired token"),
+        ),
+        pytest.raises(UnauthorizedError, match="Expired token"),
+    ):
+        verify_token(token)
+    assert len(token_cache) == 0
+
+
+def test_token_cache_is_bounded(token_cache, monkeypatch):
+    """The least recently used tokens should be evicted past JWT_CACHE_SIZE."""
+    monkeypatch.setattr(settings, "JWT_CACHE_SIZE", 2)
+    tokens = [make_token(user_id) for user_id in (1, 2, 3)]
+    for token in tokens:
+        verify_token(token)
+    assert len(token_cache) == 2  # noqa: PLR2004
+
+
+def test_invalid_tokens_are_not_cached(client, token_cache):
+    """Rejected tokens should not be remembered."""
+    response = client.get("/me", headers={"Authorization": "Bearer not-a-token"})
+    assert response.status_code == HTTPStatus.UNAUTHORIZED
+    assert len(token_cache) == 0